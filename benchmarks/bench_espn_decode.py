@@ -0,0 +1,97 @@
+"""ESPN scoreboard benchmark: shared game-record decoder vs raw JSON traversal.
+
+Decodes a college football Saturday shaped scoreboard and reports time per
+payload plus the memory each approach keeps alive between polls: the whole
+parsed JSON before, slotted ``Game`` records now:
+
+    python benchmarks/bench_espn_decode.py --events 160 --runs 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from fixtures import espn_scoreboard  # noqa: E402
+
+from termdash.sources.espn_decode import parse_scoreboard  # noqa: E402
+
+
+def traverse_payload(content: bytes) -> dict:
+    """The pre-decoder path: keep the payload and walk it for live games."""
+    payload = json.loads(content)
+    for event in payload.get("events", []) or []:
+        competitions = event.get("competitions", []) or []
+        if not competitions:
+            continue
+        competition = competitions[0]
+        status = (competition.get("status", {}) or {}).get("type", {}) or {}
+        if status.get("state") != "in":
+            continue
+        for item in competition.get("competitors", []) or []:
+            team = item.get("team", {}) or {}
+            {"abbr": team.get("abbreviation"), "score": item.get("score", "0")}
+        situation = competition.get("situation", {}) or {}
+        (situation.get("lastPlay", {}) or {}).get("text")
+    return payload
+
+
+def decode_games(content: bytes) -> list:
+    games = parse_scoreboard(content)
+    for game in games:
+        if game.state == "in":
+            (game.away.abbr, game.away.score, game.home.abbr, game.home.score, game.last_play)
+    return games
+
+
+def measure(decode, content: bytes, runs: int) -> dict[str, float]:
+    decode(content)
+    started = time.perf_counter()
+    for _ in range(runs):
+        decode(content)
+    per_run = (time.perf_counter() - started) / runs
+
+    tracemalloc.start()
+    result = decode(content)
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return {
+        "ms_per_payload": round(per_run * 1000, 2),
+        "retained_kib": round(retained / 1024, 1),
+        "peak_kib": round(peak / 1024, 1),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=160)
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    content = espn_scoreboard(args.events)
+    results = {
+        "traverse_payload": measure(traverse_payload, content, args.runs),
+        "decode_games": measure(decode_games, content, args.runs),
+    }
+    print(
+        json.dumps(
+            {
+                "benchmark": "espn_decode",
+                "events": args.events,
+                "payload_kib": round(len(content) / 1024, 1),
+                "results": results,
+            },
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Feed parsing benchmark: feedparser vs the streaming ticker parser.
+
+Measures wall time per parse and peak traced memory on Google News shaped
+feeds, for a full parse and for an early-terminating parse that stops once
+``max_items`` headlines passed the filters:
+
+    python benchmarks/bench_feed_parse.py --entries 100 --runs 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from fixtures import google_news_feed  # noqa: E402
+
+from termdash.sources.rss_ticker import FeedParser, FeedRules  # noqa: E402
+
+
+def measure(parse, content: bytes, runs: int) -> dict[str, float]:
+    parse(content)
+    started = time.perf_counter()
+    for _ in range(runs):
+        parse(content)
+    per_parse = (time.perf_counter() - started) / runs
+
+    tracemalloc.start()
+    parse(content)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"ms_per_parse": round(per_parse * 1000, 3), "peak_kib": round(peak / 1024, 1)}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, default=100)
+    parser.add_argument("--runs", type=int, default=50)
+    parser.add_argument("--max-items", type=int, default=20)
+    args = parser.parse_args()
+
+    content = google_news_feed(args.entries)
+    rules = FeedRules(block_sources=("msnbc", "al jazeera"))
+    variants = {
+        "feedparser": FeedParser(streaming=False),
+        "stream_full": FeedParser(),
+        "stream_early_stop": FeedParser(rules=rules, limit=args.max_items),
+    }
+    results = {name: measure(parse, content, args.runs) for name, parse in variants.items()}
+    baseline = results["feedparser"]
+    for result in results.values():
+        result["speedup"] = round(baseline["ms_per_parse"] / result["ms_per_parse"], 1)
+        result["memory_ratio"] = round(result["peak_kib"] / baseline["peak_kib"], 3)
+
+    print(
+        json.dumps(
+            {
+                "benchmark": "feed_parse",
+                "entries": args.entries,
+                "feed_kib": round(len(content) / 1024, 1),
+                "results": results,
+            },
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""Ticker filter benchmark: compiled rule matcher vs linear keyword scans.
+
+Filters Google News shaped items through block, keyword and preference rules
+of growing size, comparing ``_filter_items`` over ``FeedItem`` records against the
+per-item ``any(...)`` loops over plain dicts it replaced:
+
+    python benchmarks/bench_filter.py --items 5000 --block-rules 10 100 500
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from fixtures import WORDS, google_news_feed  # noqa: E402
+
+from termdash.sources.feed_item import _domain_from_link  # noqa: E402
+from termdash.sources.rss_ticker import FeedParser, _filter_items  # noqa: E402
+
+
+def linear_filter(items: list[dict[str, str]], options: dict) -> list[dict[str, str]]:
+    """The pre-compilation algorithm, kept here as the comparison baseline."""
+
+    def normalize(value) -> list[str]:
+        return [str(item).strip().lower() for item in value or [] if str(item).strip()]
+
+    include = normalize(options.get("include_keywords"))
+    exclude = normalize(options.get("exclude_keywords"))
+    block = normalize(options.get("block_sources"))
+    prefer = normalize(options.get("prefer_sources"))
+
+    filtered = []
+    seen: set[str] = set()
+    for item in items:
+        title = item["title"].lower()
+        source = item["source"].lower()
+        domain = _domain_from_link(item["link"])
+        if include and not any(keyword in title for keyword in include):
+            continue
+        if exclude and any(keyword in title for keyword in exclude):
+            continue
+        if any(token in source or token in domain for token in block):
+            continue
+        key = title.strip()
+        if key in seen:
+            continue
+        seen.add(key)
+        filtered.append(item)
+
+    def rank(item: dict[str, str]) -> int:
+        for i, pref in enumerate(prefer):
+            if pref in item["source"].lower() or pref in item["link"].lower():
+                return i
+        return len(prefer) + 1
+
+    filtered.sort(key=rank)
+    return filtered
+
+
+def options_for(block_rules: int, seed: int = 11) -> dict:
+    rng = random.Random(seed)
+    blocked = ["msnbc", "al jazeera"] + [f"outlet{i}.example" for i in range(block_rules - 2)]
+    return {
+        "block_sources": blocked,
+        "exclude_keywords": rng.sample(WORDS, 5),
+        "include_keywords": rng.sample(WORDS, 20),
+        "prefer_sources": ["fox news", "reuters", "apnews"],
+    }
+
+
+def measure(func, items: list[dict[str, str]], options: dict, runs: int) -> float:
+    func(items, options)
+    started = time.perf_counter()
+    for _ in range(runs):
+        func(items, options)
+    return (time.perf_counter() - started) / runs * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=5000)
+    parser.add_argument("--block-rules", type=int, nargs="+", default=[10, 100, 500])
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    items = FeedParser()(google_news_feed(args.items))
+    dict_items = [item.to_dict() for item in items]
+    results = {}
+    for block_rules in args.block_rules:
+        options = options_for(block_rules)
+        expected = [item.to_dict() for item in _filter_items(items, options)]
+        assert expected == linear_filter(dict_items, options)
+        linear = measure(linear_filter, dict_items, options, args.runs)
+        compiled = measure(_filter_items, items, options, args.runs)
+        results[str(block_rules)] = {
+            "linear_ms": round(linear, 3),
+            "compiled_ms": round(compiled, 3),
+            "speedup": round(linear / compiled, 1),
+        }
+
+    print(json.dumps({"benchmark": "filter", "items": len(items), "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Near-duplicate headline benchmark: LSH index cost, memory and accuracy.
+
+Feeds a corpus of stories, each rewritten by several outlets, through
+``NearDuplicateIndex`` and reports per-item cost on a cold index and on a
+warm one (a refresh repeating the same headlines), retained memory, and how
+well the clusters match the true stories:
+
+    python benchmarks/bench_near_dup.py --stories 1000 --variants 6
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from collections import Counter
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from fixtures import near_duplicate_corpus  # noqa: E402
+
+from termdash.sources.feed_item import FeedItem  # noqa: E402
+from termdash.sources.near_dup import NearDuplicateIndex  # noqa: E402
+
+
+def accuracy(clusters: list[int], stories: list[int]) -> dict[str, float]:
+    """Pairwise precision/recall of the clustering against the true stories."""
+    same_cluster = sum(n * (n - 1) // 2 for n in Counter(clusters).values())
+    same_story = sum(n * (n - 1) // 2 for n in Counter(stories).values())
+    both = sum(n * (n - 1) // 2 for n in Counter(zip(clusters, stories)).values())
+    return {
+        "precision": round(both / same_cluster, 3) if same_cluster else 1.0,
+        "recall": round(both / same_story, 3) if same_story else 1.0,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--stories", type=int, default=1000)
+    parser.add_argument("--variants", type=int, default=6)
+    parser.add_argument("--threshold", type=float, default=0.6)
+    args = parser.parse_args()
+
+    rows = near_duplicate_corpus(args.stories, args.variants)
+    items = [FeedItem(title, source=outlet) for title, outlet, _story in rows]
+    max_entries = len(items)
+
+    index = NearDuplicateIndex(args.threshold, max_entries)
+    started = time.perf_counter()
+    clusters = [index.cluster(item) for item in items]
+    cold = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for item in items:
+        index.cluster(item)
+    warm = time.perf_counter() - started
+
+    tracemalloc.start()
+    retained_index = NearDuplicateIndex(args.threshold, max_entries)
+    for item in items:
+        retained_index.cluster(item)
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(
+        json.dumps(
+            {
+                "benchmark": "near_dup",
+                "items": len(items),
+                "bands": index.bands,
+                "rows": index.rows,
+                "cold_us_per_item": round(cold / len(items) * 1e6, 1),
+                "warm_us_per_item": round(warm / len(items) * 1e6, 2),
+                "index_kib": round(retained / 1024, 1),
+                "bytes_per_entry": round(retained / len(retained_index)),
+                "clusters": len(set(clusters)),
+                **accuracy(clusters, [story for _title, _outlet, story in rows]),
+            },
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Startup benchmark: interpreter launch and ``import termdash`` to first frame.
+
+Each sample runs in a fresh interpreter, like a new tmux pane would. Results
+are printed as JSON so they can be tracked over time:
+
+    python benchmarks/bench_startup.py -c configs/example.yaml --runs 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+CHILD = r"""
+import time
+start = time.perf_counter()
+import io, json, sys
+from pathlib import Path
+
+from rich.console import Console
+
+from termdash.config import load_config
+from termdash.dashboard import Dashboard
+from termdash.main import build_sources
+
+imported = time.perf_counter()
+config = load_config(Path(sys.argv[1]) if sys.argv[1] else None)
+config.cache.enabled = sys.argv[2] == "1"
+dashboard = Dashboard(config, build_sources(config))
+dashboard.console = Console(file=io.StringIO(), width=160, height=48, force_terminal=True)
+if config.cache.enabled:
+    from termdash.snapshot import DEFAULT_CACHE_DIR, SnapshotCache
+
+    dashboard.engine._restore_snapshots(SnapshotCache(config.cache.directory or DEFAULT_CACHE_DIR))
+dashboard.console.print(dashboard._render(dashboard.store.snapshot()))
+done = time.perf_counter()
+heavy = [name for name in ("httpx", "feedparser", "termdash.setup") if name in sys.modules]
+print(json.dumps({
+    "import_ms": (imported - start) * 1000,
+    "first_frame_ms": (done - start) * 1000,
+    "heavy_modules": heavy,
+}))
+"""
+
+
+def run_once(config: Path | None, use_cache: bool) -> dict[str, object]:
+    started = time.perf_counter()
+    output = subprocess.run(
+        [sys.executable, "-c", CHILD, str(config or ""), "1" if use_cache else "0"],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    sample = json.loads(output.strip().splitlines()[-1])
+    sample["process_ms"] = (time.perf_counter() - started) * 1000
+    return sample
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-c", "--config", type=Path, default=None)
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--no-cache", action="store_true", help="Skip the warm-start cache")
+    args = parser.parse_args()
+
+    samples = [run_once(args.config, not args.no_cache) for _ in range(args.runs)]
+    result = {
+        "benchmark": "startup",
+        "config": str(args.config or "<default>"),
+        "runs": args.runs,
+        "heavy_modules": samples[-1]["heavy_modules"],
+    }
+    for metric in ("import_ms", "first_frame_ms", "process_ms"):
+        values = [float(sample[metric]) for sample in samples]
+        result[metric] = {
+            "median": round(statistics.median(values), 2),
+            "min": round(min(values), 2),
+            "max": round(max(values), 2),
+        }
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
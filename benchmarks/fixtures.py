@@ -0,0 +1,435 @@
+"""Deterministic upstream payloads shaped like the real feeds and APIs.
+
+The generators mirror the structure, field set and sizes of responses captured
+from Google News, ESPN, Open-Meteo and Ergast, so benchmarks run offline and
+reproducibly.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from xml.sax.saxutils import escape
+
+OUTLETS = [
+    ("Associated Press", "apnews.com"),
+    ("Reuters", "www.reuters.com"),
+    ("Fox News", "www.foxnews.com"),
+    ("CNN", "www.cnn.com"),
+    ("The New York Times", "www.nytimes.com"),
+    ("The Washington Post", "www.washingtonpost.com"),
+    ("NBC News", "www.nbcnews.com"),
+    ("MSNBC", "www.msnbc.com"),
+    ("Al Jazeera", "www.aljazeera.com"),
+    ("Politico", "www.politico.com"),
+    ("The Hill", "thehill.com"),
+    ("Bloomberg", "www.bloomberg.com"),
+    ("USA Today", "www.usatoday.com"),
+    ("ESPN", "www.espn.com"),
+    ("Yahoo Sports", "sports.yahoo.com"),
+]
+
+WORDS = (
+    "senate house governor budget vote court ruling storm city council school board "
+    "election poll tariff economy jobs report inflation rate hike police fire "
+    "hospital bridge transit strike union contract lawsuit federal state county "
+    "mayor plan deal talks ceasefire summit coach trade injury playoff win loss "
+    "season record draft quarterback pitcher goalie overtime comeback rally"
+).split()
+
+
+def headline(rng: random.Random, words: int = 10) -> str:
+    text = " ".join(rng.choice(WORDS) for _ in range(words))
+    return text[:1].upper() + text[1:]
+
+
+def google_news_feed(entries: int = 100, *, seed: int = 7) -> bytes:
+    """RSS 2.0 document in the layout Google News search feeds use."""
+    rng = random.Random(seed)
+    published = datetime(2026, 10, 17, 12, 0, tzinfo=timezone.utc)
+    items = []
+    for i in range(entries):
+        outlet, domain = rng.choice(OUTLETS)
+        title = f"{headline(rng)} - {outlet}"
+        link = f"https://news.google.com/rss/articles/CBMi{rng.getrandbits(256):064x}?oc=5"
+        description = (
+            f'&lt;a href="{link}" target="_blank"&gt;{escape(title)}&lt;/a&gt;'
+            f'&amp;nbsp;&amp;nbsp;&lt;font color="#6f6f6f"&gt;{outlet}&lt;/font&gt;'
+        )
+        items.append(
+            "<item>"
+            f"<title>{escape(title)}</title>"
+            f"<link>{link}</link>"
+            f'<guid isPermaLink="false">CBMi{i:08d}{rng.getrandbits(64):016x}</guid>'
+            f"<pubDate>{format_datetime(published - timedelta(minutes=7 * i))}</pubDate>"
+            f"<description>{description}</description>"
+            f'<source url="https://{domain}">{escape(outlet)}</source>'
+            "</item>"
+        )
+    return (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<rss version="2.0" xmlns:media="http://search.yahoo.com/mrss/">'
+        "<channel><generator>NFE/5.0</generator>"
+        "<title>&quot;query&quot; - Google News</title>"
+        "<link>https://news.google.com/search?q=query</link>"
+        "<language>en-US</language>"
+        "<webMaster>news-webmaster@google.com</webMaster>"
+        "<copyright>2026 Google Inc.</copyright>"
+        f"<lastBuildDate>{format_datetime(published)}</lastBuildDate>"
+        "<description>Google News</description>"
+        + "".join(items)
+        + "</channel></rss>"
+    ).encode("utf-8")
+
+
+def near_duplicate_corpus(
+    stories: int = 500, variants: int = 6, *, seed: int = 13
+) -> list[tuple[str, str, int]]:
+    """``(title, outlet, story)`` rows: each story rewritten slightly by several outlets.
+
+    Variants swap or drop a word of the base headline and carry the outlet
+    suffix Google News appends, the way syndicated coverage of one event
+    reads across publishers. Headlines draw on a few thousand words plus
+    stopwords, closer to real news vocabulary than ``WORDS`` alone.
+    """
+    rng = random.Random(seed)
+    syllables = ["ka", "lo", "mi", "ren", "tos", "vel", "dar", "qui", "sen", "bro", "ul", "ex"]
+    coined = {"".join(rng.choice(syllables) for _ in range(rng.randint(3, 4))) for _ in range(3000)}
+    vocabulary = WORDS + sorted(coined)
+    stopwords = ["the", "to", "in", "of", "for", "on", "a", "after", "with", "as"]
+    rows = []
+    for story in range(stories):
+        base = [
+            rng.choice(stopwords) if rng.random() < 0.3 else rng.choice(vocabulary)
+            for _ in range(12)
+        ]
+        for _ in range(variants):
+            words = list(base)
+            words[rng.randrange(len(words))] = rng.choice(vocabulary)
+            if rng.random() < 0.5:
+                del words[rng.randrange(len(words))]
+            outlet, _domain = rng.choice(OUTLETS)
+            rows.append((f"{' '.join(words).capitalize()} - {outlet}", outlet, story))
+    rng.shuffle(rows)
+    return rows
+
+
+def espn_scoreboard(events: int = 160, *, live_ratio: float = 0.4, seed: int = 21) -> bytes:
+    """ESPN site API scoreboard JSON shaped like a college football Saturday.
+
+    Every event carries the venue, team branding, links, line scores, leaders,
+    odds and broadcast blocks the real payload has, which is what makes those
+    responses several megabytes even though the tiles read a handful of fields.
+    """
+    rng = random.Random(seed)
+    kickoff = datetime(2026, 10, 17, 16, 0, tzinfo=timezone.utc)
+
+    def team(index: int) -> dict:
+        abbr = "".join(rng.choice("ABCDEFGHIJKLMNOPQRSTUVWXYZ") for _ in range(rng.randint(2, 4)))
+        name = f"{headline(rng, 2)} {rng.choice(WORDS).title()}s"
+        return {
+            "id": str(index),
+            "uid": f"s:20~l:23~t:{index}",
+            "location": name.split()[0],
+            "name": name.split()[-1],
+            "abbreviation": abbr,
+            "displayName": name,
+            "shortDisplayName": name.split()[0],
+            "color": f"{rng.getrandbits(24):06x}",
+            "alternateColor": f"{rng.getrandbits(24):06x}",
+            "isActive": True,
+            "venue": {"id": str(rng.randint(1000, 9999))},
+            "links": [
+                {
+                    "rel": ["clubhouse", "desktop", "team"],
+                    "href": f"https://www.espn.com/college-football/team/_/id/{index}/{kind}",
+                    "text": kind.title(),
+                    "isExternal": False,
+                    "isPremium": False,
+                }
+                for kind in ("clubhouse", "schedule", "roster", "stats", "tickets")
+            ],
+            "logo": f"https://a.espncdn.com/i/teamlogos/ncaa/500/{index}.png",
+        }
+
+    def competitor(index: int, side: str, score: int, period: int) -> dict:
+        return {
+            "id": str(index),
+            "uid": f"s:20~l:23~t:{index}",
+            "type": "team",
+            "order": 0 if side == "home" else 1,
+            "homeAway": side,
+            "winner": False,
+            "team": team(index),
+            "score": str(score),
+            "linescores": [{"value": float(rng.randint(0, 14))} for _ in range(period)],
+            "statistics": [],
+            "curatedRank": {"current": rng.choice([99, rng.randint(1, 25)])},
+            "records": [
+                {"name": name, "abbreviation": abbr, "type": kind, "summary": "5-2"}
+                for name, abbr, kind in (
+                    ("overall", "Any", "total"),
+                    ("Home", "Home", "homerecord"),
+                    ("Road", "Road", "roadrecord"),
+                    ("vs. Conf.", "CONF", "vsconf"),
+                )
+            ],
+        }
+
+    def leader(category: str) -> dict:
+        return {
+            "name": category,
+            "displayName": category.title(),
+            "shortDisplayName": category[:4].upper(),
+            "abbreviation": category[:3].upper(),
+            "leaders": [
+                {
+                    "displayValue": f"{rng.randint(5, 30)}-{rng.randint(10, 40)}, "
+                    f"{rng.randint(50, 400)} YDS, {rng.randint(0, 4)} TD",
+                    "value": float(rng.randint(50, 400)),
+                    "athlete": {
+                        "id": str(rng.getrandbits(24)),
+                        "fullName": headline(rng, 2).title(),
+                        "displayName": headline(rng, 2).title(),
+                        "shortName": headline(rng, 2).title(),
+                        "links": [
+                            {
+                                "rel": ["playercard", "desktop", "athlete"],
+                                "href": "https://www.espn.com/",
+                            }
+                        ],
+                        "headshot": "https://a.espncdn.com/i/headshots/ncaa/players/full/1.png",
+                        "jersey": str(rng.randint(1, 99)),
+                        "position": {"abbreviation": rng.choice(["QB", "RB", "WR"])},
+                        "team": {"id": str(rng.randint(1, 400))},
+                        "active": True,
+                    },
+                    "team": {"id": str(rng.randint(1, 400))},
+                }
+            ],
+        }
+
+    items = []
+    for i in range(events):
+        event_id = 401_600_000 + i
+        start = kickoff + timedelta(minutes=30 * rng.randint(0, 20))
+        roll = rng.random()
+        state = "in" if roll < live_ratio else ("pre" if roll < live_ratio + 0.3 else "post")
+        period = {"pre": 0, "in": rng.randint(1, 4), "post": 4}[state]
+        clock = f"{rng.randint(0, 14)}:{rng.randint(0, 59):02d}"
+        detail = {"pre": f"{start:%a, %B %d}", "in": f"{clock} - {period}th", "post": "Final"}
+        home_id, away_id = 2 * i + 1, 2 * i + 2
+        competition = {
+            "id": str(event_id),
+            "uid": f"s:20~l:23~e:{event_id}~c:{event_id}",
+            "date": f"{start:%Y-%m-%dT%H:%MZ}",
+            "attendance": rng.randint(0, 110_000),
+            "type": {"id": "1", "abbreviation": "STD"},
+            "timeValid": True,
+            "neutralSite": False,
+            "conferenceCompetition": rng.random() < 0.6,
+            "playByPlayAvailable": state != "pre",
+            "recent": state == "in",
+            "venue": {
+                "id": str(rng.randint(1000, 9999)),
+                "fullName": f"{headline(rng, 2).title()} Stadium",
+                "address": {"city": rng.choice(WORDS).title(), "state": "ST", "country": "USA"},
+                "indoor": False,
+            },
+            "competitors": [
+                competitor(home_id, "home", rng.randint(0, 45) if period else 0, period),
+                competitor(away_id, "away", rng.randint(0, 45) if period else 0, period),
+            ],
+            "notes": [],
+            "status": {
+                "clock": float(rng.randint(0, 900)),
+                "displayClock": clock,
+                "period": period,
+                "type": {
+                    "id": {"pre": "1", "in": "2", "post": "3"}[state],
+                    "name": {
+                        "pre": "STATUS_SCHEDULED",
+                        "in": "STATUS_IN_PROGRESS",
+                        "post": "STATUS_FINAL",
+                    }[state],
+                    "state": state,
+                    "completed": state == "post",
+                    "description": {"pre": "Scheduled", "in": "In Progress", "post": "Final"}[
+                        state
+                    ],
+                    "detail": detail[state],
+                    "shortDetail": detail[state],
+                },
+            },
+            "broadcasts": [
+                {"market": "national", "names": [rng.choice(["ESPN", "FOX", "CBS", "ABC"])]}
+            ],
+            "leaders": [
+                leader(category) for category in ("passingYards", "rushingYards", "receivingYards")
+            ],
+            "format": {"regulation": {"periods": 4}},
+            "startDate": f"{start:%Y-%m-%dT%H:%MZ}",
+            "geoBroadcasts": [
+                {
+                    "type": {"id": "1", "shortName": "TV"},
+                    "market": {"id": "1", "type": "National"},
+                    "media": {"shortName": rng.choice(["ESPN", "FOX", "CBS", "ABC"])},
+                    "lang": "en",
+                    "region": "us",
+                }
+            ],
+            "odds": [
+                {
+                    "provider": {"id": "58", "name": "ESPN BET", "priority": 1},
+                    "details": f"{rng.choice(['HOME', 'AWAY'])} -{rng.randint(1, 21)}.5",
+                    "overUnder": float(rng.randint(40, 70)),
+                    "spread": float(rng.randint(-21, 21)),
+                }
+            ],
+        }
+        if state == "in":
+            competition["situation"] = {
+                "lastPlay": {
+                    "id": str(rng.getrandbits(40)),
+                    "type": {"id": "24", "text": "Pass Reception", "abbreviation": "REC"},
+                    "text": headline(rng, 12),
+                    "scoreValue": 0,
+                    "team": {"id": str(home_id)},
+                    "probability": {"tiePercentage": 0.0, "homeWinPercentage": rng.random()},
+                    "drive": {
+                        "description": f"{rng.randint(1, 12)} plays, {rng.randint(1, 80)} yards"
+                    },
+                    "start": {"yardLine": rng.randint(1, 99), "text": "OWN 25"},
+                    "end": {"yardLine": rng.randint(1, 99), "text": "OPP 40"},
+                    "statYardage": rng.randint(-5, 40),
+                },
+                "down": rng.randint(1, 4),
+                "yardLine": rng.randint(1, 99),
+                "distance": rng.randint(1, 15),
+                "downDistanceText": "2nd & 7 at OPP 40",
+                "shortDownDistanceText": "2nd & 7",
+                "possessionText": "OPP 40",
+                "isRedZone": False,
+                "homeTimeouts": rng.randint(0, 3),
+                "awayTimeouts": rng.randint(0, 3),
+                "possession": str(home_id),
+            }
+        items.append(
+            {
+                "id": str(event_id),
+                "uid": f"s:20~l:23~e:{event_id}",
+                "date": f"{start:%Y-%m-%dT%H:%MZ}",
+                "name": f"Team {away_id} at Team {home_id}",
+                "shortName": f"T{away_id} @ T{home_id}",
+                "season": {"year": 2026, "type": 2, "slug": "regular-season"},
+                "week": {"number": 8},
+                "competitions": [competition],
+                "links": [
+                    {
+                        "language": "en-US",
+                        "rel": ["summary", "desktop", "event"],
+                        "href": f"https://www.espn.com/college-football/game/_/gameId/{event_id}",
+                        "text": kind,
+                        "shortText": kind,
+                        "isExternal": False,
+                        "isPremium": False,
+                    }
+                    for kind in ("Gamecast", "Box Score", "Play-by-Play")
+                ],
+                "status": competition["status"],
+            }
+        )
+    payload = {
+        "leagues": [
+            {
+                "id": "23",
+                "name": "NCAA - Football",
+                "abbreviation": "NCAAF",
+                "slug": "college-football",
+            }
+        ],
+        "season": {"type": 2, "year": 2026},
+        "week": {"number": 8},
+        "events": items,
+    }
+    return json.dumps(payload).encode("utf-8")
+
+
+def open_meteo_forecast(*, seed: int = 3) -> bytes:
+    """Open-Meteo ``/v1/forecast`` response for a ``current_weather=true`` request."""
+    rng = random.Random(seed)
+    payload = {
+        "latitude": 37.763283,
+        "longitude": -122.41286,
+        "generationtime_ms": round(rng.uniform(0.02, 0.2), 6),
+        "utc_offset_seconds": -25200,
+        "timezone": "America/Los_Angeles",
+        "timezone_abbreviation": "PDT",
+        "elevation": 18.0,
+        "current_weather_units": {
+            "time": "iso8601",
+            "interval": "seconds",
+            "temperature": "°F",
+            "windspeed": "mp/h",
+            "winddirection": "°",
+            "is_day": "",
+            "weathercode": "wmo code",
+        },
+        "current_weather": {
+            "time": "2026-10-17T12:00",
+            "interval": 900,
+            "temperature": round(rng.uniform(50, 75), 1),
+            "windspeed": round(rng.uniform(0, 20), 1),
+            "winddirection": rng.randrange(360),
+            "is_day": 1,
+            "weathercode": rng.choice([0, 1, 2, 3, 45, 61]),
+        },
+    }
+    return json.dumps(payload).encode("utf-8")
+
+
+def ergast_next_race() -> bytes:
+    """Ergast ``/api/f1/current/next.json`` response with the full session schedule."""
+    race_day = datetime(2026, 10, 25, 19, 0, tzinfo=timezone.utc)
+
+    def session(days_before: int, hour: int) -> dict:
+        at = (race_day - timedelta(days=days_before)).replace(hour=hour)
+        return {"date": at.date().isoformat(), "time": at.strftime("%H:%M:%SZ")}
+
+    race = {
+        "season": "2026",
+        "round": "20",
+        "url": "https://en.wikipedia.org/wiki/2026_United_States_Grand_Prix",
+        "raceName": "United States Grand Prix",
+        "Circuit": {
+            "circuitId": "americas",
+            "url": "https://en.wikipedia.org/wiki/Circuit_of_the_Americas",
+            "circuitName": "Circuit of the Americas",
+            "Location": {
+                "lat": "30.1328",
+                "long": "-97.6411",
+                "locality": "Austin",
+                "country": "USA",
+            },
+        },
+        "date": race_day.date().isoformat(),
+        "time": race_day.strftime("%H:%M:%SZ"),
+        "FirstPractice": session(2, 17),
+        "Sprint": session(1, 18),
+        "SprintQualifying": session(2, 21),
+        "Qualifying": session(1, 22),
+    }
+    payload = {
+        "MRData": {
+            "xmlns": "http://ergast.com/mrd/1.5",
+            "series": "f1",
+            "url": "http://ergast.com/api/f1/current/next.json",
+            "limit": "30",
+            "offset": "0",
+            "total": "1",
+            "RaceTable": {"season": "2026", "round": "20", "Races": [race]},
+        }
+    }
+    return json.dumps(payload).encode("utf-8")
@@ -0,0 +1,328 @@
+"""Offline benchmark suite: source fetch+parse, ticker filtering and frame rendering.
+
+Every upstream response is a synthetic payload from ``fixtures.py`` served by an
+in-process transport, so the suite needs no network. Results are written as
+JSON; with ``--baseline`` any case slower than the baseline by more than
+``--threshold`` is reported and the run exits with status 1:
+
+    python benchmarks/suite.py --output results.json
+    python benchmarks/suite.py --baseline benchmarks/baseline.json --threshold 0.25
+    python benchmarks/suite.py --write-baseline benchmarks/baseline.json
+
+Each sample repeats a case until it runs for at least ``MIN_SAMPLE_SECONDS``
+(like ``timeit``'s autorange), so sub-millisecond cases are not at the mercy
+of timer resolution and scheduler hiccups. Timings are divided by a fixed
+pure-Python calibration loop before comparing, so a baseline recorded on one
+machine stays roughly usable on another. The suite re-runs itself with a
+fixed ``PYTHONHASHSEED`` so hash-dependent work is identical between runs.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import io
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Awaitable, Callable
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import httpx  # noqa: E402
+from bench_filter import options_for  # noqa: E402
+from fixtures import (  # noqa: E402
+    ergast_next_race,
+    espn_scoreboard,
+    google_news_feed,
+    headline,
+    open_meteo_forecast,
+)
+from rich.console import Console  # noqa: E402
+
+from termdash.config import CacheConfig, DashboardConfig, HttpConfig  # noqa: E402
+from termdash.dashboard import Dashboard  # noqa: E402
+from termdash.net.pool import HttpPool  # noqa: E402
+from termdash.sources.base import DataPoint, DataSource, Row  # noqa: E402
+from termdash.sources.espn_scores import EspnScoresSource  # noqa: E402
+from termdash.sources.f1_ergast import F1ErgastSource  # noqa: E402
+from termdash.sources.near_dup import NearDuplicateIndex  # noqa: E402
+from termdash.sources.open_meteo import OpenMeteoSource  # noqa: E402
+from termdash.sources.rss_ticker import FeedParser, RssTickerSource, _filter_items  # noqa: E402
+
+SUITE_VERSION = 1
+DEFAULT_THRESHOLD = 0.25
+MIN_SAMPLE_SECONDS = 0.05
+TILE_COUNTS = (10, 50, 200)
+FEED_URL = "https://news.google.com/rss/search?q=query"
+
+
+class Case:
+    """One benchmark: at least ``number`` calls of ``op`` per sample, fastest sample wins.
+
+    As with ``timeit``, the minimum is reported: slower samples measure other
+    load on the machine rather than the code.
+    """
+
+    def __init__(
+        self, name: str, op: Callable[[], Any], *, number: int = 1, is_async: bool = False
+    ) -> None:
+        self.name = name
+        self.op = op
+        self.number = number
+        self.is_async = is_async
+
+
+def calibrate(repeat: int) -> float:
+    """Fastest run of a fixed CPU-bound loop; the minimum is the least noisy estimate."""
+    samples = []
+    for _ in range(max(5, repeat * 2)):
+        started = time.perf_counter()
+        sum(i * i for i in range(200_000))
+        samples.append((time.perf_counter() - started) * 1000)
+    return min(samples)
+
+
+def _best_ms(op: Callable[[], Any], number: int, repeat: int) -> float:
+    op()
+    samples = []
+    # Like timeit: collections triggered by earlier cases' garbage are noise.
+    gc.collect()
+    gc.disable()
+    try:
+        while True:
+            started = time.perf_counter()
+            for _ in range(number):
+                op()
+            if time.perf_counter() - started >= MIN_SAMPLE_SECONDS:
+                break
+            number *= 2
+        for _ in range(repeat):
+            started = time.perf_counter()
+            for _ in range(number):
+                op()
+            samples.append((time.perf_counter() - started) / number * 1000)
+    finally:
+        gc.enable()
+    return min(samples)
+
+
+async def _best_ms_async(op: Callable[[], Awaitable[Any]], number: int, repeat: int) -> float:
+    await op()
+    samples = []
+    gc.collect()
+    gc.disable()
+    try:
+        while True:
+            started = time.perf_counter()
+            for _ in range(number):
+                await op()
+            if time.perf_counter() - started >= MIN_SAMPLE_SECONDS:
+                break
+            number *= 2
+        for _ in range(repeat):
+            started = time.perf_counter()
+            for _ in range(number):
+                await op()
+            samples.append((time.perf_counter() - started) / number * 1000)
+    finally:
+        gc.enable()
+    return min(samples)
+
+
+def upstream_transport() -> httpx.MockTransport:
+    bodies = {
+        "api.open-meteo.com": (open_meteo_forecast(), "application/json"),
+        "ergast.com": (ergast_next_race(), "application/json"),
+        "site.web.api.espn.com": (espn_scoreboard(160), "application/json"),
+        "news.google.com": (google_news_feed(100), "application/rss+xml"),
+    }
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        content, content_type = bodies[request.url.host]
+        return httpx.Response(200, content=content, headers={"content-type": content_type})
+
+    return httpx.MockTransport(handler)
+
+
+def source_cases(pool: HttpPool) -> list[Case]:
+    sources: list[DataSource] = [
+        OpenMeteoSource("open_meteo", 300, {"latitude": 37.77, "longitude": -122.42}),
+        F1ErgastSource("f1_ergast", 3600, {}),
+        EspnScoresSource(
+            "espn_scores",
+            60,
+            {
+                "leagues": [{"label": "NCAAF", "sport": "football", "league": "college-football"}],
+                "live_refresh_seconds": 0,
+            },
+        ),
+        RssTickerSource(
+            "rss_ticker",
+            10,
+            {"url": FEED_URL, "lines": 3, "max_items": 50, "feed_refresh_seconds": 0},
+        ),
+    ]
+    cases = []
+    for source in sources:
+        source.pool = pool
+        cases.append(Case(f"fetch.{source.name}", source.fetch, number=10, is_async=True))
+    return cases
+
+
+def filter_cases() -> list[Case]:
+    items = FeedParser()(google_news_feed(5000))
+    options = options_for(100)
+    dedupe_options = {"near_duplicates": True}
+    return [
+        Case("filter_items.rules.5000", lambda: _filter_items(items, options), number=5),
+        Case(
+            "filter_items.near_dup.5000",
+            lambda: _filter_items(
+                items, dedupe_options, NearDuplicateIndex.from_options(dedupe_options)
+            ),
+        ),
+    ]
+
+
+def render_cases() -> list[Case]:
+    cases = []
+    for tiles in TILE_COUNTS:
+        dashboard, publish = _render_fixture(tiles)
+        output = dashboard.console.file
+
+        def frame(dashboard=dashboard, output=output) -> None:
+            output.seek(0)
+            output.truncate()
+            dashboard.console.print(dashboard._render(dashboard.store.snapshot()))
+
+        def all_changed(publish=publish, frame=frame) -> None:
+            publish(None)
+            frame()
+
+        def one_changed(publish=publish, frame=frame) -> None:
+            publish(0)
+            frame()
+
+        cases.append(Case(f"render.{tiles}_tiles.all_changed", all_changed))
+        cases.append(Case(f"render.{tiles}_tiles.one_changed", one_changed, number=3))
+    return cases
+
+
+def _render_fixture(tiles: int) -> tuple[Dashboard, Callable[[int | None], None]]:
+    rng = random.Random(tiles)
+    names = [f"Tile {i}" for i in range(tiles)]
+    config = DashboardConfig(cache=CacheConfig(enabled=False))
+    dashboard = Dashboard(config, [DataSource(name, 60, {}) for name in names])
+    dashboard.console = Console(
+        file=io.StringIO(), width=240, height=80, force_terminal=True, color_system="truecolor"
+    )
+    lines = [[headline(rng, 8) for _ in range(6)] for _ in names]
+    counter = 0
+
+    def publish(index: int | None) -> None:
+        # A new first row each call, so the tile really has to be rebuilt.
+        nonlocal counter
+        counter += 1
+        for i in range(tiles) if index is None else (index,):
+            rows = [Row(f"{counter} {lines[i][0]}", key="0")]
+            rows.extend(Row(text, key=str(n)) for n, text in enumerate(lines[i][1:], 1))
+            dashboard.store.publish(names[i], DataPoint.from_rows(names[i], rows))
+
+    publish(None)
+    return dashboard, publish
+
+
+async def run_cases(repeat: int, selected: Callable[[str], bool]) -> dict[str, float]:
+    results: dict[str, float] = {}
+    config = HttpConfig(validation_cache=False, coalesce_ttl=-1, prewarm=False)
+    async with HttpPool(config) as pool:
+        # Serve fixtures in-process; every fetch still runs the pool, parse and source code.
+        pool._client = httpx.AsyncClient(transport=upstream_transport())
+        for case in source_cases(pool) + filter_cases() + render_cases():
+            if not selected(case.name):
+                continue
+            if case.is_async:
+                results[case.name] = await _best_ms_async(case.op, case.number, repeat)
+            else:
+                results[case.name] = _best_ms(case.op, case.number, repeat)
+            print(f"{case.name}: {results[case.name]:.3f} ms", file=sys.stderr)
+    return results
+
+
+def compare(current: dict[str, Any], baseline: dict[str, Any], threshold: float) -> list[str]:
+    """Names and slowdowns of cases more than ``threshold`` slower than the baseline."""
+    regressions = []
+    for name, base in baseline["results"].items():
+        result = current["results"].get(name)
+        if result is None:
+            continue
+        ratio = result["relative"] / base["relative"]
+        if ratio > 1 + threshold:
+            regressions.append(f"{name}: {base['ms']:.3f} -> {result['ms']:.3f} ms ({ratio:.2f}x)")
+    return regressions
+
+
+def main() -> int:
+    if os.environ.get("PYTHONHASHSEED") != "0":
+        # MinHash permutations come from str hashes, so with per-process hash
+        # randomization near-duplicate filtering does different work each run.
+        env = {**os.environ, "PYTHONHASHSEED": "0"}
+        return subprocess.call([sys.executable, *sys.argv], env=env)
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=7, help="samples per case (fastest kept)")
+    parser.add_argument("-k", "--filter", default="", help="only cases whose name contains this")
+    parser.add_argument("--output", type=Path, default=None, help="write results JSON here")
+    parser.add_argument("--baseline", type=Path, default=None, help="fail on regressions")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument("--write-baseline", type=Path, default=None)
+    args = parser.parse_args()
+
+    calibration = calibrate(args.repeat)
+    timings = asyncio.run(run_cases(args.repeat, lambda name: args.filter in name))
+    # Calibrate again afterwards so a slow start (CPU boost, page cache) is not the reference.
+    calibration = min(calibration, calibrate(args.repeat))
+    current = {
+        "suite": "termdash",
+        "version": SUITE_VERSION,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "calibration_ms": round(calibration, 3),
+        "results": {
+            name: {"ms": round(ms, 4), "relative": round(ms / calibration, 6)}
+            for name, ms in timings.items()
+        },
+    }
+
+    text = json.dumps(current, indent=2)
+    if args.output is not None:
+        args.output.write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+    if args.write_baseline is not None:
+        args.write_baseline.write_text(text + "\n", encoding="utf-8")
+
+    if args.baseline is None:
+        return 0
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    if baseline.get("version") != SUITE_VERSION:
+        print(
+            f"baseline is suite version {baseline.get('version')}, not {SUITE_VERSION}",
+            file=sys.stderr,
+        )
+        return 1
+    regressions = compare(current, baseline, args.threshold)
+    for line in regressions:
+        print(f"REGRESSION {line}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -16,11 +16,63 @@ class SourceConfig:
     options: dict[str, Any] = field(default_factory=dict)
 
 
+@dataclass
+class HttpConfig:
+    timeout: float = 10.0
+    max_connections: int = 50
+    max_connections_per_host: int = 6
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 120.0
+    http2: bool = False
+    prewarm: bool = True
+    validation_cache: bool = True
+    validation_cache_entries: int = 256
+    coalesce_ttl: float = 5.0
+    breaker_failures: int = 3
+    breaker_base_delay: float = 5.0
+    breaker_max_delay: float = 900.0
+
+
+@dataclass
+class SchedulerConfig:
+    max_in_flight: int = 8
+    max_per_host: int = 4
+    startup_spread_seconds: float = 2.0
+    jitter: float = 0.1
+    max_jitter_seconds: float = 5.0
+
+
+@dataclass
+class ExecutorConfig:
+    kind: str = "thread"
+    workers: int = 2
+    max_pending: int = 32
+
+
+@dataclass
+class CacheConfig:
+    enabled: bool = True
+    directory: Path | None = None
+    flush_seconds: float = 5.0
+
+
+@dataclass
+class MetricsConfig:
+    textfile: Path | None = None
+    flush_seconds: float = 15.0
+
+
 @dataclass
 class DashboardConfig:
     title: str = "Term Dashboard"
     refresh_ui_seconds: float = 2.0
+    highlight_seconds: float = 8.0
     sources: list[SourceConfig] = field(default_factory=list)
+    http: HttpConfig = field(default_factory=HttpConfig)
+    scheduler: SchedulerConfig = field(default_factory=SchedulerConfig)
+    cache: CacheConfig = field(default_factory=CacheConfig)
+    executor: ExecutorConfig = field(default_factory=ExecutorConfig)
+    metrics: MetricsConfig = field(default_factory=MetricsConfig)
 
 
 def default_config() -> DashboardConfig:
@@ -73,7 +125,82 @@ def load_config(path: Path | None) -> DashboardConfig:
     return DashboardConfig(
         title=dashboard.get("title", "Term Dashboard"),
         refresh_ui_seconds=float(dashboard.get("refresh_ui_seconds", 2.0)),
+        highlight_seconds=float(dashboard.get("highlight_seconds", 8.0)),
         sources=sources,
+        http=_load_http(data.get("http", {}) or {}),
+        scheduler=_load_scheduler(data.get("scheduler", {}) or {}),
+        cache=_load_cache(data.get("cache", {}) or {}),
+        executor=_load_executor(data.get("executor", {}) or {}),
+        metrics=_load_metrics(data.get("metrics", {}) or {}),
+    )
+
+
+def _load_http(data: dict[str, Any]) -> HttpConfig:
+    defaults = HttpConfig()
+    return HttpConfig(
+        timeout=float(data.get("timeout", defaults.timeout)),
+        max_connections=int(data.get("max_connections", defaults.max_connections)),
+        max_connections_per_host=int(
+            data.get("max_connections_per_host", defaults.max_connections_per_host)
+        ),
+        max_keepalive_connections=int(
+            data.get("max_keepalive_connections", defaults.max_keepalive_connections)
+        ),
+        keepalive_expiry=float(data.get("keepalive_expiry", defaults.keepalive_expiry)),
+        http2=bool(data.get("http2", defaults.http2)),
+        prewarm=bool(data.get("prewarm", defaults.prewarm)),
+        validation_cache=bool(data.get("validation_cache", defaults.validation_cache)),
+        validation_cache_entries=int(
+            data.get("validation_cache_entries", defaults.validation_cache_entries)
+        ),
+        coalesce_ttl=float(data.get("coalesce_ttl", defaults.coalesce_ttl)),
+        breaker_failures=int(data.get("breaker_failures", defaults.breaker_failures)),
+        breaker_base_delay=float(data.get("breaker_base_delay", defaults.breaker_base_delay)),
+        breaker_max_delay=float(data.get("breaker_max_delay", defaults.breaker_max_delay)),
+    )
+
+
+def _load_scheduler(data: dict[str, Any]) -> SchedulerConfig:
+    defaults = SchedulerConfig()
+    return SchedulerConfig(
+        max_in_flight=int(data.get("max_in_flight", defaults.max_in_flight)),
+        max_per_host=int(data.get("max_per_host", defaults.max_per_host)),
+        startup_spread_seconds=float(
+            data.get("startup_spread_seconds", defaults.startup_spread_seconds)
+        ),
+        jitter=float(data.get("jitter", defaults.jitter)),
+        max_jitter_seconds=float(data.get("max_jitter_seconds", defaults.max_jitter_seconds)),
+    )
+
+
+def _load_cache(data: dict[str, Any]) -> CacheConfig:
+    defaults = CacheConfig()
+    directory = data.get("directory")
+    return CacheConfig(
+        enabled=bool(data.get("enabled", defaults.enabled)),
+        directory=Path(directory).expanduser() if directory else None,
+        flush_seconds=float(data.get("flush_seconds", defaults.flush_seconds)),
+    )
+
+
+def _load_executor(data: dict[str, Any]) -> ExecutorConfig:
+    defaults = ExecutorConfig()
+    kind = str(data.get("kind", defaults.kind)).lower()
+    if kind not in {"thread", "process", "inline"}:
+        raise ValueError(f"Unknown executor kind: {kind}")
+    return ExecutorConfig(
+        kind=kind,
+        workers=int(data.get("workers", defaults.workers)),
+        max_pending=int(data.get("max_pending", defaults.max_pending)),
+    )
+
+
+def _load_metrics(data: dict[str, Any]) -> MetricsConfig:
+    defaults = MetricsConfig()
+    textfile = data.get("textfile")
+    return MetricsConfig(
+        textfile=Path(textfile).expanduser() if textfile else None,
+        flush_seconds=float(data.get("flush_seconds", defaults.flush_seconds)),
     )
 
 
@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import socket
+from dataclasses import replace
+from pathlib import Path
+from typing import Iterable, Mapping
+
+from termdash.config import DashboardConfig
+from termdash.engine import PollingEngine
+from termdash.headless import encode
+from termdash.snapshot import DEFAULT_CACHE_DIR
+from termdash.sources.base import DataPoint, DataSource
+from termdash.state import StateStore
+
+DEFAULT_SOCKET_PATH = DEFAULT_CACHE_DIR.parent / "termdash.sock"
+# A client that falls this far behind is dropped; it reconnects and gets a
+# fresh snapshot instead of an ever-growing backlog.
+MAX_CLIENT_BUFFER = 1 << 20
+MAX_LINE_BYTES = 1 << 22
+RECONNECT_MIN_SECONDS = 0.5
+RECONNECT_MAX_SECONDS = 10.0
+
+
+class DaemonRunningError(RuntimeError):
+    """Another daemon is already serving the socket path."""
+
+
+class DaemonServer:
+    """Owns the sources and poll loop and serves their state over a Unix socket.
+
+    Every client first receives the current DataPoint of each source, then one
+    JSON line per change (the headless format). Each change is encoded once and
+    the same bytes are written to every client, so fetching, parsing and
+    encoding cost the same however many dashboards are attached.
+    """
+
+    def __init__(
+        self,
+        config: DashboardConfig,
+        sources: Iterable[DataSource],
+        path: Path = DEFAULT_SOCKET_PATH,
+    ) -> None:
+        self.engine = PollingEngine(config, sources)
+        self.store = self.engine.store
+        self.path = path
+        self._clients: set[asyncio.StreamWriter] = set()
+        self._encoded: dict[str, tuple[DataPoint, bytes]] = {}
+
+    async def run(self) -> None:
+        await self.engine.run(self._serve)
+
+    async def _serve(self) -> None:
+        await _claim_socket(self.path)
+        server = await asyncio.start_unix_server(self._accept, sock=_bind_private(self.path))
+        try:
+            async with server:
+                await self._broadcast()
+        finally:
+            for writer in self._clients:
+                writer.close()
+            self.path.unlink(missing_ok=True)
+
+    async def _accept(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        snapshot = self.store.snapshot()
+        writer.write(b"".join(self._line(name, data) for name, data in _loaded(snapshot)))
+        self._clients.add(writer)
+        try:
+            # Clients never send anything; EOF means they detached.
+            await reader.read()
+        except ConnectionError:
+            pass
+        finally:
+            self._clients.discard(writer)
+            writer.close()
+
+    async def _broadcast(self) -> None:
+        version = self.store.version
+        sent = dict(self.store.snapshot())
+        while True:
+            if not await self.store.wait(version):
+                continue
+            version = self.store.version
+            snapshot = self.store.snapshot()
+            payload = b"".join(
+                self._line(name, data)
+                for name, data in _loaded(snapshot)
+                if sent.get(name) is not data
+            )
+            sent = dict(snapshot)
+            if not payload:
+                continue
+            for writer in list(self._clients):
+                if writer.transport.get_write_buffer_size() > MAX_CLIENT_BUFFER:
+                    self._clients.discard(writer)
+                    writer.close()
+                else:
+                    writer.write(payload)
+
+    def _line(self, name: str, data: DataPoint) -> bytes:
+        cached = self._encoded.get(name)
+        if cached is None or cached[0] is not data:
+            cached = self._encoded[name] = (data, f"{encode(name, data)}\n".encode("utf-8"))
+        return cached[1]
+
+
+async def subscribe(path: Path, store: StateStore) -> None:
+    """Mirror a daemon's state into ``store``, reconnecting until cancelled.
+
+    While the daemon is unreachable the last received data stays on screen,
+    marked stale.
+    """
+    delay = RECONNECT_MIN_SECONDS
+    while True:
+        try:
+            reader, writer = await asyncio.open_unix_connection(str(path), limit=MAX_LINE_BYTES)
+        except OSError:
+            await asyncio.sleep(delay)
+            delay = min(RECONNECT_MAX_SECONDS, delay * 2)
+            continue
+
+        delay = RECONNECT_MIN_SECONDS
+        try:
+            async for line in reader:
+                name, data = decode(line)
+                if name:
+                    store.publish(name, data)
+        except (ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+        _mark_stale(store)
+        await asyncio.sleep(delay)
+
+
+def decode(line: bytes) -> tuple[str, DataPoint]:
+    record = json.loads(line)
+    if not isinstance(record, dict):
+        raise ValueError("daemon sent a non-object line")
+    return str(record.get("source", "")), DataPoint.from_dict(record)
+
+
+def _loaded(snapshot: Mapping[str, DataPoint]) -> Iterable[tuple[str, DataPoint]]:
+    return ((name, data) for name, data in snapshot.items() if data.status != "loading")
+
+
+def _mark_stale(store: StateStore) -> None:
+    for name, data in store.snapshot().items():
+        if data.status != "loading" and not data.stale:
+            store.publish(name, replace(data, stale=True))
+
+
+def _bind_private(path: Path) -> socket.socket:
+    """Bind a Unix socket that is owner-only (0600) from the moment it exists."""
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    # The umask is process-wide, so it is restored right after the synchronous bind.
+    previous = os.umask(0o177)
+    try:
+        sock.bind(str(path))
+    except OSError:
+        sock.close()
+        raise
+    finally:
+        os.umask(previous)
+    return sock
+
+
+async def _claim_socket(path: Path) -> None:
+    """Remove a socket left by a daemon that died; refuse if one is still serving."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if not path.exists():
+        return
+    try:
+        _, writer = await asyncio.open_unix_connection(str(path))
+    except OSError:
+        path.unlink(missing_ok=True)
+        return
+    writer.close()
+    raise DaemonRunningError(f"a termdash daemon is already serving {path}")
@@ -1,19 +1,22 @@
 ﻿from __future__ import annotations
 
 import asyncio
+import signal
+import time
 from dataclasses import dataclass
-from typing import Iterable
+from pathlib import Path
+from typing import Iterable, Mapping
 
 from rich.align import Align
-from rich.columns import Columns
-from rich.console import Console, Group
+from rich.console import Console, ConsoleOptions, Group, RenderResult
 from rich.live import Live
 from rich.panel import Panel
+from rich.segment import Segment
 from rich.text import Text
 
 from termdash.config import DashboardConfig
-from termdash.sources.base import DataPoint, DataSource
-from termdash.sources.rss_ticker import RssTickerSource
+from termdash.engine import PollingEngine
+from termdash.sources.base import DataPoint, DataSource, Row, now_utc
 
 STATUS_STYLES = {
     "ok": "green",
@@ -22,6 +25,14 @@ STATUS_STYLES = {
     "loading": "cyan",
 }
 
+# Change kinds whose lines are highlighted for ``highlight_seconds``.
+HIGHLIGHT_KINDS = frozenset({"score"})
+HIGHLIGHT_STYLE = "bold reverse"
+
+TILE_MIN_WIDTH = 36
+# Panel border plus one column of padding on each side.
+TILE_CHROME_WIDTH = 4
+
 
 @dataclass
 class TileState:
@@ -29,84 +40,245 @@ class TileState:
     data: DataPoint
 
 
+@dataclass
+class RenderedTile:
+    data: DataPoint
+    width: int
+    highlighted: bool
+    panel: Panel
+    lines: list[list[Segment]]
+
+
+class Frame:
+    """Pre-rendered screen lines; drawing it only writes out cached segments."""
+
+    def __init__(self, lines: list[list[Segment]]) -> None:
+        self.lines = lines
+
+    def __rich_console__(self, console: Console, options: ConsoleOptions) -> RenderResult:
+        newline = Segment.line()
+        for line in self.lines:
+            yield from line
+            yield newline
+
+
 class Dashboard:
     def __init__(self, config: DashboardConfig, sources: Iterable[DataSource]) -> None:
         self.config = config
         self.console = Console()
-        self.sources = list(sources)
-        self._lock = asyncio.Lock()
-        self._state: dict[str, DataPoint] = {
-            source.name: DataPoint(title=source.name, value="Loading...", status="loading")
-            for source in self.sources
-        }
+        self.engine = PollingEngine(config, sources)
+        self.sources = self.engine.sources
+        self.store = self.engine.store
+        self._tile_cache: dict[str, RenderedTile] = {}
+        # Per tile, the fitted Text of each row shown last frame, keyed by the row
+        # and everything else that shapes it.
+        self._row_cache: dict[str, dict[tuple[Row, int, str, bool], Text]] = {}
+        self._header_cache: tuple[int, list[list[Segment]]] | None = None
+        # Monotonic time the earliest visible highlight ends, if any.
+        self._highlight_expiry: float | None = None
 
     async def run(self) -> None:
-        tasks = [asyncio.create_task(self._poll_source(source)) for source in self.sources]
+        await self.engine.run(self._run_live)
 
+    async def attach(self, path: Path) -> None:
+        """Client mode: draw the state served by a daemon instead of polling."""
+        from termdash.daemon import subscribe
+
+        task = asyncio.create_task(subscribe(path, self.store))
+        try:
+            await self._run_live()
+        finally:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    async def _run_live(self) -> None:
+        resize_signal = self._watch_resize()
         try:
             with Live(
-                self._render(self._state),
-                refresh_per_second=4,
+                self._render(self.store.snapshot()),
+                auto_refresh=False,
                 screen=True,
                 console=self.console,
             ) as live:
-                while True:
-                    await asyncio.sleep(self.config.refresh_ui_seconds)
-                    snapshot = await self._snapshot()
-                    live.update(self._render(snapshot))
+                await self._render_loop(live)
         except KeyboardInterrupt:
             pass
         finally:
-            for task in tasks:
-                task.cancel()
-            await asyncio.gather(*tasks, return_exceptions=True)
-
-    async def _snapshot(self) -> dict[str, DataPoint]:
-        async with self._lock:
-            return dict(self._state)
+            if resize_signal is not None:
+                asyncio.get_running_loop().remove_signal_handler(resize_signal)
 
-    async def _poll_source(self, source: DataSource) -> None:
+    async def _render_loop(self, live: Live) -> None:
+        # Redraw only when a source published new content or the terminal was
+        # resized. refresh_ui_seconds bounds how long a resize can go unnoticed
+        # on platforms without SIGWINCH. A highlight ending also forces a redraw.
+        version = self.store.version
+        size = self.console.size
         while True:
-            try:
-                data = await source.fetch()
-            except Exception as exc:  # noqa: BLE001
-                data = DataPoint(title=source.name, value=str(exc), status="error")
-
-            async with self._lock:
-                self._state[source.name] = data
+            timeout = self.config.refresh_ui_seconds
+            if self._highlight_expiry is not None:
+                timeout = min(timeout, max(0.0, self._highlight_expiry - time.monotonic()))
+            changed = await self.store.wait(version, timeout)
+            current_size = self.console.size
+            expired = (
+                self._highlight_expiry is not None and time.monotonic() >= self._highlight_expiry
+            )
+            if not changed and current_size == size and not expired:
+                continue
+            version = self.store.version
+            size = current_size
+            start = time.perf_counter()
+            live.update(self._render(self.store.snapshot()), refresh=True)
+            self.engine.metrics.record_frame(time.perf_counter() - start)
 
-            await asyncio.sleep(source.refresh_seconds)
+    def _watch_resize(self) -> signal.Signals | None:
+        resize_signal = getattr(signal, "SIGWINCH", None)
+        if resize_signal is None:
+            return None
+        try:
+            asyncio.get_running_loop().add_signal_handler(resize_signal, self.store.wake)
+        except (NotImplementedError, RuntimeError):
+            return None
+        return resize_signal
 
-    def _render(self, snapshot: dict[str, DataPoint]):
+    def _render(self, snapshot: Mapping[str, DataPoint]) -> Frame:
+        # Every tile is rendered to segments once per change and the frame is
+        # stitched from those lines, so Rich never re-lays out unchanged panels
+        # and a frame costs about as much as the tiles that changed.
         self._apply_auto_lines()
-        header = Panel(
-            Align.center(Text(self.config.title, style="bold white"), vertical="middle"),
-            style="bold blue",
-        )
+        width = self.console.size.width
+        columns = _column_count(width, len(self.sources))
+        tile_width = max(TILE_CHROME_WIDTH + 1, width // columns)
+        self._highlight_expiry = None
 
-        panels = []
+        tiles: list[RenderedTile] = []
         for source in self.sources:
-            data = snapshot.get(
-                source.name,
-                DataPoint(title=source.name, value="Loading...", status="loading"),
+            data = snapshot.get(source.name)
+            if data is None:
+                data = DataPoint(title=source.name, value="Loading...", status="loading")
+            tiles.append(self._cached_tile(source.name, data, tile_width))
+
+        lines = list(self._render_header(width))
+        spare = width - columns * tile_width
+        gap = [Segment(" " * spare)] if spare > 0 else []
+        blank = [Segment(" " * tile_width)]
+        for start in range(0, len(tiles), columns):
+            row = tiles[start : start + columns]
+            height = max(len(tile.lines) for tile in row)
+            filler = [blank] * (columns - len(row))
+            for index in range(height):
+                line: list[Segment] = []
+                for tile in row:
+                    line.extend(tile.lines[index] if index < len(tile.lines) else blank)
+                for segments in filler:
+                    line.extend(segments)
+                line.extend(gap)
+                lines.append(line)
+        return Frame(lines)
+
+    def _render_header(self, width: int) -> list[list[Segment]]:
+        if self._header_cache is None or self._header_cache[0] != width:
+            header = Panel(
+                Align.center(Text(self.config.title, style="bold white"), vertical="middle"),
+                style="bold blue",
             )
-            panels.append(self._render_tile(data))
+            self._header_cache = (width, self._render_lines(header, width))
+        return self._header_cache[1]
+
+    def _render_lines(self, renderable: Panel, width: int) -> list[list[Segment]]:
+        options = self.console.options.update(width=width, height=None)
+        return self.console.render_lines(renderable, options, pad=True)
+
+    def _cached_tile(self, name: str, data: DataPoint, width: int) -> RenderedTile:
+        # The store only swaps in a new DataPoint when content changed, so object
+        # identity plus tile width and highlight state is a complete cache key.
+        highlights = self._highlights(data)
+        highlighted = bool(highlights)
+        cached = self._tile_cache.get(name)
+        if (
+            cached is not None
+            and cached.data is data
+            and cached.width == width
+            and cached.highlighted == highlighted
+        ):
+            return cached
+        panel = self._render_tile(data, width, highlights, name)
+        tile = self._tile_cache[name] = RenderedTile(
+            data=data,
+            width=width,
+            highlighted=highlighted,
+            panel=panel,
+            lines=self._render_lines(panel, width),
+        )
+        return tile
 
-        grid = Columns(panels, equal=True, expand=True)
-        return Align.center(Group(header, grid), vertical="top")
+    def _highlights(self, data: DataPoint) -> frozenset[str]:
+        """Row keys and lines of ``data`` still inside their highlight window."""
+        if not data.changes or self.config.highlight_seconds <= 0:
+            return frozenset()
+        remaining = self.config.highlight_seconds - (now_utc() - data.updated_at).total_seconds()
+        if remaining <= 0:
+            return frozenset()
+        lines = frozenset(
+            value
+            for change in data.changes
+            if change.kind in HIGHLIGHT_KINDS
+            for value in (change.key, change.line)
+            if value
+        )
+        if lines:
+            expiry = time.monotonic() + remaining
+            if self._highlight_expiry is None or expiry < self._highlight_expiry:
+                self._highlight_expiry = expiry
+        return lines
 
-    def _render_tile(self, data: DataPoint) -> Panel:
+    def _render_tile(
+        self,
+        data: DataPoint,
+        width: int,
+        highlights: frozenset[str] = frozenset(),
+        name: str = "",
+    ) -> Panel:
         style = STATUS_STYLES.get(data.status, "white")
-        body = Text(data.value, style=style)
+        text_width = max(1, width - TILE_CHROME_WIDTH)
+        rows = _limit_rows(data.lines(), self._max_rows(name))
+        lines = self._fit_rows(name, rows, text_width, style, highlights)
         if data.detail:
-            body.append("\n")
-            body.append(data.detail, style="dim")
-        return Panel(body, title=data.title, border_style=style)
+            lines.extend(_fit_lines(data.detail, text_width, "dim"))
+        body = Group(*lines)
+        title = data.title
+        if data.stale:
+            title = f"{title} (cached {data.updated_at.astimezone():%H:%M})"
+        return Panel(body, title=title, border_style=style, width=width)
+
+    def _fit_rows(
+        self, name: str, rows: Iterable[Row], width: int, style: str, highlights: frozenset[str]
+    ) -> list[Text]:
+        # Rows that look the same as last frame reuse their Text; only new or
+        # changed rows are styled and truncated again.
+        previous = self._row_cache.get(name, {})
+        current: dict[tuple[Row, int, str, bool], Text] = {}
+        lines: list[Text] = []
+        for row in rows:
+            key = (row, width, style, (row.key or row.text) in highlights)
+            line = current.get(key) or previous.get(key)
+            if line is None:
+                line = _fit_row(row, width, style, key[3])
+            current[key] = line
+            lines.append(line)
+        if name:
+            self._row_cache[name] = current
+        return lines
+
+    def _max_rows(self, name: str) -> int:
+        for source in self.sources:
+            if source.name == name:
+                return int(source.options.get("max_rows", 0))
+        return 0
 
     def _apply_auto_lines(self) -> None:
         height = self.console.size.height
         for source in self.sources:
-            if not isinstance(source, RssTickerSource):
+            if not source.supports_auto_lines:
                 continue
             if not source.options.get("auto_lines"):
                 continue
@@ -114,3 +286,27 @@ class Dashboard:
             max_lines = int(source.options.get("max_lines", 6))
             lines = max(min_lines, min(max_lines, max(1, height // 6)))
             source.options["lines"] = lines
+
+
+def _column_count(width: int, tiles: int) -> int:
+    return max(1, min(tiles, width // TILE_MIN_WIDTH))
+
+
+def _fit_lines(value: str, width: int, style: str) -> list[Text]:
+    return [_fit_row(Row(raw), width, style) for raw in value.splitlines() or [""]]
+
+
+def _fit_row(row: Row, width: int, style: str, highlighted: bool = False) -> Text:
+    styles = [style, row.style, HIGHLIGHT_STYLE if highlighted else ""]
+    line = Text(row.text, style=" ".join(part for part in styles if part), no_wrap=True)
+    line.truncate(width, overflow="ellipsis")
+    return line
+
+
+def _limit_rows(rows: tuple[Row, ...], max_rows: int) -> tuple[Row, ...]:
+    """At most ``max_rows`` rows, then one line counting the rest (0 shows all)."""
+    if max_rows <= 0 or len(rows) <= max_rows:
+        return rows
+    hidden = len(rows) - max_rows
+    return (*rows[:max_rows], Row(f"… +{hidden} more", style="dim"))
+
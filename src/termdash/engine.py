@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from dataclasses import replace
+from pathlib import Path
+from typing import TYPE_CHECKING, AsyncIterator, Awaitable, Callable, Iterable
+from urllib.parse import urlsplit
+
+from termdash.config import DashboardConfig
+from termdash.executor import ParseExecutor
+from termdash.metrics import REGISTRY, Metrics
+from termdash.net.breaker import CircuitOpenError
+from termdash.scheduler import Scheduler
+from termdash.snapshot import DEFAULT_CACHE_DIR, Snapshot, SnapshotCache, should_persist
+from termdash.sources.base import DataPoint, DataSource
+from termdash.state import StateStore
+
+if TYPE_CHECKING:
+    from termdash.net.pool import HttpPool
+
+logger = logging.getLogger(__name__)
+
+
+class PollingEngine:
+    """Polls every source on the scheduler and publishes results to ``store``.
+
+    Frontends (the Rich dashboard, headless output) only read the store; the
+    engine owns the HTTP pool, snapshot cache and background tasks and runs
+    for as long as the frontend coroutine does.
+    """
+
+    def __init__(
+        self,
+        config: DashboardConfig,
+        sources: Iterable[DataSource],
+        metrics: Metrics = REGISTRY,
+    ) -> None:
+        self.config = config
+        self.sources = list(sources)
+        self.metrics = metrics
+        self.store = StateStore(
+            (source.name, DataPoint(title=source.name, value="Loading...", status="loading"))
+            for source in self.sources
+        )
+
+    async def run(self, frontend: Callable[[], Awaitable[None]]) -> None:
+        cache = None
+        if self.config.cache.enabled:
+            cache = SnapshotCache(self.config.cache.directory or DEFAULT_CACHE_DIR)
+            self._restore_snapshots(cache)
+
+        async with self._http_pool() as pool:
+            if pool is not None:
+                for source in self.sources:
+                    await source.start(pool)
+            try:
+                await self._run_tasks(pool, cache, frontend)
+            finally:
+                for source in self.sources:
+                    await source.stop()
+
+    @asynccontextmanager
+    async def _http_pool(self) -> AsyncIterator[HttpPool | None]:
+        # Dashboards whose sources declare no HTTP endpoints (e.g. MCP only)
+        # never import the HTTP stack.
+        if not any(source.endpoints() for source in self.sources):
+            yield None
+            return
+
+        from termdash.net.pool import HttpPool
+
+        executor = ParseExecutor(self.config.executor)
+        try:
+            async with HttpPool(
+                self.config.http, executor=executor, metrics=self.metrics
+            ) as pool:
+                yield pool
+        finally:
+            executor.shutdown()
+
+    async def _run_tasks(
+        self,
+        pool: HttpPool | None,
+        cache: SnapshotCache | None,
+        frontend: Callable[[], Awaitable[None]],
+    ) -> None:
+        sources = {source.name: source for source in self.sources}
+        scheduler = Scheduler(self.config.scheduler, metrics=self.metrics)
+        scheduler.add_all(
+            [(source.name, hosts(source), source.refresh_seconds) for source in self.sources]
+        )
+
+        async def poll(name: str) -> float:
+            return await self._poll_once(sources[name], pool)
+
+        tasks = [asyncio.create_task(scheduler.run(poll))]
+        if cache is not None:
+            tasks.append(asyncio.create_task(self._persist_snapshots(cache)))
+        if pool is not None and self.config.http.prewarm:
+            endpoints = [url for source in self.sources for url in source.endpoints()]
+            tasks.append(asyncio.create_task(pool.warm(endpoints)))
+        if self.config.metrics.textfile is not None:
+            tasks.append(asyncio.create_task(self._export_metrics(self.config.metrics.textfile)))
+
+        try:
+            await frontend()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _restore_snapshots(self, cache: SnapshotCache) -> None:
+        for source in self.sources:
+            snapshot = cache.load(source)
+            if snapshot is None:
+                continue
+            try:
+                if snapshot.state is not None:
+                    source.restore_state(snapshot.state)
+                self.store.publish(source.name, snapshot.data)
+            except Exception as exc:  # noqa: BLE001
+                # A stale cache file must never keep the dashboard from starting.
+                logger.warning("ignoring cached snapshot for %s: %r", source.name, exc)
+
+    async def _persist_snapshots(self, cache: SnapshotCache) -> None:
+        # Debounced and written from a worker thread so disk I/O never delays
+        # polling or the frontend.
+        written: dict[str, DataPoint] = {}
+        version = self.store.version
+        while True:
+            if not await self.store.wait(version):
+                continue
+            await asyncio.sleep(self.config.cache.flush_seconds)
+            version = self.store.version
+            snapshot = self.store.snapshot()
+            pending: list[tuple[DataSource, Snapshot]] = []
+            for source in self.sources:
+                data = snapshot.get(source.name)
+                if data is None or written.get(source.name) is data or not should_persist(data):
+                    continue
+                pending.append((source, Snapshot(data=data, state=source.export_state())))
+                written[source.name] = data
+            if pending:
+                await asyncio.to_thread(cache.save_many, pending)
+
+    async def _export_metrics(self, path: Path) -> None:
+        while True:
+            await asyncio.sleep(self.config.metrics.flush_seconds)
+            try:
+                await asyncio.to_thread(self.metrics.write_textfile, path)
+            except OSError:
+                pass
+
+    async def _poll_once(self, source: DataSource, pool: HttpPool | None) -> float:
+        """Fetch one source, publish the result and return the delay to the next poll."""
+        retry_in = 0.0
+        start = time.perf_counter()
+        try:
+            data = await source.fetch()
+        except CircuitOpenError as exc:
+            data = DataPoint(title=source.name, value=str(exc), status="error")
+            retry_in = exc.retry_in
+        except Exception as exc:  # noqa: BLE001
+            data = DataPoint(title=source.name, value=str(exc), status="error")
+        self.metrics.record_fetch(
+            source.name, time.perf_counter() - start, error=data.status == "error"
+        )
+
+        breaker_note = pool.breakers.describe(hosts(source)) if pool is not None else ""
+        if breaker_note:
+            detail = f"{data.detail}\n{breaker_note}" if data.detail else breaker_note
+            data = replace(data, detail=detail)
+
+        self.store.publish(source.name, data)
+        return max(source.poll_interval(), retry_in)
+
+
+def hosts(source: DataSource) -> list[str]:
+    return [host for host in (urlsplit(url).hostname for url in source.endpoints()) if host]
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, TypeVar
+
+from termdash.config import ExecutorConfig
+
+T = TypeVar("T")
+
+
+@dataclass
+class TaskStats:
+    count: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    queued_seconds: float = 0.0
+
+    def record(self, queued: float, elapsed: float) -> None:
+        self.count += 1
+        self.total_seconds += elapsed
+        self.max_seconds = max(self.max_seconds, elapsed)
+        self.queued_seconds += queued
+
+
+class ParseExecutor:
+    """Runs CPU-bound parsing off the event loop.
+
+    ``kind`` is ``thread`` (default), ``process`` or ``inline``. A process pool
+    sidesteps the GIL entirely but needs picklable, module-level callables and
+    results. At most ``max_pending`` tasks are queued or running; further
+    callers wait their turn instead of growing an unbounded backlog.
+    """
+
+    def __init__(self, config: ExecutorConfig | None = None) -> None:
+        self.config = config or ExecutorConfig()
+        self.stats: dict[str, TaskStats] = {}
+        self._pending = asyncio.Semaphore(max(1, self.config.max_pending))
+        self._executor: Executor | None = None
+
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        name = getattr(func, "__qualname__", repr(func))
+        stats = self.stats.setdefault(name, TaskStats())
+        queued_at = time.perf_counter()
+        async with self._pending:
+            started = time.perf_counter()
+            if self.config.kind == "inline":
+                result, elapsed = _timed(func, args)
+            else:
+                loop = asyncio.get_running_loop()
+                result, elapsed = await loop.run_in_executor(
+                    self._get_executor(), _timed, func, args
+                )
+        stats.record(started - queued_at, elapsed)
+        return result
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            workers = max(1, self.config.workers)
+            if self.config.kind == "process":
+                self._executor = ProcessPoolExecutor(max_workers=workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=workers, thread_name_prefix="termdash-parse"
+                )
+        return self._executor
+
+
+def _timed(func: Callable[..., T], args: tuple[Any, ...]) -> tuple[T, float]:
+    # Timed inside the worker so queueing in the executor is not counted as work.
+    started = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - started
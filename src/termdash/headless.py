@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Iterable, Mapping, TextIO
+
+from termdash.config import DashboardConfig
+from termdash.engine import PollingEngine
+from termdash.sources.base import DataPoint, DataSource
+
+
+class HeadlessWriter:
+    """Streams DataPoint updates as JSON lines instead of drawing a dashboard.
+
+    Each line is one source's DataPoint plus its ``source`` name, written only
+    when that source's content changed. Nothing is rendered, so the cost per
+    update is one ``json.dumps``.
+    """
+
+    def __init__(
+        self, config: DashboardConfig, sources: Iterable[DataSource], output: TextIO
+    ) -> None:
+        self.engine = PollingEngine(config, sources)
+        self.store = self.engine.store
+        self.output = output
+        self._emitted: dict[str, DataPoint] = {}
+
+    async def run(self) -> None:
+        await self.engine.run(self._stream)
+
+    async def _stream(self) -> None:
+        version = -1
+        while True:
+            if not await self.store.wait(version):
+                continue
+            version = self.store.version
+            lines = self._pending(self.store.snapshot())
+            if lines:
+                # Writes go through a thread so a slow reader never stalls polling.
+                await asyncio.to_thread(self._write, lines)
+
+    def _pending(self, snapshot: Mapping[str, DataPoint]) -> list[str]:
+        # The store swaps in a new DataPoint only when content changed, so
+        # identity tells which sources have news since the last write.
+        lines: list[str] = []
+        for name, data in snapshot.items():
+            if self._emitted.get(name) is data:
+                continue
+            self._emitted[name] = data
+            if data.status == "loading":
+                continue
+            lines.append(encode(name, data))
+        return lines
+
+    def _write(self, lines: list[str]) -> None:
+        self.output.write("".join(f"{line}\n" for line in lines))
+        self.output.flush()
+
+
+def encode(name: str, data: DataPoint) -> str:
+    return json.dumps({"source": name, **data.to_dict()}, ensure_ascii=False, separators=(",", ":"))
@@ -4,6 +4,7 @@ import argparse
 import asyncio
 import importlib
 import os
+import sys
 from pathlib import Path
 
 import yaml
@@ -11,7 +12,6 @@ import yaml
 from termdash.config import load_config
 from termdash.dashboard import Dashboard
 from termdash.sources import create_source
-from termdash.setup import ensure_user_config
 
 
 def load_mcp_client() -> object | None:
@@ -50,7 +50,43 @@ def run() -> None:
         default=None,
         help="Block a news source in rss_ticker options and exit",
     )
+    parser.add_argument(
+        "--headless",
+        action="store_true",
+        help="Poll sources without a UI and write each change as a JSON line",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        default=None,
+        help="File to append headless JSON lines to (default: stdout)",
+    )
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument(
+        "--daemon",
+        action="store_true",
+        help="Poll sources and serve their state to attached dashboards over a Unix socket",
+    )
+    mode.add_argument(
+        "--attach",
+        action="store_true",
+        help="Show the state served by a running daemon instead of polling",
+    )
+    parser.add_argument(
+        "--socket",
+        type=Path,
+        default=None,
+        help="Unix socket for --daemon/--attach (default: ~/.termdash/termdash.sock)",
+    )
     args = parser.parse_args()
+    if args.output is not None and not args.headless:
+        parser.error("--output requires --headless")
+    if args.headless and (args.daemon or args.attach):
+        parser.error("--headless cannot be combined with --daemon or --attach")
+
+    # Imported here so that importing termdash.main stays cheap.
+    from termdash.setup import ensure_user_config
 
     config_path = ensure_user_config(args.config)
     if args.block_source:
@@ -60,10 +96,50 @@ def run() -> None:
     config = load_config(config_path)
     mcp_client = load_mcp_client()
     sources = build_sources(config, mcp_client=mcp_client)
+    if args.headless:
+        _run_headless(config, sources, args.output)
+        return
+    if args.daemon or args.attach:
+        _run_shared(config, sources, args.socket, serve=args.daemon)
+        return
     dashboard = Dashboard(config, sources)
     asyncio.run(dashboard.run())
 
 
+def _run_headless(config, sources, output_path: Path | None) -> None:
+    from termdash.headless import HeadlessWriter
+
+    if output_path is None:
+        output = sys.stdout
+    else:
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output = output_path.open("a", encoding="utf-8")
+    try:
+        asyncio.run(HeadlessWriter(config, sources, output).run())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+
+def _run_shared(config, sources, socket_path: Path | None, *, serve: bool) -> None:
+    from termdash.daemon import DEFAULT_SOCKET_PATH, DaemonRunningError, DaemonServer
+
+    if not hasattr(asyncio, "start_unix_server"):
+        raise SystemExit("--daemon and --attach need Unix domain sockets")
+    path = (socket_path or DEFAULT_SOCKET_PATH).expanduser()
+    try:
+        if serve:
+            asyncio.run(DaemonServer(config, sources, path).run())
+        else:
+            asyncio.run(Dashboard(config, sources).attach(path))
+    except KeyboardInterrupt:
+        pass
+    except DaemonRunningError as exc:
+        raise SystemExit(str(exc)) from exc
+
+
 def _block_source(config_path: Path, source_name: str) -> None:
     data = yaml.safe_load(config_path.read_text(encoding="utf-8")) or {}
     sources = data.get("sources", [])
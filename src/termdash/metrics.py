@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import os
+from bisect import bisect_left
+from pathlib import Path
+from typing import Iterator
+
+FETCH_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+PARSE_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0)
+FRAME_BUCKETS = PARSE_BUCKETS
+LATENESS_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0, 30.0)
+
+
+class Histogram:
+    """Fixed-bucket histogram with Prometheus semantics (``le`` upper bounds)."""
+
+    __slots__ = ("buckets", "counts", "count", "sum")
+
+    def __init__(self, buckets: tuple[float, ...]) -> None:
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding the ``q`` quantile (inf past the last bucket)."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.buckets, self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return float("inf")
+
+    def cumulative(self) -> Iterator[tuple[str, int]]:
+        seen = 0
+        for bound, count in zip(self.buckets, self.counts):
+            seen += count
+            yield _number(bound), seen
+        yield "+Inf", self.count
+
+
+class Metrics:
+    """In-process counters and histograms for polling, HTTP, parsing and drawing.
+
+    Recording is a dict lookup plus a bisect, cheap enough to stay on for
+    every poll and frame. ``prometheus_text`` renders everything in the text
+    exposition format for the node-exporter textfile collector.
+    """
+
+    def __init__(self) -> None:
+        self.fetch_seconds: dict[str, Histogram] = {}
+        self.fetch_errors: dict[str, int] = {}
+        self.lateness_seconds: dict[str, Histogram] = {}
+        self.parse_seconds: dict[str, Histogram] = {}
+        self.response_bytes: dict[str, int] = {}
+        self.responses: dict[str, int] = {}
+        self.frame_seconds = Histogram(FRAME_BUCKETS)
+
+    def record_fetch(self, source: str, seconds: float, *, error: bool = False) -> None:
+        _histogram(self.fetch_seconds, source, FETCH_BUCKETS).observe(seconds)
+        if error:
+            self.fetch_errors[source] = self.fetch_errors.get(source, 0) + 1
+
+    def record_lateness(self, source: str, seconds: float) -> None:
+        _histogram(self.lateness_seconds, source, LATENESS_BUCKETS).observe(max(0.0, seconds))
+
+    def record_response(self, host: str, size: int) -> None:
+        self.responses[host] = self.responses.get(host, 0) + 1
+        self.response_bytes[host] = self.response_bytes.get(host, 0) + size
+
+    def record_parse(self, host: str, seconds: float) -> None:
+        _histogram(self.parse_seconds, host, PARSE_BUCKETS).observe(seconds)
+
+    def record_frame(self, seconds: float) -> None:
+        self.frame_seconds.observe(seconds)
+
+    def prometheus_text(self) -> str:
+        lines: list[str] = []
+        _histogram_family(
+            lines, "termdash_fetch_seconds", "Source fetch latency.", "source", self.fetch_seconds
+        )
+        _counter_family(
+            lines,
+            "termdash_fetch_errors_total",
+            "Fetches that failed or returned an error tile.",
+            "source",
+            self.fetch_errors,
+        )
+        _histogram_family(
+            lines,
+            "termdash_schedule_lateness_seconds",
+            "Delay between a poll falling due and starting.",
+            "source",
+            self.lateness_seconds,
+        )
+        _counter_family(
+            lines,
+            "termdash_http_responses_total",
+            "HTTP responses received.",
+            "host",
+            self.responses,
+        )
+        _counter_family(
+            lines,
+            "termdash_http_response_bytes_total",
+            "HTTP response body bytes received.",
+            "host",
+            self.response_bytes,
+        )
+        _histogram_family(
+            lines, "termdash_parse_seconds", "Response parse time.", "host", self.parse_seconds
+        )
+        _histogram_family(
+            lines,
+            "termdash_frame_seconds",
+            "Dashboard frame build and draw time.",
+            "",
+            {"": self.frame_seconds},
+        )
+        return "".join(f"{line}\n" for line in lines)
+
+    def write_textfile(self, path: Path) -> None:
+        """Replace ``path`` atomically so the collector never reads a partial file."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        temp.write_text(self.prometheus_text(), encoding="utf-8")
+        os.replace(temp, path)
+
+
+# Shared by the engine, HTTP pool, dashboard and stats tile of this process.
+REGISTRY = Metrics()
+
+
+def _histogram(table: dict[str, Histogram], key: str, buckets: tuple[float, ...]) -> Histogram:
+    histogram = table.get(key)
+    if histogram is None:
+        histogram = table[key] = Histogram(buckets)
+    return histogram
+
+
+def _histogram_family(
+    lines: list[str], name: str, help_text: str, label: str, table: dict[str, Histogram]
+) -> None:
+    lines.append(f"# HELP {name} {help_text}")
+    lines.append(f"# TYPE {name} histogram")
+    for key, histogram in sorted(table.items()):
+        base = f'{label}="{_escape(key)}",' if label else ""
+        for bound, count in histogram.cumulative():
+            lines.append(f'{name}_bucket{{{base}le="{bound}"}} {count}')
+        suffix = f"{{{base.rstrip(',')}}}" if label else ""
+        lines.append(f"{name}_sum{suffix} {_number(histogram.sum)}")
+        lines.append(f"{name}_count{suffix} {histogram.count}")
+
+
+def _counter_family(
+    lines: list[str], name: str, help_text: str, label: str, table: dict[str, int]
+) -> None:
+    lines.append(f"# HELP {name} {help_text}")
+    lines.append(f"# TYPE {name} counter")
+    for key, value in sorted(table.items()):
+        lines.append(f'{name}{{{label}="{_escape(key)}"}} {value}')
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _number(value: float) -> str:
+    return repr(float(value))
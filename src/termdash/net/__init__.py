@@ -0,0 +1,5 @@
+"""Shared HTTP plumbing used by data sources.
+
+Submodules are imported directly (``termdash.net.pool``) so that importing the
+breaker types does not pull in httpx.
+"""
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import random
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING, Iterable
+
+if TYPE_CHECKING:
+    import httpx
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half-open"
+
+
+class CircuitOpenError(RuntimeError):
+    def __init__(self, host: str, retry_in: float) -> None:
+        super().__init__(f"{host} unavailable (circuit open)")
+        self.host = host
+        self.retry_in = retry_in
+
+
+@dataclass
+class CircuitBreaker:
+    """Per-host breaker with exponential, jittered backoff and a half-open probe."""
+
+    host: str
+    failure_threshold: int = 3
+    base_delay: float = 5.0
+    max_delay: float = 900.0
+    jitter: float = 0.2
+    state: str = CLOSED
+    failures: int = 0
+    trips: int = 0
+    retry_at: float = 0.0
+    probing: bool = False
+
+    def before_request(self, now: float | None = None) -> None:
+        now = time.monotonic() if now is None else now
+        if self.state == CLOSED:
+            return
+        if self.state == OPEN and now >= self.retry_at:
+            self.state = HALF_OPEN
+            self.probing = False
+        if self.state == HALF_OPEN and not self.probing:
+            self.probing = True
+            return
+        raise CircuitOpenError(self.host, max(0.0, self.retry_at - now))
+
+    def abandon_probe(self) -> None:
+        """Let the next caller probe again when a probe ends without an outcome."""
+        self.probing = False
+
+    def record_success(self) -> None:
+        self.state = CLOSED
+        self.failures = 0
+        self.trips = 0
+        self.probing = False
+
+    def record_failure(self, now: float | None = None, *, retry_after: float = 0.0) -> None:
+        now = time.monotonic() if now is None else now
+        self.failures += 1
+        self.probing = False
+        if self.state != HALF_OPEN and self.failures < self.failure_threshold:
+            return
+        delay = min(self.max_delay, self.base_delay * 2**self.trips)
+        delay *= random.uniform(1 - self.jitter, 1 + self.jitter)
+        self.trips += 1
+        self.state = OPEN
+        self.retry_at = now + max(delay, retry_after)
+
+    def describe(self, now: float | None = None) -> str:
+        now = time.monotonic() if now is None else now
+        if self.state == OPEN:
+            retry_in = max(0, round(self.retry_at - now))
+            return f"{self.host}: circuit open, retry in {retry_in}s ({self.failures} failures)"
+        if self.state == HALF_OPEN:
+            return f"{self.host}: circuit half-open, probing"
+        if self.failures:
+            return f"{self.host}: {self.failures} recent failures"
+        return ""
+
+
+class BreakerRegistry:
+    def __init__(
+        self,
+        *,
+        failure_threshold: int = 3,
+        base_delay: float = 5.0,
+        max_delay: float = 900.0,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._breakers: dict[str, CircuitBreaker] = {}
+
+    def for_host(self, host: str) -> CircuitBreaker:
+        breaker = self._breakers.get(host)
+        if breaker is None:
+            breaker = self._breakers[host] = CircuitBreaker(
+                host,
+                failure_threshold=self.failure_threshold,
+                base_delay=self.base_delay,
+                max_delay=self.max_delay,
+            )
+        return breaker
+
+    def describe(self, hosts: Iterable[str]) -> str:
+        notes = []
+        for host in dict.fromkeys(hosts):
+            breaker = self._breakers.get(host)
+            if breaker is not None:
+                note = breaker.describe()
+                if note:
+                    notes.append(note)
+        return "; ".join(notes)
+
+
+def is_failure(response: httpx.Response) -> bool:
+    return response.status_code == 429 or response.status_code >= 500
+
+
+def retry_after_seconds(response: httpx.Response) -> float:
+    value = response.headers.get("retry-after")
+    if not value:
+        return 0.0
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return 0.0
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class CoalesceStats:
+    requests: int = 0
+    joined: int = 0
+    cache_hits: int = 0
+
+
+class RequestCoalescer:
+    """Single-flight plus a short TTL result cache, keyed by request identity.
+
+    Concurrent callers for the same key await one shared task; callers that
+    arrive within ``ttl`` seconds of it finishing get its result directly.
+    """
+
+    def __init__(self, ttl: float = 5.0, *, max_results: int = 256) -> None:
+        self.ttl = max(0.0, ttl)
+        self.max_results = max(1, max_results)
+        self.stats = CoalesceStats()
+        self._inflight: dict[Hashable, asyncio.Task[Any]] = {}
+        self._results: dict[Hashable, tuple[float, Any]] = {}
+
+    async def run(self, key: Hashable, factory: Callable[[], Awaitable[T]]) -> T:
+        self.stats.requests += 1
+        cached = self._results.get(key)
+        if cached is not None:
+            if cached[0] > time.monotonic():
+                self.stats.cache_hits += 1
+                return cached[1]
+            del self._results[key]
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._finish(key, done))
+        else:
+            self.stats.joined += 1
+
+        # Shielded so one tile being cancelled does not abort the shared request.
+        return await asyncio.shield(task)
+
+    def clear(self) -> None:
+        self._results.clear()
+
+    def _finish(self, key: Hashable, task: asyncio.Task[Any]) -> None:
+        self._inflight.pop(key, None)
+        if task.cancelled() or task.exception() is not None or self.ttl <= 0:
+            return
+        now = time.monotonic()
+        if len(self._results) >= self.max_results:
+            self._results = {k: v for k, v in self._results.items() if v[0] > now}
+            while len(self._results) >= self.max_results:
+                self._results.pop(next(iter(self._results)))
+        self._results[key] = (now + self.ttl, task.result())
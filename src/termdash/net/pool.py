@@ -0,0 +1,271 @@
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import json
+import logging
+import time
+from typing import Any, Callable, Iterable, TypeVar
+from urllib.parse import urlsplit
+
+import httpx
+
+from termdash.config import HttpConfig
+from termdash.executor import ParseExecutor
+from termdash.metrics import Metrics
+from termdash.net.breaker import BreakerRegistry, is_failure, retry_after_seconds
+from termdash.net.coalesce import RequestCoalescer
+from termdash.net.validation import MISSING, CacheEntry, ValidationCache
+
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+
+class HttpPool:
+    """Dashboard-owned HTTP client shared by every source.
+
+    One keep-alive connection pool serves all tiles so steady-state polls reuse
+    warm connections instead of paying DNS, TCP and TLS setup on every fetch.
+    """
+
+    def __init__(
+        self,
+        config: HttpConfig | None = None,
+        *,
+        executor: ParseExecutor | None = None,
+        metrics: Metrics | None = None,
+    ) -> None:
+        self.config = config or HttpConfig()
+        self.executor = executor
+        self.metrics = metrics
+        self._client: httpx.AsyncClient | None = None
+        self.validation: ValidationCache | None = None
+        if self.config.validation_cache:
+            self.validation = ValidationCache(self.config.validation_cache_entries)
+        self.coalescer: RequestCoalescer | None = None
+        if self.config.coalesce_ttl >= 0:
+            self.coalescer = RequestCoalescer(self.config.coalesce_ttl)
+        self.breakers = BreakerRegistry(
+            failure_threshold=self.config.breaker_failures,
+            base_delay=self.config.breaker_base_delay,
+            max_delay=self.config.breaker_max_delay,
+        )
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = _build_client(self.config)
+        return self._client
+
+    async def __aenter__(self) -> HttpPool:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def get(self, url: str, *, params: dict[str, Any] | None = None) -> httpx.Response:
+        response = await self._send(url, params=params)
+        response.raise_for_status()
+        return response
+
+    async def _send(
+        self,
+        url: str,
+        *,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> httpx.Response:
+        # Fails fast with CircuitOpenError while the host's breaker is open.
+        host = httpx.URL(url).host
+        breaker = self.breakers.for_host(host)
+        breaker.before_request()
+        try:
+            response = await self.client.get(url, params=params, headers=headers)
+        except httpx.TransportError:
+            breaker.record_failure()
+            raise
+        except BaseException:
+            breaker.abandon_probe()
+            raise
+
+        if is_failure(response):
+            breaker.record_failure(retry_after=retry_after_seconds(response))
+        else:
+            breaker.record_success()
+        if self.metrics is not None:
+            self.metrics.record_response(host, len(response.content))
+        return response
+
+    async def get_parsed(
+        self,
+        url: str,
+        parse: Callable[[bytes], T],
+        *,
+        params: dict[str, Any] | None = None,
+    ) -> T:
+        """GET ``url`` and parse the body, sharing work with identical requests.
+
+        The download is coalesced and revalidated by full URL alone, so callers
+        with different parsers still share one request; each ``parse`` then
+        runs once per body. ``parse`` must be a stable, hashable callable: it
+        keys the memoized result returned again when the server answers 304.
+        Callers must treat the returned object as read-only.
+        """
+        key = str(httpx.URL(url, params=params))
+        host = httpx.URL(url).host
+        if self.coalescer is None:
+            entry = await self._fetch_entry(key, url, params)
+            return await self._parse_entry(entry, parse, host)
+
+        async def fetch_and_parse() -> T:
+            entry = await self.coalescer.run(key, lambda: self._fetch_entry(key, url, params))
+            return await self._parse_entry(entry, parse, host)
+
+        return await self.coalescer.run((key, parse), fetch_and_parse)
+
+    async def _fetch_entry(
+        self, key: str, url: str, params: dict[str, Any] | None
+    ) -> CacheEntry:
+        if self.validation is None:
+            response = await self.get(url, params=params)
+            return CacheEntry(body=response.content)
+
+        entry = self.validation.get(key)
+        headers = entry.request_headers() if entry is not None else None
+        response = await self._send(url, params=params, headers=headers)
+        if response.status_code == 304 and entry is not None:
+            self.validation.record_hit(entry)
+            return entry
+
+        response.raise_for_status()
+        self.validation.stats.misses += 1
+        return self.validation.store(key, response) or CacheEntry(body=response.content)
+
+    async def _parse_entry(self, entry: CacheEntry, parse: Callable[[bytes], T], host: str) -> T:
+        parsed = entry.parsed.get(parse, MISSING)
+        if parsed is not MISSING:
+            if self.validation is not None:
+                self.validation.stats.parses_saved += 1
+            return parsed
+        parsed = entry.parsed[parse] = await self._parse(parse, entry.body, host)
+        return parsed
+
+    async def _parse(self, parse: Callable[[bytes], T], content: bytes, host: str) -> T:
+        start = time.perf_counter()
+        if self.executor is None:
+            parsed = parse(content)
+        else:
+            parsed = await self.executor.run(parse, content)
+        if self.metrics is not None:
+            self.metrics.record_parse(host, time.perf_counter() - start)
+        return parsed
+
+    async def get_json(self, url: str, *, params: dict[str, Any] | None = None) -> Any:
+        return await self.get_parsed(url, parse_json, params=params)
+
+    async def warm(self, urls: Iterable[str]) -> None:
+        """Open a connection to every distinct origin ahead of the first poll."""
+        origins = sorted({origin for origin in (_origin(url) for url in urls) if origin})
+        if not origins:
+            return
+        await asyncio.gather(*(self._warm_origin(origin) for origin in origins))
+
+    async def _warm_origin(self, origin: str) -> None:
+        try:
+            response = await self.client.head(origin + "/")
+            await response.aclose()
+        except httpx.HTTPError as exc:
+            # Best effort: the first real poll reports the failure on its tile.
+            logger.debug("pre-warming %s failed: %r", origin, exc)
+
+
+def parse_json(content: bytes) -> Any:
+    return json.loads(content)
+
+
+def http2_available() -> bool:
+    return importlib.util.find_spec("h2") is not None
+
+
+def _build_client(config: HttpConfig) -> httpx.AsyncClient:
+    limits = httpx.Limits(
+        max_connections=config.max_connections,
+        max_keepalive_connections=config.max_keepalive_connections,
+        keepalive_expiry=config.keepalive_expiry,
+    )
+    http2 = config.http2 and http2_available()
+    transport = HostLimitedTransport(
+        httpx.AsyncHTTPTransport(limits=limits, http2=http2),
+        max_per_host=config.max_connections_per_host,
+    )
+    return httpx.AsyncClient(
+        transport=transport,
+        timeout=config.timeout,
+        follow_redirects=True,
+    )
+
+
+def _origin(url: str) -> str:
+    parts = urlsplit(url)
+    if parts.scheme not in {"http", "https"} or not parts.netloc:
+        return ""
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+class HostLimitedTransport(httpx.AsyncBaseTransport):
+    """Caps in-flight requests per host on top of httpx's global pool limits.
+
+    The slot is held until the response body is closed, so a slow download
+    counts against its host for as long as it occupies a connection.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, *, max_per_host: int) -> None:
+        self._transport = transport
+        self._max_per_host = max(1, max_per_host)
+        self._slots: dict[str, asyncio.Semaphore] = {}
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        slot = self._slots.get(request.url.host)
+        if slot is None:
+            slot = self._slots[request.url.host] = asyncio.Semaphore(self._max_per_host)
+
+        await slot.acquire()
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException:
+            slot.release()
+            raise
+
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=_ReleasingStream(response.stream, slot),
+            extensions=response.extensions,
+        )
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+class _ReleasingStream(httpx.AsyncByteStream):
+    def __init__(self, stream: httpx.AsyncByteStream, slot: asyncio.Semaphore) -> None:
+        self._stream = stream
+        self._slot: asyncio.Semaphore | None = slot
+
+    async def __aiter__(self):
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            if self._slot is not None:
+                self._slot.release()
+                self._slot = None
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+import httpx
+
+MISSING = object()
+
+
+@dataclass
+class CacheEntry:
+    """A response body plus its parsed results, memoized per parse callable."""
+
+    body: bytes
+    etag: str | None = None
+    last_modified: str | None = None
+    parsed: dict[Callable[[bytes], Any], Any] = field(default_factory=dict)
+
+    def request_headers(self) -> dict[str, str]:
+        headers: dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+@dataclass
+class ValidationStats:
+    hits: int = 0
+    misses: int = 0
+    bytes_saved: int = 0
+    parses_saved: int = 0
+
+
+class ValidationCache:
+    """Remembers ETag/Last-Modified validators plus the body and parsed result.
+
+    A 304 answer hands back the body and the parsed objects from the previous
+    200, so an unchanged feed costs one round trip and no parsing.
+    """
+
+    def __init__(self, max_entries: int = 256) -> None:
+        self.max_entries = max(1, max_entries)
+        self.stats = ValidationStats()
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> CacheEntry | None:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def store(self, key: str, response: httpx.Response) -> CacheEntry | None:
+        etag = response.headers.get("etag")
+        last_modified = response.headers.get("last-modified")
+        if not etag and not last_modified:
+            self._entries.pop(key, None)
+            return None
+
+        entry = CacheEntry(body=response.content, etag=etag, last_modified=last_modified)
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return entry
+
+    def record_hit(self, entry: CacheEntry) -> None:
+        """Record a 304 answered from ``entry``'s stored body."""
+        self.stats.hits += 1
+        self.stats.bytes_saved += len(entry.body)
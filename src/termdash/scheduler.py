@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import asyncio
+import heapq
+import random
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Iterable
+
+from termdash.config import SchedulerConfig
+from termdash.metrics import Metrics
+
+DEFAULT_INTERVAL_SECONDS = 60.0
+
+
+@dataclass(order=True)
+class _Due:
+    at: float
+    seq: int
+    key: str = field(compare=False)
+
+
+class Scheduler:
+    """Single min-heap of due times shared by every source.
+
+    Keys are run through ``poll``, which returns the delay until that key is
+    due again; if ``poll`` raises, the key is retried after its ``interval``.
+    Runs are bounded by a global in-flight limit and a per-host limit, initial
+    runs are spread across ``startup_spread_seconds`` and every reschedule gets
+    a little jitter so sources never settle into lockstep.
+    """
+
+    def __init__(
+        self, config: SchedulerConfig | None = None, *, metrics: Metrics | None = None
+    ) -> None:
+        self.config = config or SchedulerConfig()
+        self.metrics = metrics
+        self._heap: list[_Due] = []
+        self._seq = 0
+        self._current: dict[str, int] = {}
+        self._hosts: dict[str, tuple[str, ...]] = {}
+        self._intervals: dict[str, float] = {}
+        self._host_slots: dict[str, asyncio.Semaphore] = {}
+        self._slots = asyncio.Semaphore(max(1, self.config.max_in_flight))
+        self._wakeup = asyncio.Event()
+        self._parked: list[_Due] = []
+        self._running: set[asyncio.Task[None]] = set()
+
+    def add(
+        self,
+        key: str,
+        hosts: Iterable[str] = (),
+        *,
+        delay: float = 0.0,
+        interval: float = DEFAULT_INTERVAL_SECONDS,
+    ) -> None:
+        self._hosts[key] = tuple(sorted(set(hosts)))
+        self._intervals[key] = interval
+        self.schedule(key, delay)
+
+    def add_all(self, jobs: list[tuple[str, Iterable[str], float]]) -> None:
+        """Add ``(key, hosts, interval)`` jobs with first runs staggered across startup."""
+        spread = max(0.0, self.config.startup_spread_seconds)
+        for i, (key, hosts, interval) in enumerate(jobs):
+            offset = spread * i / len(jobs)
+            delay = offset + random.uniform(0, spread / len(jobs))
+            self.add(key, hosts, delay=delay, interval=interval)
+
+    def schedule(self, key: str, delay: float) -> None:
+        """(Re)set when ``key`` is next due; replaces any earlier due time."""
+        self._seq += 1
+        self._current[key] = self._seq
+        loop = asyncio.get_running_loop()
+        heapq.heappush(self._heap, _Due(loop.time() + max(0.0, delay), self._seq, key))
+        self._wakeup.set()
+
+    async def run(self, poll: Callable[[str], Awaitable[float]]) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                if not self._heap:
+                    self._wakeup.clear()
+                    await self._wakeup.wait()
+                    continue
+
+                head = self._heap[0]
+                if self._current.get(head.key) != head.seq:
+                    heapq.heappop(self._heap)
+                    continue
+
+                wait = head.at - loop.time()
+                if wait > 0:
+                    self._wakeup.clear()
+                    try:
+                        await asyncio.wait_for(self._wakeup.wait(), wait)
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
+
+                heapq.heappop(self._heap)
+                await self._slots.acquire()
+                # A key whose host is saturated waits off-heap so it does not
+                # hold a global slot or block keys for other hosts behind it.
+                host_slots = [self._host_slot(host) for host in self._hosts.get(head.key, ())]
+                if any(slot.locked() for slot in host_slots):
+                    self._slots.release()
+                    self._parked.append(head)
+                    continue
+                for slot in host_slots:
+                    await slot.acquire()
+
+                del self._current[head.key]
+                if self.metrics is not None:
+                    self.metrics.record_lateness(head.key, loop.time() - head.at)
+                task = asyncio.create_task(self._run_one(head.key, host_slots, poll))
+                self._running.add(task)
+                task.add_done_callback(self._running.discard)
+        finally:
+            for task in list(self._running):
+                task.cancel()
+            await asyncio.gather(*self._running, return_exceptions=True)
+
+    async def _run_one(
+        self,
+        key: str,
+        host_slots: list[asyncio.Semaphore],
+        poll: Callable[[str], Awaitable[float]],
+    ) -> None:
+        try:
+            delay = await poll(key)
+        except Exception:  # noqa: BLE001
+            # A failing poll must not drop the key from the schedule for good.
+            delay = self._intervals.get(key, DEFAULT_INTERVAL_SECONDS)
+        finally:
+            for slot in host_slots:
+                slot.release()
+            self._slots.release()
+            for parked in self._parked:
+                heapq.heappush(self._heap, parked)
+            self._parked.clear()
+            self._wakeup.set()
+
+        if key not in self._current:
+            self.schedule(key, delay + self._jitter(delay))
+
+    def _host_slot(self, host: str) -> asyncio.Semaphore:
+        slot = self._host_slots.get(host)
+        if slot is None:
+            slot = self._host_slots[host] = asyncio.Semaphore(max(1, self.config.max_per_host))
+        return slot
+
+    def _jitter(self, delay: float) -> float:
+        bound = min(delay * self.config.jitter, self.config.max_jitter_seconds)
+        return random.uniform(0, bound) if bound > 0 else 0.0
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Iterable
+
+from termdash.snapshot import DEFAULT_CACHE_DIR
+
+DEFAULT_SEEN_PATH = DEFAULT_CACHE_DIR / "seen.sqlite3"
+DEFAULT_TTL_SECONDS = 7 * 24 * 3600
+# Eviction scans the last_seen index, so it runs at most this often.
+EVICT_INTERVAL_SECONDS = 3600
+# SQLite caps bound parameters per statement; stay well below the default limit.
+QUERY_CHUNK = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS seen (
+    key TEXT PRIMARY KEY,
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS seen_last_seen ON seen (last_seen);
+"""
+
+_stores: dict[Path, SeenStore] = {}
+_stores_lock = threading.Lock()
+
+
+class SeenStore:
+    """First-seen timestamps for headlines, keyed by link, in one SQLite file.
+
+    Lookups and writes take whole batches; each ``record`` call is a single
+    transaction. Rows not recorded for ``ttl_seconds`` are evicted. Calls block
+    on disk I/O, so async callers run them in a worker thread.
+    """
+
+    def __init__(
+        self, path: Path = DEFAULT_SEEN_PATH, ttl_seconds: float = DEFAULT_TTL_SECONDS
+    ) -> None:
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._last_evicted = 0.0
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_SCHEMA)
+
+    def lookup(self, keys: Iterable[str]) -> dict[str, float]:
+        """First-seen time of each key already in the store."""
+        unique = list(dict.fromkeys(keys))
+        first_seen: dict[str, float] = {}
+        with self._lock:
+            for start in range(0, len(unique), QUERY_CHUNK):
+                chunk = unique[start : start + QUERY_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                first_seen.update(
+                    self._db.execute(
+                        f"SELECT key, first_seen FROM seen WHERE key IN ({placeholders})", chunk
+                    ).fetchall()
+                )
+        return first_seen
+
+    def record(self, keys: Iterable[str], now: float | None = None) -> None:
+        """Mark ``keys`` seen at ``now`` in one transaction; first-seen times are kept."""
+        now = time.time() if now is None else now
+        rows = [(key, now, now) for key in dict.fromkeys(keys)]
+        with self._lock:
+            self._db.execute("BEGIN")
+            try:
+                self._db.executemany(
+                    "INSERT INTO seen (key, first_seen, last_seen) VALUES (?, ?, ?) "
+                    "ON CONFLICT (key) DO UPDATE SET last_seen = excluded.last_seen",
+                    rows,
+                )
+                if now - self._last_evicted >= EVICT_INTERVAL_SECONDS:
+                    cutoff = now - self.ttl_seconds
+                    self._db.execute("DELETE FROM seen WHERE last_seen < ?", (cutoff,))
+                    self._last_evicted = now
+                self._db.execute("COMMIT")
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM seen").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+
+def shared_seen_store(
+    path: Path | None = None, ttl_seconds: float = DEFAULT_TTL_SECONDS
+) -> SeenStore:
+    """One store per database file, shared by every ticker in the process.
+
+    Tickers sharing a file may ask for different TTLs; the longest one wins.
+    """
+    path = (path or DEFAULT_SEEN_PATH).expanduser().resolve()
+    with _stores_lock:
+        store = _stores.get(path)
+        if store is None:
+            store = _stores[path] = SeenStore(path, ttl_seconds)
+        store.ttl_seconds = max(store.ttl_seconds, ttl_seconds)
+        return store
@@ -3,7 +3,6 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any
 
-import httpx
 import yaml
 
 DEFAULT_CONFIG_DIR = Path.home() / ".termdash"
@@ -75,6 +74,7 @@ def _interactive_setup() -> dict[str, Any]:
                 "type": "rss_ticker",
                 "refresh_seconds": 15,
                 "options": {
+                    "feed_refresh_seconds": 300,
                     "auto_lines": True,
                     "min_lines": 2,
                     "max_lines": 6,
@@ -90,6 +90,7 @@ def _interactive_setup() -> dict[str, Any]:
                 "type": "rss_ticker",
                 "refresh_seconds": 20,
                 "options": {
+                    "feed_refresh_seconds": 300,
                     "auto_lines": True,
                     "min_lines": 2,
                     "max_lines": 4,
@@ -122,6 +123,8 @@ def _collect_location() -> tuple[str, str, float, float]:
 
 
 def _lookup_location() -> tuple[str, str, float, float]:
+    import httpx
+
     try:
         with httpx.Client(timeout=5) as client:
             response = client.get("https://ipapi.co/json/")
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Any
+
+from termdash.sources.base import DataPoint, DataSource
+
+DEFAULT_CACHE_DIR = Path.home() / ".termdash" / "cache"
+PERSISTED_STATUSES = {"ok", "warn"}
+
+
+@dataclass
+class Snapshot:
+    data: DataPoint
+    state: dict[str, Any] | None = None
+
+
+class SnapshotCache:
+    """Last known DataPoint and resume state per source, one JSON file each.
+
+    Files are keyed by source name and class, so panes running the same config
+    share a warm cache. Writes are atomic; unreadable or malformed files are
+    ignored.
+    """
+
+    def __init__(self, directory: Path = DEFAULT_CACHE_DIR) -> None:
+        self.directory = directory
+
+    def path_for(self, source: DataSource) -> Path:
+        key = f"{type(source).__name__}:{source.name}".encode("utf-8")
+        return self.directory / f"{hashlib.sha1(key).hexdigest()[:16]}.json"
+
+    def load(self, source: DataSource) -> Snapshot | None:
+        try:
+            raw = json.loads(self.path_for(source).read_text(encoding="utf-8"))
+            if not isinstance(raw, dict) or not isinstance(raw.get("data"), dict):
+                return None
+            data = DataPoint.from_dict(raw["data"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        state = raw.get("state")
+        return Snapshot(
+            data=replace(data, stale=True),
+            state=state if isinstance(state, dict) else None,
+        )
+
+    def save(self, source: DataSource, snapshot: Snapshot) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.path_for(source)
+        # Per-process temp name: panes sharing the directory never rename
+        # each other's half-written file.
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        payload = {"data": snapshot.data.to_dict(), "state": snapshot.state}
+        tmp.write_text(json.dumps(payload), encoding="utf-8")
+        os.replace(tmp, path)
+
+    def save_many(self, items: list[tuple[DataSource, Snapshot]]) -> None:
+        for source, snapshot in items:
+            try:
+                self.save(source, snapshot)
+            except (OSError, TypeError, ValueError):
+                continue
+
+
+def should_persist(data: DataPoint) -> bool:
+    return not data.stale and data.status in PERSISTED_STATUSES
@@ -1,27 +1,30 @@
 ﻿from __future__ import annotations
 
+import importlib
+from functools import lru_cache
+from importlib.metadata import EntryPoint, entry_points
+
 from termdash.config import SourceConfig
 from termdash.sources.base import DataSource
-from termdash.sources.espn_scores import EspnScoresSource, EspnSummarySource
-from termdash.sources.f1_ergast import F1ErgastSource
-from termdash.sources.mcp_base import MCPSource
-from termdash.sources.open_meteo import OpenMeteoSource
-from termdash.sources.rss import RssSource
-from termdash.sources.rss_ticker import RssTickerSource
-
-SOURCE_REGISTRY = {
-    "open_meteo": OpenMeteoSource,
-    "rss": RssSource,
-    "rss_ticker": RssTickerSource,
-    "mcp": MCPSource,
-    "espn_scores": EspnScoresSource,
-    "espn_summary": EspnSummarySource,
-    "f1_ergast": F1ErgastSource,
+
+ENTRY_POINT_GROUP = "termdash.sources"
+
+# Targets are imported on first use so a config only pays for the sources it
+# names (e.g. an MCP-only dashboard never imports feedparser or httpx).
+SOURCE_REGISTRY: dict[str, str | type[DataSource]] = {
+    "open_meteo": "termdash.sources.open_meteo:OpenMeteoSource",
+    "rss": "termdash.sources.rss:RssSource",
+    "rss_ticker": "termdash.sources.rss_ticker:RssTickerSource",
+    "mcp": "termdash.sources.mcp_base:MCPSource",
+    "espn_scores": "termdash.sources.espn_scores:EspnScoresSource",
+    "espn_summary": "termdash.sources.espn_scores:EspnSummarySource",
+    "f1_ergast": "termdash.sources.f1_ergast:F1ErgastSource",
+    "stats": "termdash.sources.stats:StatsSource",
 }
 
 
 def create_source(config: SourceConfig, *, mcp_client: object | None = None) -> DataSource:
-    source_cls = SOURCE_REGISTRY.get(config.type)
+    source_cls = load_source_class(config.type)
     if source_cls is None:
         raise ValueError(f"Unknown source type: {config.type}")
 
@@ -30,3 +33,26 @@ def create_source(config: SourceConfig, *, mcp_client: object | None = None) ->
         options["client"] = mcp_client
 
     return source_cls(config.name, config.refresh_seconds, options)
+
+
+def load_source_class(type_name: str) -> type[DataSource] | None:
+    target = SOURCE_REGISTRY.get(type_name)
+    if target is None:
+        entry_point = plugin_entry_points().get(type_name)
+        if entry_point is None:
+            return None
+        target = SOURCE_REGISTRY[type_name] = entry_point.load()
+    elif isinstance(target, str):
+        module_name, attr = target.split(":", 1)
+        target = SOURCE_REGISTRY[type_name] = getattr(importlib.import_module(module_name), attr)
+    return target
+
+
+def available_source_types() -> list[str]:
+    return sorted(set(SOURCE_REGISTRY) | set(plugin_entry_points()))
+
+
+@lru_cache(maxsize=1)
+def plugin_entry_points() -> dict[str, EntryPoint]:
+    """Third-party sources advertised under ``termdash.sources``; not imported here."""
+    return {entry_point.name: entry_point for entry_point in entry_points(group=ENTRY_POINT_GROUP)}
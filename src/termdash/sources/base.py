@@ -1,14 +1,45 @@
 ﻿from __future__ import annotations
 
+from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any
+from typing import TYPE_CHECKING, Any, AsyncIterator, Iterable
+
+if TYPE_CHECKING:
+    from termdash.net.pool import HttpPool
 
 
 def now_utc() -> datetime:
     return datetime.now(timezone.utc)
 
 
+@dataclass(frozen=True)
+class Change:
+    """One entity in a source's output that changed since the previous fetch.
+
+    ``key`` is the source's stable id for it, ``kind`` a source-defined label
+    such as ``"score"``, and ``line`` the value line now showing it (empty when
+    it is no longer shown).
+    """
+
+    key: str
+    kind: str
+    line: str = ""
+
+
+@dataclass(frozen=True)
+class Row:
+    """One line of a tile.
+
+    ``key`` identifies what the row shows (a game, a headline) across polls and
+    ``style`` is a Rich style applied over the tile's status colour.
+    """
+
+    text: str
+    key: str = ""
+    style: str = ""
+
+
 @dataclass
 class DataPoint:
     title: str
@@ -16,13 +47,110 @@ class DataPoint:
     status: str = "ok"
     detail: str = ""
     updated_at: datetime = field(default_factory=now_utc)
+    stale: bool = False
+    changes: tuple[Change, ...] = ()
+    rows: tuple[Row, ...] = ()
+
+    @classmethod
+    def from_rows(cls, title: str, rows: Iterable[Row], **fields: Any) -> DataPoint:
+        """A DataPoint whose ``value`` is the rows' text, one per line."""
+        rows = tuple(rows)
+        return cls(title=title, value="\n".join(row.text for row in rows), rows=rows, **fields)
+
+    def lines(self) -> tuple[Row, ...]:
+        """The structured rows, or unkeyed rows split from ``value``."""
+        return self.rows or tuple(Row(text) for text in self.value.splitlines() or [""])
+
+    def content_key(self) -> tuple[Any, ...]:
+        """Everything a tile renders; ``updated_at`` and ``changes`` alone are not a change."""
+        return (self.title, self.value, self.status, self.detail, self.stale, self.rows)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "title": self.title,
+            "value": self.value,
+            "status": self.status,
+            "detail": self.detail,
+            "updated_at": self.updated_at.isoformat(),
+            "stale": self.stale,
+            "changes": [
+                {"key": change.key, "kind": change.kind, "line": change.line}
+                for change in self.changes
+            ],
+            "rows": [{"text": row.text, "key": row.key, "style": row.style} for row in self.rows],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> DataPoint:
+        updated_at = data.get("updated_at")
+        return cls(
+            title=str(data.get("title", "")),
+            value=str(data.get("value", "")),
+            status=str(data.get("status", "ok")),
+            detail=str(data.get("detail", "")),
+            updated_at=datetime.fromisoformat(updated_at) if updated_at else now_utc(),
+            stale=bool(data.get("stale", False)),
+            changes=tuple(
+                Change(
+                    key=str(item.get("key", "")),
+                    kind=str(item.get("kind", "")),
+                    line=str(item.get("line", "")),
+                )
+                for item in data.get("changes") or ()
+                if isinstance(item, dict)
+            ),
+            rows=tuple(
+                Row(
+                    text=str(item.get("text", "")),
+                    key=str(item.get("key", "")),
+                    style=str(item.get("style", "")),
+                )
+                for item in data.get("rows") or ()
+                if isinstance(item, dict)
+            ),
+        )
 
 
 class DataSource:
+    supports_auto_lines = False
+
     def __init__(self, name: str, refresh_seconds: int, options: dict[str, Any]) -> None:
         self.name = name
         self.refresh_seconds = refresh_seconds
         self.options = options
+        self.pool: HttpPool | None = None
 
     async def fetch(self) -> DataPoint:
         raise NotImplementedError
+
+    def poll_interval(self) -> float:
+        """Seconds until the next fetch; sources may adapt this to their data."""
+        return self.refresh_seconds
+
+    def endpoints(self) -> list[str]:
+        """Upstream URLs this source polls, used to pre-warm connections."""
+        return []
+
+    def export_state(self) -> dict[str, Any] | None:
+        """JSON-serializable state needed to resume after a restart."""
+        return None
+
+    def restore_state(self, state: dict[str, Any]) -> None:
+        pass
+
+    async def start(self, pool: HttpPool) -> None:
+        self.pool = pool
+
+    async def stop(self) -> None:
+        self.pool = None
+
+    @asynccontextmanager
+    async def http(self) -> AsyncIterator[HttpPool]:
+        if self.pool is not None:
+            yield self.pool
+            return
+
+        from termdash.net.pool import HttpPool
+
+        async with HttpPool() as pool:
+            yield pool
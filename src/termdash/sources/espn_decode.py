@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+_EMPTY: dict[str, Any] = {}
+
+
+@dataclass(frozen=True, slots=True)
+class Team:
+    abbr: str
+    name: str
+    score: str
+
+
+@dataclass(frozen=True, slots=True)
+class Game:
+    """The fields the ESPN tiles use from one scoreboard event."""
+
+    event_id: str
+    state: str
+    detail: str
+    home: Team | None
+    away: Team | None
+    last_play: str
+    start: float | None
+    period: int = 0
+
+
+def parse_scoreboard(content: bytes) -> list[Game]:
+    """Parse callable for ``HttpPool.get_parsed``; the raw payload is dropped once decoded."""
+    return decode_scoreboard(json.loads(content))
+
+
+def decode_scoreboard(payload: Any) -> list[Game]:
+    events = _dict(payload).get("events")
+    if not isinstance(events, list):
+        return []
+    games: list[Game] = []
+    for event in events:
+        game = _decode_event(event)
+        if game is not None:
+            games.append(game)
+    return games
+
+
+def _decode_event(event: Any) -> Game | None:
+    if not isinstance(event, dict):
+        return None
+    competitions = event.get("competitions")
+    if not competitions or not isinstance(competitions, list):
+        return None
+    competition = _dict(competitions[0])
+    status_block = _dict(competition.get("status"))
+    status = _dict(status_block.get("type"))
+
+    home = away = None
+    competitors = competition.get("competitors")
+    if isinstance(competitors, list):
+        for competitor in competitors:
+            side = _dict(competitor).get("homeAway")
+            if side == "home":
+                home = _decode_team(competitor)
+            elif side == "away":
+                away = _decode_team(competitor)
+
+    return Game(
+        event_id=str(event.get("id") or competition.get("id") or ""),
+        state=str(status.get("state") or ""),
+        detail=str(status.get("shortDetail") or status.get("detail") or ""),
+        home=home,
+        away=away,
+        last_play=_last_play(competition),
+        start=_start_time(event.get("date")) or _start_time(competition.get("date")),
+        period=_int(status_block.get("period")),
+    )
+
+
+def _decode_team(competitor: dict[str, Any]) -> Team:
+    team = _dict(competitor.get("team"))
+    abbr = team.get("abbreviation") or team.get("shortDisplayName") or team.get("displayName")
+    name = team.get("displayName") or team.get("name") or abbr or "TBD"
+    return Team(abbr=str(abbr or "TBD"), name=str(name), score=str(competitor.get("score", "0")))
+
+
+def _last_play(competition: dict[str, Any]) -> str:
+    text = _dict(_dict(competition.get("situation")).get("lastPlay")).get("text")
+    if text:
+        return str(text)
+    return str(_dict(competition.get("lastPlay")).get("text", "")).strip()
+
+
+def _start_time(value: Any) -> float | None:
+    if not isinstance(value, str) or not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None
+
+
+def _int(value: Any) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return 0
+
+
+def _dict(value: Any) -> dict[str, Any]:
+    return value if isinstance(value, dict) else _EMPTY
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from termdash.sources.espn_decode import Game
+
+CHANGE_KINDS = ("started", "ended", "score", "period")
+
+
+@dataclass(frozen=True, slots=True)
+class GameChange:
+    kind: str
+    game: Game
+    previous: Game
+
+    @property
+    def event_id(self) -> str:
+        return self.game.event_id
+
+
+class GameTracker:
+    """Last seen state of each game in one scoreboard, keyed by ESPN event id.
+
+    ``update`` reports what changed since the previous scoreboard. A scoreboard
+    object seen last time (a league that was not due, or a 304 from the
+    validation cache) is skipped outright, and unchanged games cost one
+    comparison each. Games seen for the first time produce no change.
+    """
+
+    def __init__(self) -> None:
+        self._games: dict[str, Game] = {}
+        self._last: list[Game] | None = None
+
+    def update(self, games: list[Game]) -> list[GameChange]:
+        if games is self._last:
+            return []
+        self._last = games
+        previous_games = self._games
+        current: dict[str, Game] = {}
+        changes: list[GameChange] = []
+        for game in games:
+            if not game.event_id:
+                continue
+            current[game.event_id] = game
+            previous = previous_games.get(game.event_id)
+            if previous is not None and previous != game:
+                changes.extend(diff_game(previous, game))
+        # Games that dropped off the scoreboard are forgotten.
+        self._games = current
+        return changes
+
+    def __len__(self) -> int:
+        return len(self._games)
+
+
+def diff_game(previous: Game, game: Game) -> list[GameChange]:
+    changes: list[GameChange] = []
+    if previous.state != game.state:
+        if game.state == "in":
+            changes.append(GameChange("started", game, previous))
+        elif game.state == "post":
+            changes.append(GameChange("ended", game, previous))
+    if _scores(previous) != _scores(game):
+        changes.append(GameChange("score", game, previous))
+    # The first period arrives with the start; only later periods are news.
+    if previous.period != game.period and previous.state == game.state == "in":
+        changes.append(GameChange("period", game, previous))
+    return changes
+
+
+def _scores(game: Game) -> tuple[str | None, str | None]:
+    return (
+        game.home.score if game.home else None,
+        game.away.score if game.away else None,
+    )
@@ -1,12 +1,25 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Any
+import time
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, TypeVar
 
-import httpx
+from termdash.sources.base import Change, DataPoint, DataSource, Row
+from termdash.sources.espn_decode import Game, Team, parse_scoreboard
+from termdash.sources.espn_diff import GameTracker
 
-from termdash.sources.base import DataPoint, DataSource
+if TYPE_CHECKING:
+    from termdash.net.pool import HttpPool
 
+T = TypeVar("T")
+
+# League key, its games, and the rows shown for them (keyed by event id).
+_LeagueBoard = tuple[str, list[Game], list[Row]]
+
+SCOREBOARD_URL = "https://site.web.api.espn.com/apis/v2/sports/{sport}/{league}/scoreboard"
+
+DEFAULT_IDLE_REFRESH_SECONDS = 3600
+DEFAULT_PREGAME_LEAD_SECONDS = 300
 
 PRESETS = {
     "all_major": [
@@ -20,7 +33,71 @@ PRESETS = {
 }
 
 
-class EspnScoresSource(DataSource):
+class _EspnSource(DataSource):
+    """Polls each league's scoreboard on a cadence driven by its contents.
+
+    Leagues with live games refresh every ``live_refresh_seconds``; leagues
+    with only scheduled games sleep until ``pregame_lead_seconds`` before the
+    earliest start; leagues with nothing on refresh every
+    ``idle_refresh_seconds``. Leagues that are not due reuse their last result.
+    """
+
+    def __init__(self, name: str, refresh_seconds: int, options: dict[str, Any]) -> None:
+        super().__init__(name, refresh_seconds, options)
+        self._due: dict[str, float] = {}
+        self._results: dict[str, Any] = {}
+
+    def endpoints(self) -> list[str]:
+        return _scoreboard_urls(self.options)
+
+    def poll_interval(self) -> float:
+        if not self._due:
+            return self.refresh_seconds
+        return max(1.0, min(self._due.values()) - time.time())
+
+    async def _gather_leagues(
+        self,
+        leagues: list[dict[str, Any]],
+        handler: Callable[[HttpPool, dict[str, Any]], Awaitable[T]],
+    ) -> list[T]:
+        now = time.time()
+        due = [league for league in leagues if self._due.get(_league_key(league), 0) <= now]
+        if due:
+            for league in due:
+                self._due[_league_key(league)] = now + self.refresh_seconds
+            async with self.http() as http:
+                results = await asyncio.gather(
+                    *(handler(http, league) for league in due), return_exceptions=True
+                )
+            for league, result in zip(due, results):
+                key = _league_key(league)
+                if isinstance(result, Exception):
+                    self._results.pop(key, None)
+                else:
+                    self._results[key] = result
+
+        keys = [_league_key(league) for league in leagues]
+        return [self._results[key] for key in keys if key in self._results]
+
+    async def _scoreboard(self, http: HttpPool, sport: str, league_code: str) -> list[Game]:
+        url = SCOREBOARD_URL.format(sport=sport, league=league_code)
+        games = await http.get_parsed(url, parse_scoreboard)
+        delay = _next_poll_delay(
+            games,
+            time.time(),
+            live=float(self.options.get("live_refresh_seconds", self.refresh_seconds)),
+            idle=float(self.options.get("idle_refresh_seconds", DEFAULT_IDLE_REFRESH_SECONDS)),
+            lead=float(self.options.get("pregame_lead_seconds", DEFAULT_PREGAME_LEAD_SECONDS)),
+        )
+        self._due[f"{sport}/{league_code}"] = time.time() + delay
+        return games
+
+
+class EspnScoresSource(_EspnSource):
+    def __init__(self, name: str, refresh_seconds: int, options: dict[str, Any]) -> None:
+        super().__init__(name, refresh_seconds, options)
+        self._trackers: dict[str, GameTracker] = {}
+
     async def fetch(self) -> DataPoint:
         leagues = _resolve_leagues(self.options)
         if not leagues:
@@ -30,64 +107,58 @@ class EspnScoresSource(DataSource):
         show_only_favorites = bool(self.options.get("show_only_favorites", False))
         highlight_favorites = bool(self.options.get("highlight_favorites", True))
 
-        async with httpx.AsyncClient(timeout=10) as client:
-            tasks = [
-                self._fetch_league(
-                    client,
-                    league,
-                    favorites=favorites,
-                    show_only_favorites=show_only_favorites,
-                    highlight_favorites=highlight_favorites,
+        async def handler(http: HttpPool, league: dict[str, Any]) -> _LeagueBoard:
+            return await self._fetch_league(
+                http,
+                league,
+                favorites=favorites,
+                show_only_favorites=show_only_favorites,
+                highlight_favorites=highlight_favorites,
+            )
+
+        results = await self._gather_leagues(leagues, handler)
+
+        all_rows: list[Row] = []
+        changes: list[Change] = []
+        for key, games, rows in results:
+            all_rows.extend(rows)
+            tracker = self._trackers.setdefault(key, GameTracker())
+            game_changes = tracker.update(games)
+            if game_changes:
+                shown = {row.key: row.text for row in rows}
+                changes.extend(
+                    Change(change.event_id, change.kind, shown.get(change.event_id, ""))
+                    for change in game_changes
                 )
-                for league in leagues
-            ]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
 
-        lines: list[str] = []
-        for result in results:
-            if isinstance(result, Exception):
-                continue
-            lines.extend(result)
-
-        if not lines:
+        if not all_rows:
             return DataPoint(title=self.name, value="No live games", status="ok")
 
-        return DataPoint(title=self.name, value="\n".join(lines), status="ok")
+        return DataPoint.from_rows(self.name, all_rows, status="ok", changes=tuple(changes))
 
     async def _fetch_league(
         self,
-        client: httpx.AsyncClient,
+        http: HttpPool,
         league: dict[str, Any],
         *,
         favorites: dict[str, set[str]],
         show_only_favorites: bool,
         highlight_favorites: bool,
-    ) -> list[str]:
+    ) -> _LeagueBoard:
         sport = league.get("sport")
         league_code = league.get("league")
         label = league.get("label", league_code or sport or "league").upper()
         if not sport or not league_code:
-            return [f"{label}: missing sport/league config"]
+            return _league_key(league), [], [Row(f"{label}: missing sport/league config")]
 
-        url = f"https://site.web.api.espn.com/apis/v2/sports/{sport}/{league_code}/scoreboard"
-        response = await client.get(url)
-        response.raise_for_status()
-        payload = response.json()
+        games = await self._scoreboard(http, sport, league_code)
 
-        events = payload.get("events", []) or []
-        lines: list[str] = []
+        rows: list[Row] = []
         fav_set = _favorite_set_for_league(favorites, league_code, label)
-        for event in events:
-            competitions = event.get("competitions", []) or []
-            if not competitions:
-                continue
-            competition = competitions[0]
-            status = (competition.get("status", {}) or {}).get("type", {}) or {}
-            if status.get("state") != "in":
+        for game in games:
+            if game.state != "in":
                 continue
-
-            short_detail = status.get("shortDetail") or status.get("detail") or ""
-            home, away = _extract_competitors(competition.get("competitors", []) or [])
+            home, away = game.home, game.away
             if not home or not away:
                 continue
 
@@ -95,84 +166,84 @@ class EspnScoresSource(DataSource):
             if show_only_favorites and not is_favorite:
                 continue
 
-            line = f"{label}: {away['abbr']} {away['score']} @ {home['abbr']} {home['score']}"
-            if short_detail:
-                line += f" ({short_detail})"
-            last_play = _extract_last_play(competition)
-            if last_play:
-                line += f" | Last: {last_play}"
+            line = f"{label}: {away.abbr} {away.score} @ {home.abbr} {home.score}"
+            if game.detail:
+                line += f" ({game.detail})"
+            if game.last_play:
+                line += f" | Last: {game.last_play}"
+            style = ""
             if highlight_favorites and is_favorite:
                 line += " [fav]"
-            lines.append(line)
+                style = "bold"
+            rows.append(Row(line, key=game.event_id, style=style))
 
-        return lines
+        return _league_key(league), games, rows
 
 
-class EspnSummarySource(DataSource):
+class EspnSummarySource(_EspnSource):
     async def fetch(self) -> DataPoint:
         leagues = _resolve_leagues(self.options)
         if not leagues:
             return DataPoint(title=self.name, value="No leagues configured", status="error")
 
-        async with httpx.AsyncClient(timeout=10) as client:
-            tasks = [self._count_league(client, league) for league in leagues]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+        results = await self._gather_leagues(leagues, self._count_league)
 
-        lines: list[str] = []
+        rows: list[Row] = []
         total = 0
         for result in results:
-            if isinstance(result, Exception):
-                continue
             label, count = result
             total += count
-            lines.append(f"{label}: {count}")
+            rows.append(Row(f"{label}: {count}", key=label))
 
-        if not lines:
+        if not rows:
             return DataPoint(title=self.name, value="No data", status="warn")
 
-        lines.insert(0, f"Live games: {total}")
-        return DataPoint(title=self.name, value="\n".join(lines), status="ok")
+        rows.insert(0, Row(f"Live games: {total}", key="total", style="bold"))
+        return DataPoint.from_rows(self.name, rows, status="ok")
 
-    async def _count_league(self, client: httpx.AsyncClient, league: dict[str, Any]) -> tuple[str, int]:
+    async def _count_league(self, http: HttpPool, league: dict[str, Any]) -> tuple[str, int]:
         sport = league.get("sport")
         league_code = league.get("league")
         label = league.get("label", league_code or sport or "league").upper()
         if not sport or not league_code:
             return label, 0
 
-        url = f"https://site.web.api.espn.com/apis/v2/sports/{sport}/{league_code}/scoreboard"
-        response = await client.get(url)
-        response.raise_for_status()
-        payload = response.json()
+        games = await self._scoreboard(http, sport, league_code)
+        return label, sum(1 for game in games if game.state == "in")
+
+
+def _scoreboard_urls(options: dict[str, Any]) -> list[str]:
+    urls: list[str] = []
+    for league in _resolve_leagues(options):
+        sport = league.get("sport")
+        league_code = league.get("league")
+        if sport and league_code:
+            urls.append(SCOREBOARD_URL.format(sport=sport, league=league_code))
+    return urls
 
-        events = payload.get("events", []) or []
-        count = 0
-        for event in events:
-            competitions = event.get("competitions", []) or []
-            if not competitions:
-                continue
-            competition = competitions[0]
-            status = (competition.get("status", {}) or {}).get("type", {}) or {}
-            if status.get("state") == "in":
-                count += 1
-
-        return label, count
-
-
-def _extract_competitors(competitors: list[dict[str, Any]]):
-    home = None
-    away = None
-    for item in competitors:
-        team = item.get("team", {}) or {}
-        abbr = team.get("abbreviation") or team.get("shortDisplayName") or team.get("displayName")
-        name = team.get("displayName") or team.get("name") or abbr or "TBD"
-        score = item.get("score", "0")
-        entry = {"abbr": abbr or "TBD", "score": score, "name": name}
-        if item.get("homeAway") == "home":
-            home = entry
-        elif item.get("homeAway") == "away":
-            away = entry
-    return home, away
+
+def _league_key(league: dict[str, Any]) -> str:
+    return f"{league.get('sport')}/{league.get('league')}"
+
+
+def _next_poll_delay(
+    games: list[Game], now: float, *, live: float, idle: float, lead: float
+) -> float:
+    earliest_start: float | None = None
+    for game in games:
+        if game.state == "in":
+            return live
+        if game.state != "pre":
+            continue
+        if game.start is None:
+            # Scheduled game with an unknown start: keep an eye on it.
+            return live
+        if earliest_start is None or game.start < earliest_start:
+            earliest_start = game.start
+
+    if earliest_start is None:
+        return idle
+    return min(idle, max(live, earliest_start - lead - now))
 
 
 def _resolve_leagues(options: dict[str, Any]) -> list[dict[str, Any]]:
@@ -201,22 +272,12 @@ def _favorite_set_for_league(favorites: dict[str, set[str]], league_code: str, l
     return combined
 
 
-def _match_favorite(home: dict[str, Any], away: dict[str, Any], favorites: set[str]) -> bool:
+def _match_favorite(home: Team, away: Team, favorites: set[str]) -> bool:
     if not favorites:
         return False
     for team in (home, away):
-        if team["abbr"].lower() in favorites:
+        if team.abbr.lower() in favorites:
             return True
-        if team["name"].lower() in favorites:
+        if team.name.lower() in favorites:
             return True
     return False
-
-
-def _extract_last_play(competition: dict[str, Any]) -> str:
-    situation = competition.get("situation", {}) or {}
-    last_play = situation.get("lastPlay", {}) or {}
-    text = last_play.get("text")
-    if text:
-        return str(text)
-    alt = competition.get("lastPlay", {}) or {}
-    return str(alt.get("text", "")).strip()
@@ -1,17 +1,23 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from typing import Any
-
-import httpx
+from typing import TYPE_CHECKING, Any
 
 from termdash.sources.base import DataPoint, DataSource
 
+if TYPE_CHECKING:
+    from termdash.net.pool import HttpPool
+
+ERGAST_URL = "http://ergast.com/api/f1/current/{which}.json"
+
 
 class F1ErgastSource(DataSource):
+    def endpoints(self) -> list[str]:
+        return [ERGAST_URL.format(which="next")]
+
     async def fetch(self) -> DataPoint:
-        async with httpx.AsyncClient(timeout=10) as client:
-            next_race = await _fetch_race(client, "next")
+        async with self.http() as http:
+            next_race = await _fetch_race(http, "next")
 
         if not next_race:
             return DataPoint(title=self.name, value="No race data", status="warn")
@@ -30,11 +36,8 @@ class F1ErgastSource(DataSource):
         return DataPoint(title=self.name, value=value, status="ok")
 
 
-async def _fetch_race(client: httpx.AsyncClient, which: str) -> dict[str, Any] | None:
-    url = f"http://ergast.com/api/f1/current/{which}.json"
-    response = await client.get(url)
-    response.raise_for_status()
-    data = response.json()
+async def _fetch_race(http: HttpPool, which: str) -> dict[str, Any] | None:
+    data = await http.get_json(ERGAST_URL.format(which=which))
 
     race_table = (
         data.get("MRData", {})
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import sys
+from typing import Any, Iterable
+
+ITEM_FIELDS = ("title", "link", "source", "published")
+
+
+class FeedItem:
+    """One headline with the derived fields filtering needs computed up front.
+
+    Source names and domains repeat across items and tiles, so they are
+    interned. ``fingerprint`` hashes the four feed fields and lets whole feed
+    sets be compared without walking them.
+    """
+
+    __slots__ = (
+        "title",
+        "link",
+        "source",
+        "published",
+        "domain",
+        "title_key",
+        "source_key",
+        "fingerprint",
+    )
+
+    def __init__(self, title: str, link: str = "", source: str = "", published: str = "") -> None:
+        self.title = title
+        self.link = link
+        self.source = sys.intern(source)
+        self.published = published
+        self.domain = sys.intern(_domain_from_link(link))
+        self.title_key = title.lower().strip()
+        self.source_key = sys.intern(source.lower())
+        self.fingerprint = hash((title, link, source, published))
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Rebuild on unpickle so strings crossing from a worker process are re-interned.
+        return FeedItem, (self.title, self.link, self.source, self.published)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, FeedItem):
+            return NotImplemented
+        return self.fingerprint == other.fingerprint and self.to_dict() == other.to_dict()
+
+    def __hash__(self) -> int:
+        return self.fingerprint
+
+    def __repr__(self) -> str:
+        return f"FeedItem(title={self.title!r}, source={self.source!r})"
+
+    def to_dict(self) -> dict[str, str]:
+        return {
+            "title": self.title,
+            "link": self.link,
+            "source": self.source,
+            "published": self.published,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> FeedItem:
+        return cls(*(str(data.get(key, "") or "") for key in ITEM_FIELDS))
+
+
+def fingerprint(items: Iterable[FeedItem]) -> int:
+    """Order-sensitive hash of a feed set, folded from the per-item fingerprints."""
+    value = 0
+    for item in items:
+        value = hash((value, item.fingerprint))
+    return value
+
+
+def _domain_from_link(link: str) -> str:
+    if "://" not in link:
+        return ""
+    domain = link.split("://", 1)[1].split("/", 1)[0]
+    return domain.lower()
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from functools import cached_property, lru_cache
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from termdash.sources.feed_item import FeedItem
+
+RULE_OPTIONS = (
+    "include_keywords",
+    "exclude_keywords",
+    "block_sources",
+    "only_sources",
+    "prefer_sources",
+)
+
+# Distinct source names and domains seen per rule set; real feeds repeat a
+# few dozen outlets, so this only bounds pathological inputs.
+MAX_VERDICTS = 4096
+
+
+@dataclass(frozen=True)
+class FeedRules:
+    include_keywords: tuple[str, ...] = ()
+    exclude_keywords: tuple[str, ...] = ()
+    block_sources: tuple[str, ...] = ()
+    only_sources: tuple[str, ...] = ()
+    prefer_sources: tuple[str, ...] = ()
+    dedupe: bool = True
+
+    @classmethod
+    def from_options(cls, options: dict[str, Any]) -> FeedRules:
+        """Rules for ``options``; unchanged option values return the same instance."""
+        key = tuple(_freeze(options.get(name)) for name in RULE_OPTIONS)
+        return _rules_from_key(key, bool(options.get("dedupe", True)))
+
+    @cached_property
+    def matcher(self) -> RuleMatcher:
+        return RuleMatcher(self)
+
+    def accepts(self, item: FeedItem) -> bool:
+        return self.matcher.accepts(item.title_key, item.source_key, item.domain)
+
+    def prefer_rank(self, item: FeedItem) -> int:
+        return self.matcher.prefer_rank(item.source_key, item.link.lower())
+
+
+class RuleMatcher:
+    """FeedRules compiled to one regex per list plus a per-source verdict table.
+
+    Keyword lists become a single alternation searched once per title. Source
+    rules match by substring against both the source name and the link's
+    domain; since both repeat across items, each distinct string is matched
+    once and its verdict looked up afterwards.
+    """
+
+    __slots__ = (
+        "include",
+        "exclude",
+        "block",
+        "only",
+        "prefer",
+        "_ranks",
+        "_prefer_miss",
+        "_verdicts",
+    )
+
+    def __init__(self, rules: FeedRules) -> None:
+        self.include = _alternation(rules.include_keywords)
+        self.exclude = _alternation(rules.exclude_keywords)
+        self.block = _alternation(rules.block_sources)
+        self.only = _alternation(rules.only_sources)
+        # A lookahead reports, at every position, the first listed preference
+        # starting there, so the best rank is the minimum over all positions.
+        self.prefer = _alternation(rules.prefer_sources, lookahead=True)
+        self._ranks: dict[str, int] = {}
+        for rank, token in enumerate(rules.prefer_sources):
+            self._ranks.setdefault(token, rank)
+        self._prefer_miss = len(rules.prefer_sources) + 1
+        self._verdicts: dict[str, tuple[bool, bool]] = {}
+
+    def accepts(self, title: str, source: str, domain: str) -> bool:
+        """Match already lowercased fields."""
+        if self.include is not None and self.include.search(title) is None:
+            return False
+        if self.exclude is not None and self.exclude.search(title) is not None:
+            return False
+        if self.block is None and self.only is None:
+            return True
+        source_blocked, source_allowed = self._verdict(source)
+        domain_blocked, domain_allowed = self._verdict(domain)
+        if source_blocked or domain_blocked:
+            return False
+        return self.only is None or source_allowed or domain_allowed
+
+    def prefer_rank(self, source: str, link: str) -> int:
+        if self.prefer is None:
+            return self._prefer_miss
+        hits = self.prefer.findall(f"{source}\x00{link}")
+        if not hits:
+            return self._prefer_miss
+        return min(self._ranks[hit] for hit in hits)
+
+    def _verdict(self, text: str) -> tuple[bool, bool]:
+        verdict = self._verdicts.get(text)
+        if verdict is None:
+            verdict = (
+                self.block is not None and self.block.search(text) is not None,
+                self.only is not None and self.only.search(text) is not None,
+            )
+            if len(self._verdicts) < MAX_VERDICTS:
+                self._verdicts[text] = verdict
+        return verdict
+
+
+@lru_cache(maxsize=64)
+def _rules_from_key(key: tuple[Any, ...], dedupe: bool) -> FeedRules:
+    values = dict(zip(RULE_OPTIONS, key))
+    return FeedRules(
+        include_keywords=_normalize_list(values["include_keywords"]),
+        exclude_keywords=_normalize_list(values["exclude_keywords"]),
+        block_sources=_normalize_list(values["block_sources"]),
+        only_sources=_normalize_list(values["only_sources"]),
+        prefer_sources=_normalize_list(values["prefer_sources"]),
+        dedupe=dedupe,
+    )
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, list):
+        return tuple(str(item) for item in value)
+    if isinstance(value, str) or not value:
+        return value or None
+    return ()
+
+
+def _normalize_list(value: Any) -> tuple[str, ...]:
+    if not value:
+        return ()
+    if isinstance(value, str):
+        return (value.strip().lower(),)
+    if isinstance(value, tuple):
+        return tuple(str(item).strip().lower() for item in value if str(item).strip())
+    return ()
+
+
+def _alternation(tokens: tuple[str, ...], *, lookahead: bool = False) -> re.Pattern[str] | None:
+    if not tokens:
+        return None
+    pattern = "|".join(re.escape(token) for token in dict.fromkeys(tokens))
+    return re.compile(f"(?=({pattern}))" if lookahead else pattern)
+
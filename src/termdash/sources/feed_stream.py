@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from typing import Iterator
+from xml.etree.ElementTree import Element, ParseError, XMLPullParser
+
+CHUNK_SIZE = 16 * 1024
+
+ITEM_TAGS = {"item", "entry"}
+PUBLISHED_TAGS = ("pubDate", "published", "updated", "date")
+
+
+class FeedStreamError(ValueError):
+    """Raised when a feed is not well-formed XML; callers fall back to feedparser."""
+
+
+def iter_feed_items(content: bytes) -> Iterator[dict[str, str]]:
+    """Yield title/link/source/published for each RSS item or Atom entry.
+
+    The body is fed to an incremental XML parser in chunks and each item is
+    detached from its parent once extracted, so memory stays bounded by one
+    item and a consumer that stops iterating early never parses the rest of
+    the document.
+    """
+    parser = XMLPullParser(events=("start", "end"))
+    open_elements: list[Element] = []
+    depth = 0
+    try:
+        for offset in range(0, len(content), CHUNK_SIZE):
+            parser.feed(content[offset : offset + CHUNK_SIZE])
+            for event, element in parser.read_events():
+                if event == "start":
+                    open_elements.append(element)
+                    if _local(element.tag) in ITEM_TAGS:
+                        depth += 1
+                    continue
+                open_elements.pop()
+                if _local(element.tag) not in ITEM_TAGS:
+                    continue
+                depth -= 1
+                if depth:
+                    continue
+                item = _extract(element)
+                if open_elements:
+                    open_elements[-1].remove(element)
+                yield item
+        parser.close()
+    except ParseError as exc:
+        raise FeedStreamError(str(exc)) from exc
+
+
+def _extract(element: Element) -> dict[str, str]:
+    fields: dict[str, Element] = {}
+    links: list[Element] = []
+    for child in element:
+        name = _local(child.tag)
+        if name == "link":
+            links.append(child)
+        else:
+            fields.setdefault(name, child)
+
+    title = _text(fields.get("title")) or "Untitled"
+    published = next(
+        (_text(fields[name]) for name in PUBLISHED_TAGS if name in fields), ""
+    )
+    return {
+        "title": title,
+        "link": _link(links),
+        "source": _source(fields.get("source")),
+        "published": published,
+    }
+
+
+def _link(links: list[Element]) -> str:
+    for link in links:
+        href = link.get("href")
+        if href is None:
+            return _text(link)
+        if link.get("rel", "alternate") == "alternate":
+            return href.strip()
+    return links[0].get("href", "").strip() if links else ""
+
+
+def _source(element: Element | None) -> str:
+    if element is None:
+        return ""
+    for child in element:
+        if _local(child.tag) == "title":
+            return _text(child)
+    return _text(element)
+
+
+def _text(element: Element | None) -> str:
+    if element is None:
+        return ""
+    return "".join(element.itertext()).strip()
+
+
+def _local(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1] if "}" in tag else tag
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import random
+import re
+import sys
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+from termdash.sources.feed_item import FeedItem
+
+NUM_PERM = 32
+DEFAULT_THRESHOLD = 0.6
+DEFAULT_MAX_ENTRIES = 2000
+# Per-word permuted hashes are cached; headline vocabulary repeats heavily.
+MAX_CACHED_WORDS = 20000
+# Chance that a pair exactly at the threshold shares at least one band.
+TARGET_RECALL = 0.9
+
+# One salt per MinHash permutation; hash((salt, word)) stands in for a random
+# permutation of the word hashes and costs a single tuple hash.
+_SALTS = random.Random(0x7E2D).sample(range(1 << 30), NUM_PERM)
+_WORD = re.compile(r"[a-z0-9]+")
+# Words nearly every headline has would put unrelated titles in the same buckets.
+STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in is it its of on or that the this to "
+    "was were will with after over new says".split()
+)
+
+
+@dataclass(slots=True)
+class _Entry:
+    shingles: tuple[str, ...]
+    bands: tuple[int, ...]
+    cluster: int
+
+
+class NearDuplicateIndex:
+    """Groups headlines whose word sets overlap by at least ``threshold`` (Jaccard).
+
+    Each title gets a MinHash signature which is split into LSH bands, so a
+    lookup only computes the exact similarity against titles sharing a band
+    instead of every title seen. Titles are remembered across refreshes up to
+    ``max_entries``, least recently seen first out, and a title seen before
+    costs one dict lookup.
+    """
+
+    def __init__(
+        self, threshold: float = DEFAULT_THRESHOLD, max_entries: int = DEFAULT_MAX_ENTRIES
+    ) -> None:
+        self.threshold = threshold
+        self.max_entries = max(1, max_entries)
+        self.bands, self.rows = _band_layout(threshold, NUM_PERM)
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._buckets: dict[int, list[str]] = {}
+        self._word_hashes: dict[str, tuple[int, ...]] = {}
+        self._next_cluster = 0
+
+    @classmethod
+    def from_options(cls, options: dict[str, Any]) -> NearDuplicateIndex | None:
+        if not options.get("near_duplicates", False):
+            return None
+        return cls(
+            threshold=float(options.get("near_duplicate_threshold", DEFAULT_THRESHOLD)),
+            max_entries=int(options.get("near_duplicate_memory", DEFAULT_MAX_ENTRIES)),
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def cluster(self, item: FeedItem) -> int:
+        """Story id shared by every near-duplicate headline of ``item``."""
+        key = item.title_key
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            return entry.cluster
+
+        shingles = _shingles(item)
+        bands = self._bands(shingles)
+        cluster = self._match(shingles, bands)
+        if cluster is None:
+            cluster = self._next_cluster
+            self._next_cluster += 1
+        self._insert(key, _Entry(tuple(shingles), bands, cluster))
+        return cluster
+
+    def _match(self, shingles: frozenset[str], bands: tuple[int, ...]) -> int | None:
+        best: _Entry | None = None
+        best_score = self.threshold
+        checked: set[str] = set()
+        for band in bands:
+            for key in self._buckets.get(band, ()):
+                if key in checked:
+                    continue
+                checked.add(key)
+                candidate = self._entries[key]
+                score = _jaccard(shingles, candidate.shingles)
+                if score >= best_score:
+                    best, best_score = candidate, score
+        return best.cluster if best is not None else None
+
+    def _insert(self, key: str, entry: _Entry) -> None:
+        self._entries[key] = entry
+        for band in entry.bands:
+            self._buckets.setdefault(band, []).append(key)
+        while len(self._entries) > self.max_entries:
+            old_key, old = self._entries.popitem(last=False)
+            for band in old.bands:
+                bucket = self._buckets[band]
+                bucket.remove(old_key)
+                if not bucket:
+                    del self._buckets[band]
+
+    def _bands(self, shingles: frozenset[str]) -> tuple[int, ...]:
+        signature = map(min, zip(*map(self._hashes, shingles)))
+        # zip(range, *[it] * rows) yields (band index, row values...) per band.
+        return tuple(map(hash, zip(range(self.bands), *[signature] * self.rows)))
+
+    def _hashes(self, word: str) -> tuple[int, ...]:
+        hashes = self._word_hashes.get(word)
+        if hashes is None:
+            if len(self._word_hashes) >= MAX_CACHED_WORDS:
+                self._word_hashes.clear()
+            hashes = tuple(hash((salt, word)) for salt in _SALTS[: self.bands * self.rows])
+            self._word_hashes[word] = hashes
+        return hashes
+
+
+def _shingles(item: FeedItem) -> frozenset[str]:
+    title = item.title_key
+    # Aggregators append " - Outlet"; the suffix says nothing about the story.
+    suffix = f" - {item.source_key}"
+    if item.source_key and title.endswith(suffix):
+        title = title[: -len(suffix)]
+    words = frozenset(map(sys.intern, _WORD.findall(title)))
+    return (words - STOPWORDS) or words or frozenset((title,))
+
+
+def _jaccard(left: frozenset[str], right: tuple[str, ...]) -> float:
+    shared = len(left.intersection(right))
+    return shared / (len(left) + len(right) - shared)
+
+
+def _band_layout(threshold: float, num_perm: int) -> tuple[int, int]:
+    """Longest bands (fewest false candidates) that still meet ``TARGET_RECALL``."""
+    for rows in range(num_perm, 1, -1):
+        bands = num_perm // rows
+        if 1 - (1 - threshold**rows) ** bands >= TARGET_RECALL:
+            return bands, rows
+    return num_perm, 1
@@ -1,19 +1,19 @@
 ﻿from __future__ import annotations
 
-from typing import Any
-
-import httpx
-
 from termdash.sources.base import DataPoint, DataSource
 
+FORECAST_URL = "https://api.open-meteo.com/v1/forecast"
+
 
 class OpenMeteoSource(DataSource):
+    def endpoints(self) -> list[str]:
+        return [FORECAST_URL]
+
     async def fetch(self) -> DataPoint:
         latitude = float(self.options.get("latitude", 0))
         longitude = float(self.options.get("longitude", 0))
         timezone = self.options.get("timezone", "auto")
 
-        url = "https://api.open-meteo.com/v1/forecast"
         params = {
             "latitude": latitude,
             "longitude": longitude,
@@ -23,10 +23,8 @@ class OpenMeteoSource(DataSource):
             "windspeed_unit": "mph",
         }
 
-        async with httpx.AsyncClient(timeout=10) as client:
-            response = await client.get(url, params=params)
-            response.raise_for_status()
-            payload = response.json()
+        async with self.http() as http:
+            payload = await http.get_json(FORECAST_URL, params=params)
 
         current = payload.get("current_weather", {})
         temperature = current.get("temperature")
@@ -1,21 +1,22 @@
 ﻿from __future__ import annotations
 
 import feedparser
-import httpx
 
 from termdash.sources.base import DataPoint, DataSource
 
 
 class RssSource(DataSource):
+    def endpoints(self) -> list[str]:
+        url = self.options.get("url")
+        return [str(url)] if url else []
+
     async def fetch(self) -> DataPoint:
         url = self.options.get("url")
         if not url:
             return DataPoint(title=self.name, value="Missing URL", status="error")
 
-        async with httpx.AsyncClient(timeout=10) as client:
-            response = await client.get(url)
-            response.raise_for_status()
-            feed = feedparser.parse(response.text)
+        async with self.http() as http:
+            feed = await http.get_parsed(url, feedparser.parse)
 
         if not feed.entries:
             return DataPoint(title=self.name, value="No entries", status="warn")
@@ -1,46 +1,198 @@
 from __future__ import annotations
 
-from typing import Any
+import asyncio
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+from urllib.parse import parse_qs, urlsplit
+
+from termdash.sources.base import DataPoint, DataSource, Row
+from termdash.sources.feed_item import FeedItem, fingerprint
+from termdash.sources.feed_rules import FeedRules
+from termdash.sources.feed_stream import FeedStreamError, iter_feed_items
+from termdash.sources.near_dup import NearDuplicateIndex
+
+if TYPE_CHECKING:
+    from termdash.net.pool import HttpPool
+    from termdash.seen import SeenStore
+
+DEFAULT_MAX_CONCURRENT_FEEDS = 4
+DEFAULT_FEED_TIMEOUT_SECONDS = 10.0
+DEFAULT_FEED_REFRESH_SECONDS = 300
+FEED_RETRY_MIN_SECONDS = 30.0
+DEFAULT_SEEN_NEW_SECONDS = 3600
+DEFAULT_SEEN_TTL_DAYS = 7
+SEEN_MODES = ("new_only", "prefer_unseen")
 
-import feedparser
-import httpx
 
-from termdash.sources.base import DataPoint, DataSource
+class RssTickerSource(DataSource):
+    """Rotates cached headlines every ``refresh_seconds``.
 
+    Feeds are downloaded on their own, longer ``feed_refresh_seconds`` cadence;
+    polls in between only advance the rotation.
+    """
+
+    supports_auto_lines = True
 
-class RssTickerSource(DataSource):
     def __init__(self, name: str, refresh_seconds: int, options: dict) -> None:
         super().__init__(name, refresh_seconds, options)
-        self._items: list[dict[str, str]] = []
+        self._items: list[FeedItem] = []
+        self._fingerprint = fingerprint(())
         self._index = 0
+        self._last_good: dict[str, list[FeedItem]] = {}
+        self._failures: list[str] = []
+        self._feeds_due = 0.0
+        self._refresh_failures = 0
+        self._near_dups = NearDuplicateIndex.from_options(options)
+
+    def endpoints(self) -> list[str]:
+        return _resolve_urls(self.options)
+
+    def export_state(self) -> dict[str, Any] | None:
+        if not self._items:
+            return None
+        return {"items": [item.to_dict() for item in self._items], "index": self._index}
+
+    def restore_state(self, state: dict[str, Any]) -> None:
+        items = state.get("items")
+        if not isinstance(items, list):
+            return
+        restored = [FeedItem.from_dict(item) for item in items if isinstance(item, dict)]
+        index = int(state.get("index", 0)) % max(1, len(restored))
+        self._items = restored
+        self._fingerprint = fingerprint(restored)
+        self._index = index
 
     async def fetch(self) -> DataPoint:
         urls = _resolve_urls(self.options)
         if not urls:
             return DataPoint(title=self.name, value="Missing URL", status="error")
 
-        async with httpx.AsyncClient(timeout=10) as client:
-            items: list[dict[str, str]] = []
-            for url in urls:
-                items.extend(await _fetch_feed(client, url))
-
-        filtered = _filter_items(items, self.options)
-        max_items = int(self.options.get("max_items", 20))
-        filtered = filtered[:max_items]
-        if not filtered:
-            return DataPoint(title=self.name, value="No entries", status="warn")
+        if time.monotonic() >= self._feeds_due:
+            await self._refresh_feeds(urls)
 
-        if filtered != self._items:
-            self._items = filtered
-            self._index = 0
+        detail = "\n".join(self._failures)
+        if not self._items:
+            return DataPoint(title=self.name, value="No entries", status="warn", detail=detail)
 
         lines = max(1, int(self.options.get("lines", 1)))
         selected = _select_items(self._items, self._index, lines)
         self._index = (self._index + lines) % len(self._items)
 
         show_source = bool(self.options.get("show_source", False))
-        rendered = [_render_item(item, show_source) for item in selected]
-        return DataPoint(title=self.name, value="\n".join(rendered), status="ok")
+        rows = [Row(_render_item(item, show_source), key=_seen_key(item)) for item in selected]
+        return DataPoint.from_rows(
+            self.name,
+            rows,
+            status="warn" if self._failures else "ok",
+            detail=detail,
+        )
+
+    async def _refresh_feeds(self, urls: list[str]) -> None:
+        refresh = float(self.options.get("feed_refresh_seconds", DEFAULT_FEED_REFRESH_SECONDS))
+        try:
+            items, failures = await self._fetch_feeds(urls)
+        except Exception as exc:  # noqa: BLE001
+            # Retry with backoff rather than on every rotation tick, and keep
+            # rotating what is cached (e.g. restored from a snapshot) if anything.
+            self._refresh_failures += 1
+            backoff = FEED_RETRY_MIN_SECONDS * 2 ** (self._refresh_failures - 1)
+            self._feeds_due = time.monotonic() + min(refresh, backoff)
+            note = f"feeds unavailable: {_describe_error(exc)}"
+            if not self._items:
+                # Until the retry, ticks show "No entries" with this note.
+                self._failures = [note]
+                raise
+            self._failures = [f"{note} (showing cached)"]
+            return
+        self._refresh_failures = 0
+        self._failures = failures
+        self._feeds_due = time.monotonic() + refresh
+
+        filtered = _filter_items(items, self.options, self._near_dups)
+        max_items = int(self.options.get("max_items", 20))
+        mode = str(self.options.get("seen", "off")).lower()
+        if mode in SEEN_MODES and filtered:
+            import sqlite3
+
+            try:
+                filtered = await asyncio.to_thread(self._apply_seen, filtered, mode, max_items)
+            except sqlite3.Error as exc:
+                self._failures.append(f"seen store: {exc}")
+        filtered = filtered[:max_items]
+        current = fingerprint(filtered)
+        if current != self._fingerprint:
+            self._items = filtered
+            self._fingerprint = current
+            self._index = 0
+
+    def _apply_seen(self, items: list[FeedItem], mode: str, max_items: int) -> list[FeedItem]:
+        """Drop or demote headlines first seen before the ``seen_new_seconds`` window.
+
+        Only the headlines kept for display are recorded, so ones that never
+        made the cut still count as unseen later. Runs in a worker thread.
+        """
+        store = self._seen_store()
+        now = time.time()
+        first_seen = store.lookup(_seen_key(item) for item in items)
+        cutoff = now - float(self.options.get("seen_new_seconds", DEFAULT_SEEN_NEW_SECONDS))
+
+        def is_new(item: FeedItem) -> bool:
+            return first_seen.get(_seen_key(item), now) >= cutoff
+
+        if mode == "new_only":
+            items = [item for item in items if is_new(item)]
+        else:
+            items = sorted(items, key=lambda item: not is_new(item))
+        items = items[:max_items]
+        store.record((_seen_key(item) for item in items), now)
+        return items
+
+    def _seen_store(self) -> SeenStore:
+        from termdash.seen import shared_seen_store
+
+        path = self.options.get("seen_db")
+        ttl_days = float(self.options.get("seen_ttl_days", DEFAULT_SEEN_TTL_DAYS))
+        return shared_seen_store(Path(path) if path else None, ttl_days * 24 * 3600)
+
+    async def _fetch_feeds(self, urls: list[str]) -> tuple[list[FeedItem], list[str]]:
+        """Fetch every feed concurrently; failed feeds fall back to their last good items.
+
+        Raises the first error only when no feed produced anything to show.
+        """
+        parser = _feed_parser(self.options)
+        slots = asyncio.Semaphore(
+            max(1, int(self.options.get("max_concurrent_feeds", DEFAULT_MAX_CONCURRENT_FEEDS)))
+        )
+        timeout = float(self.options.get("feed_timeout", DEFAULT_FEED_TIMEOUT_SECONDS))
+
+        async def fetch_one(http: HttpPool, url: str) -> list[FeedItem]:
+            async with slots:
+                return await asyncio.wait_for(http.get_parsed(url, parser), timeout)
+
+        async with self.http() as http:
+            results = await asyncio.gather(
+                *(fetch_one(http, url) for url in urls), return_exceptions=True
+            )
+
+        items: list[FeedItem] = []
+        failures: list[str] = []
+        first_error: Exception | None = None
+        for url, result in zip(urls, results):
+            if isinstance(result, Exception):
+                first_error = first_error or result
+                fallback = self._last_good.get(url)
+                note = " (showing last good)" if fallback else ""
+                failures.append(f"{_feed_label(url)}: {_describe_error(result)}{note}")
+                result = fallback or []
+            else:
+                self._last_good[url] = result
+            items.extend(result)
+
+        if first_error is not None and not items:
+            raise first_error
+        return items, failures
 
 
 def _resolve_urls(options: dict[str, Any]) -> list[str]:
@@ -53,17 +205,72 @@ def _resolve_urls(options: dict[str, Any]) -> list[str]:
     return []
 
 
-async def _fetch_feed(client: httpx.AsyncClient, url: str) -> list[dict[str, str]]:
-    response = await client.get(url)
-    response.raise_for_status()
-    feed = feedparser.parse(response.text)
-
-    items: list[dict[str, str]] = []
+@dataclass(frozen=True)
+class FeedParser:
+    """Hashable, picklable parse callable for ``HttpPool.get_parsed``.
+
+    In streaming mode the raw bytes go through an incremental XML parser that
+    stops once ``limit`` items have passed ``rules``; malformed feeds fall back
+    to feedparser. Equal parsers share cached and coalesced results.
+    """
+
+    streaming: bool = True
+    rules: FeedRules | None = None
+    limit: int | None = None
+
+    def __call__(self, content: bytes) -> list[FeedItem]:
+        if self.streaming:
+            try:
+                return self._stream(content)
+            except FeedStreamError:
+                pass
+        return _parse_with_feedparser(content)
+
+    def _stream(self, content: bytes) -> list[FeedItem]:
+        items: list[FeedItem] = []
+        accepted = 0
+        seen_titles: set[str] = set()
+        for fields in iter_feed_items(content):
+            item = FeedItem(**fields)
+            items.append(item)
+            if self.rules is None or self.limit is None:
+                continue
+            if not self.rules.accepts(item):
+                continue
+            if self.rules.dedupe:
+                if item.title_key in seen_titles:
+                    continue
+                seen_titles.add(item.title_key)
+            accepted += 1
+            if accepted >= self.limit:
+                break
+        return items
+
+
+def _feed_parser(options: dict[str, Any]) -> FeedParser:
+    if str(options.get("parser", "stream")).lower() == "feedparser":
+        return FeedParser(streaming=False)
+    rules = FeedRules.from_options(options)
+    seen = str(options.get("seen", "off")).lower() in SEEN_MODES
+    if rules.prefer_sources or options.get("near_duplicates") or seen:
+        # Preferred sources are ranked, near duplicates clustered and seen
+        # headlines dropped or demoted across every item, so nothing can be
+        # skipped.
+        return FeedParser()
+    return FeedParser(rules=rules, limit=int(options.get("max_items", 20)))
+
+
+def _parse_with_feedparser(content: bytes) -> list[FeedItem]:
+    import feedparser
+
+    feed = feedparser.parse(content)
+    items: list[FeedItem] = []
     for entry in feed.entries or []:
         title = str(entry.get("title", "Untitled")).strip()
         link = str(entry.get("link", "")).strip()
         source = _extract_source(entry)
-        items.append({"title": title, "link": link, "source": source})
+        published = str(entry.get("published", "") or entry.get("updated", "")).strip()
+        items.append(FeedItem(title, link, source, published))
     return items
 
 
@@ -74,90 +281,60 @@ def _extract_source(entry: dict[str, Any]) -> str:
     return ""
 
 
-def _filter_items(items: list[dict[str, str]], options: dict[str, Any]) -> list[dict[str, str]]:
-    include_keywords = _normalize_list(options.get("include_keywords"))
-    exclude_keywords = _normalize_list(options.get("exclude_keywords"))
-    block_sources = _normalize_list(options.get("block_sources"))
-    only_sources = _normalize_list(options.get("only_sources"))
-    prefer_sources = _normalize_list(options.get("prefer_sources"))
-    dedupe = bool(options.get("dedupe", True))
+def _filter_items(
+    items: list[FeedItem],
+    options: dict[str, Any],
+    near_dups: NearDuplicateIndex | None = None,
+) -> list[FeedItem]:
+    rules = FeedRules.from_options(options)
+    accepts = rules.matcher.accepts
 
-    filtered: list[dict[str, str]] = []
-    seen_titles: set[str] = set()
+    filtered: list[FeedItem] = []
+    seen: set[str | int] = set()
     for item in items:
-        title = item.get("title", "")
-        title_lower = title.lower()
-        source = item.get("source", "")
-        source_lower = source.lower()
-        link = item.get("link", "")
-        domain_lower = _domain_from_link(link)
-
-        if include_keywords and not _match_keywords(title_lower, include_keywords):
-            continue
-        if exclude_keywords and _match_keywords(title_lower, exclude_keywords):
-            continue
-        if block_sources and _match_source(block_sources, source_lower, domain_lower):
+        if not accepts(item.title_key, item.source_key, item.domain):
             continue
-        if only_sources and not _match_source(only_sources, source_lower, domain_lower):
-            continue
-        if dedupe:
-            key = title_lower.strip()
-            if key in seen_titles:
+        if near_dups is not None or rules.dedupe:
+            # The first headline of each story wins; later rewrites are dropped.
+            key = near_dups.cluster(item) if near_dups is not None else item.title_key
+            if key in seen:
                 continue
-            seen_titles.add(key)
+            seen.add(key)
 
         filtered.append(item)
 
-    if prefer_sources:
-        filtered.sort(key=lambda item: _prefer_rank(item, prefer_sources))
+    if rules.prefer_sources:
+        filtered.sort(key=rules.prefer_rank)
 
     return filtered
 
 
-def _prefer_rank(item: dict[str, str], prefer_sources: list[str]) -> int:
-    source = item.get("source", "").lower()
-    link = item.get("link", "").lower()
-    for i, pref in enumerate(prefer_sources):
-        if pref in source or pref in link:
-            return i
-    return len(prefer_sources) + 1
-
-
-def _normalize_list(value: Any) -> list[str]:
-    if not value:
-        return []
-    if isinstance(value, str):
-        return [value.strip().lower()]
-    if isinstance(value, list):
-        return [str(item).strip().lower() for item in value if str(item).strip()]
-    return []
-
-
-def _match_keywords(text: str, keywords: list[str]) -> bool:
-    return any(keyword in text for keyword in keywords)
+def _feed_label(url: str) -> str:
+    parts = urlsplit(url)
+    query = parse_qs(parts.query).get("q")
+    if query:
+        return f"{parts.hostname} q={query[0]}"
+    return parts.hostname or url
 
 
-def _match_source(sources: list[str], source: str, domain: str) -> bool:
-    return any(token in source or token in domain for token in sources)
+def _describe_error(exc: Exception) -> str:
+    if isinstance(exc, asyncio.TimeoutError):
+        return "timed out"
+    return str(exc) or type(exc).__name__
 
 
-def _domain_from_link(link: str) -> str:
-    if "://" not in link:
-        return ""
-    domain = link.split("://", 1)[1].split("/", 1)[0]
-    return domain.lower()
+def _seen_key(item: FeedItem) -> str:
+    return item.link or item.title_key
 
 
-def _select_items(items: list[dict[str, str]], start: int, count: int) -> list[dict[str, str]]:
-    selected: list[dict[str, str]] = []
+def _select_items(items: list[FeedItem], start: int, count: int) -> list[FeedItem]:
+    selected: list[FeedItem] = []
     for i in range(count):
         selected.append(items[(start + i) % len(items)])
     return selected
 
 
-def _render_item(item: dict[str, str], show_source: bool) -> str:
-    title = item.get("title", "Untitled")
-    source = item.get("source", "")
-    if show_source and source:
-        return f"{title} ({source})"
-    return title
+def _render_item(item: FeedItem, show_source: bool) -> str:
+    if show_source and item.source:
+        return f"{item.title} ({item.source})"
+    return item.title
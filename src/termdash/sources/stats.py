@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import math
+
+from termdash.metrics import REGISTRY, Histogram, Metrics
+from termdash.sources.base import DataPoint, DataSource, Row
+
+
+class StatsSource(DataSource):
+    """Debug tile showing this process's own metrics.
+
+    One row per source (fetch latency, errors, schedule lateness), one for
+    frame time and one per host (bytes received, parse time). Latencies are
+    histogram bucket bounds, e.g. ``p95 250ms`` means at most 250ms.
+    """
+
+    metrics: Metrics = REGISTRY
+
+    async def fetch(self) -> DataPoint:
+        rows = stats_rows(self.metrics)
+        if not rows:
+            return DataPoint(title=self.name, value="No data yet", status="ok")
+        return DataPoint.from_rows(self.name, rows, status="ok")
+
+
+def stats_rows(metrics: Metrics) -> list[Row]:
+    rows: list[Row] = []
+    for name, fetches in sorted(metrics.fetch_seconds.items()):
+        errors = metrics.fetch_errors.get(name, 0)
+        text = f"{name}: p50 {_quantile(fetches, 0.5)} p95 {_quantile(fetches, 0.95)}"
+        lateness = metrics.lateness_seconds.get(name)
+        if lateness is not None:
+            text += f" late {_quantile(lateness, 0.95)}"
+        text += f" err {errors}/{fetches.count}"
+        rows.append(Row(text, key=f"source:{name}", style="yellow" if errors else ""))
+
+    frames = metrics.frame_seconds
+    if frames.count:
+        rows.append(
+            Row(
+                f"frame: p50 {_quantile(frames, 0.5)} p95 {_quantile(frames, 0.95)}"
+                f" ({frames.count} frames)",
+                key="frame",
+            )
+        )
+
+    for host, size in sorted(metrics.response_bytes.items()):
+        text = f"{host}: {_size(size)} in {metrics.responses.get(host, 0)} responses"
+        parses = metrics.parse_seconds.get(host)
+        if parses is not None:
+            text += f", parse p95 {_quantile(parses, 0.95)}"
+        rows.append(Row(text, key=f"host:{host}", style="dim"))
+    return rows
+
+
+def _quantile(histogram: Histogram, q: float) -> str:
+    value = histogram.quantile(q)
+    if math.isinf(value):
+        return f">{_duration(histogram.buckets[-1])}"
+    return _duration(value)
+
+
+def _duration(seconds: float) -> str:
+    if seconds < 1:
+        return f"{seconds * 1000:g}ms"
+    return f"{seconds:g}s"
+
+
+def _size(size: float) -> str:
+    for unit in ("B", "KiB", "MiB"):
+        if size < 1024:
+            return f"{size:.0f}{unit}" if unit == "B" else f"{size:.1f}{unit}"
+        size /= 1024
+    return f"{size:.1f}GiB"
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import asyncio
+from types import MappingProxyType
+from typing import Iterable, Mapping
+
+from termdash.sources.base import DataPoint
+
+
+class StateStore:
+    """Versioned, copy-on-write map of tile name to latest DataPoint.
+
+    Readers take an immutable snapshot without locking; writers swap in a new
+    mapping and bump ``version`` only when a tile's visible content changed.
+    """
+
+    def __init__(self, initial: Iterable[tuple[str, DataPoint]] = ()) -> None:
+        self._data: Mapping[str, DataPoint] = MappingProxyType(dict(initial))
+        self._changed = asyncio.Event()
+        self.version = 0
+
+    def snapshot(self) -> Mapping[str, DataPoint]:
+        return self._data
+
+    def get(self, name: str) -> DataPoint | None:
+        return self._data.get(name)
+
+    def publish(self, name: str, data: DataPoint) -> bool:
+        previous = self._data.get(name)
+        if previous is not None and previous.content_key() == data.content_key():
+            return False
+
+        updated = dict(self._data)
+        updated[name] = data
+        self._data = MappingProxyType(updated)
+        self.version += 1
+        self._changed.set()
+        return True
+
+    def wake(self) -> None:
+        """Wake waiters without a state change, e.g. after a terminal resize."""
+        self._changed.set()
+
+    async def wait(self, version: int, timeout: float | None = None) -> bool:
+        """Wait until the store moves past ``version``; False on timeout."""
+        if self.version != version:
+            return True
+        self._changed.clear()
+        try:
+            await asyncio.wait_for(self._changed.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        return self.version != version
@@ -0,0 +1,56 @@
+import asyncio
+import os
+import stat
+
+from termdash.config import CacheConfig, DashboardConfig
+from termdash.daemon import DaemonServer, _bind_private, subscribe
+from termdash.sources.base import DataPoint, DataSource
+from termdash.state import StateStore
+
+
+async def _wait_for(predicate) -> None:
+    for _ in range(200):
+        if predicate():
+            return
+        await asyncio.sleep(0.01)
+
+
+async def test_attached_clients_mirror_daemon_state(tmp_path):
+    path = tmp_path / "termdash.sock"
+    config = DashboardConfig(cache=CacheConfig(enabled=False))
+    server = DaemonServer(config, [DataSource("A", 3600, {}), DataSource("B", 3600, {})], path)
+    server.store.publish("A", DataPoint(title="A", value="before attach"))
+    serving = asyncio.create_task(server._serve())
+    await _wait_for(path.exists)
+
+    clients = [StateStore(), StateStore()]
+    tasks = [asyncio.create_task(subscribe(path, store)) for store in clients]
+    await _wait_for(lambda: all(store.get("A") for store in clients))
+    server.store.publish("B", DataPoint(title="B", value="after attach"))
+    await _wait_for(lambda: all(store.get("B") for store in clients))
+
+    assert [store.get("A").value for store in clients] == ["before attach"] * 2
+    assert [store.get("B").value for store in clients] == ["after attach"] * 2
+
+    serving.cancel()
+    await asyncio.gather(serving, return_exceptions=True)
+    await _wait_for(lambda: all(store.get("A").stale for store in clients))
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+    assert not path.exists()
+    assert all(store.get("B").stale for store in clients)
+
+
+def test_socket_is_owner_only_when_bound(tmp_path):
+    path = tmp_path / "termdash.sock"
+    previous = os.umask(0o022)
+    try:
+        sock = _bind_private(path)
+    finally:
+        restored = os.umask(previous)
+    sock.close()
+
+    assert stat.S_IMODE(path.stat().st_mode) == 0o600
+    assert restored == 0o022
@@ -0,0 +1,96 @@
+from rich.console import Console
+from rich.panel import Panel
+
+from termdash.config import DashboardConfig
+from termdash.dashboard import HIGHLIGHT_STYLE, Dashboard
+from termdash.sources.base import Change, DataPoint, DataSource, Row
+
+
+def _dashboard(width: int, names=("A", "B")) -> Dashboard:
+    sources = [DataSource(name, 60, {}) for name in names]
+    dashboard = Dashboard(DashboardConfig(), sources)
+    dashboard.console = Console(width=width, height=40, record=True)
+    return dashboard
+
+
+def test_render_reuses_unchanged_tiles():
+    dashboard = _dashboard(80)
+    dashboard.store.publish("A", DataPoint(title="A", value="one"))
+
+    dashboard._render(dashboard.store.snapshot())
+    first = dict(dashboard._tile_cache)
+    dashboard.store.publish("B", DataPoint(title="B", value="two"))
+    dashboard._render(dashboard.store.snapshot())
+
+    assert dashboard._tile_cache["A"].panel is first["A"].panel
+    assert dashboard._tile_cache["B"].panel is not first["B"].panel
+
+
+def test_render_truncates_long_lines_to_tile_width():
+    dashboard = _dashboard(80)
+    dashboard.store.publish("A", DataPoint(title="A", value="x" * 200))
+
+    dashboard.console.print(dashboard._render(dashboard.store.snapshot()))
+    output = dashboard.console.export_text()
+
+    assert "x" * 35 + "…" in output
+    assert "x" * 36 not in output
+
+
+def test_score_change_highlights_only_its_line_until_expiry():
+    dashboard = _dashboard(80)
+    changes = (Change(key="401", kind="score", line="NFL: DAL 7 @ PHI 3"),)
+    data = DataPoint(title="A", value="NFL: DAL 7 @ PHI 3\nNBA: BOS 90 @ NYK 88", changes=changes)
+    dashboard.store.publish("A", data)
+
+    dashboard._render(dashboard.store.snapshot())
+    body = dashboard._tile_cache["A"].panel.renderable
+
+    assert dashboard._tile_cache["A"].highlighted
+    assert dashboard._highlight_expiry is not None
+    assert [HIGHLIGHT_STYLE in str(line.style) for line in body.renderables] == [True, False]
+
+    dashboard.config.highlight_seconds = 0
+    dashboard._render(dashboard.store.snapshot())
+    assert not dashboard._tile_cache["A"].highlighted
+    assert dashboard._highlight_expiry is None
+
+
+def test_rows_reuse_unchanged_renderables_and_truncate_by_row():
+    dashboard = _dashboard(80)
+    dashboard.sources[0].options["max_rows"] = 2
+    rows = [Row("one", key="1"), Row("two", key="2", style="bold"), Row("three", key="3")]
+    dashboard.store.publish("A", DataPoint.from_rows("A", rows))
+    dashboard._render(dashboard.store.snapshot())
+    first = dashboard._tile_cache["A"].panel.renderable.renderables
+
+    rows[0] = Row("uno", key="1")
+    dashboard.store.publish("A", DataPoint.from_rows("A", rows))
+    dashboard._render(dashboard.store.snapshot())
+    second = dashboard._tile_cache["A"].panel.renderable.renderables
+
+    assert [line.plain for line in second] == ["uno", "two", "… +1 more"]
+    assert second[0] is not first[0]
+    assert second[1] is first[1]
+    assert "bold" in str(second[1].style)
+
+
+def test_frame_renders_only_changed_tiles(monkeypatch):
+    dashboard = _dashboard(120, names=[f"T{i}" for i in range(12)])
+    for source in dashboard.sources:
+        dashboard.store.publish(source.name, DataPoint(title=source.name, value="one"))
+    dashboard.console.print(dashboard._render(dashboard.store.snapshot()))
+
+    rendered = []
+    panel_console = Panel.__rich_console__
+
+    def counting(self, console, options):
+        rendered.append(self.title)
+        return panel_console(self, console, options)
+
+    monkeypatch.setattr(Panel, "__rich_console__", counting)
+    dashboard.store.publish("T3", DataPoint(title="T3", value="two"))
+    dashboard.console.print(dashboard._render(dashboard.store.snapshot()))
+
+    assert rendered == ["T3"]
+    assert "two" in dashboard.console.export_text()
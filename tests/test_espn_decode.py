@@ -0,0 +1,57 @@
+import json
+import pickle
+
+from termdash.sources.espn_decode import Game, Team, decode_scoreboard, parse_scoreboard
+
+
+def test_decode_scoreboard_extracts_game_records():
+    payload = {
+        "events": [
+            {
+                "id": "401",
+                "date": "2026-10-17T16:00Z",
+                "competitions": [
+                    {
+                        "status": {
+                            "period": 2,
+                            "type": {"state": "in", "detail": "Q2 01:10"},
+                        },
+                        "lastPlay": {"text": " Field goal "},
+                        "competitors": [
+                            {"homeAway": "home", "score": "10", "team": {"displayName": "Home U"}},
+                            {"homeAway": "away", "team": {"abbreviation": "AWY"}},
+                        ],
+                    }
+                ],
+            },
+            {"competitions": []},
+            "not an event",
+        ]
+    }
+
+    games = decode_scoreboard(payload)
+
+    assert games == [
+        Game(
+            event_id="401",
+            state="in",
+            detail="Q2 01:10",
+            home=Team(abbr="Home U", name="Home U", score="10"),
+            away=Team(abbr="AWY", name="AWY", score="0"),
+            last_play="Field goal",
+            start=1792252800.0,
+            period=2,
+        )
+    ]
+    assert decode_scoreboard({"events": None}) == []
+
+
+def test_parsed_games_survive_a_process_boundary():
+    content = json.dumps(
+        {"events": [{"competitions": [{"status": {"type": {"state": "pre"}}}]}]}
+    ).encode()
+
+    games = parse_scoreboard(content)
+
+    assert pickle.loads(pickle.dumps(games)) == games
+    assert games[0].home is None and games[0].start is None
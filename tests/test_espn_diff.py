@@ -0,0 +1,43 @@
+from termdash.sources.espn_decode import Game, Team
+from termdash.sources.espn_diff import GameTracker
+
+
+def _game(event_id="1", state="in", home="0", away="0", period=1) -> Game:
+    return Game(
+        event_id=event_id,
+        state=state,
+        detail="",
+        home=Team("HOM", "Home", home),
+        away=Team("AWY", "Away", away),
+        last_play="",
+        start=None,
+        period=period,
+    )
+
+
+def test_tracker_reports_starts_scores_periods_and_ends():
+    tracker = GameTracker()
+    assert tracker.update([_game(state="pre", period=0), _game("2", home="3")]) == []
+
+    changes = tracker.update([_game(), _game("2", home="10", period=2)])
+    assert [(change.event_id, change.kind) for change in changes] == [
+        ("1", "started"),
+        ("2", "score"),
+        ("2", "period"),
+    ]
+    assert changes[1].previous.home.score == "3"
+
+    changes = tracker.update([_game(state="post")])
+    assert [(change.event_id, change.kind) for change in changes] == [("1", "ended")]
+    assert len(tracker) == 1
+
+
+def test_tracker_skips_a_scoreboard_it_already_saw():
+    tracker = GameTracker()
+    games = [_game()]
+    tracker.update(games)
+    games.append(_game("2"))
+
+    # The same list object means the same scoreboard (e.g. a 304 or a league not due).
+    assert tracker.update(games) == []
+    assert len(tracker) == 1
@@ -1,7 +1,10 @@
+from datetime import datetime, timedelta, timezone
+
 import respx
 from httpx import Response
 
-from termdash.sources.espn_scores import EspnScoresSource
+from termdash.sources.espn_decode import decode_scoreboard
+from termdash.sources.espn_scores import EspnScoresSource, _next_poll_delay
 
 
 @respx.mock
@@ -73,3 +76,77 @@ async def test_espn_scores_favorites_filter():
 
     assert data.status == "ok"
     assert data.value == "No live games"
+
+
+@respx.mock
+async def test_espn_scores_adapts_poll_interval_to_games():
+    start = (datetime.now(timezone.utc) + timedelta(hours=2)).strftime("%Y-%m-%dT%H:%MZ")
+    payload = {
+        "events": [
+            {
+                "date": start,
+                "competitions": [{"status": {"type": {"state": "pre"}}}],
+            }
+        ]
+    }
+    route = respx.get("https://site.web.api.espn.com/apis/v2/sports/football/nfl/scoreboard").mock(
+        return_value=Response(200, json=payload)
+    )
+
+    source = EspnScoresSource(
+        "Live Sports",
+        60,
+        {
+            "leagues": [{"label": "NFL", "sport": "football", "league": "nfl"}],
+            "pregame_lead_seconds": 600,
+            "idle_refresh_seconds": 10800,
+        },
+    )
+    await source.fetch()
+    await source.fetch()
+
+    assert route.call_count == 1
+    assert 6000 < source.poll_interval() <= 6600
+
+
+def test_next_poll_delay_by_game_state():
+    live = decode_scoreboard(
+        {"events": [{"competitions": [{"status": {"type": {"state": "in"}}}]}]}
+    )
+    final = decode_scoreboard(
+        {"events": [{"competitions": [{"status": {"type": {"state": "post"}}}]}]}
+    )
+
+    assert _next_poll_delay(live, 0, live=30, idle=3600, lead=300) == 30
+    assert _next_poll_delay(final, 0, live=30, idle=3600, lead=300) == 3600
+    assert _next_poll_delay([], 0, live=30, idle=3600, lead=300) == 3600
+
+
+@respx.mock
+async def test_espn_scores_reports_score_changes_with_their_line():
+    def payload(home_score: str) -> dict:
+        competitor = [
+            {"homeAway": "away", "score": "7", "team": {"abbreviation": "DAL"}},
+            {"homeAway": "home", "score": home_score, "team": {"abbreviation": "PHI"}},
+        ]
+        status = {"period": 2, "type": {"state": "in", "shortDetail": "Q2"}}
+        competition = {"status": status, "competitors": competitor}
+        return {"events": [{"id": "401", "competitions": [competition]}]}
+
+    route = respx.get("https://site.web.api.espn.com/apis/v2/sports/football/nfl/scoreboard")
+    route.side_effect = [Response(200, json=payload("0")), Response(200, json=payload("3"))]
+    source = EspnScoresSource(
+        "Live Sports",
+        60,
+        {
+            "leagues": [{"label": "NFL", "sport": "football", "league": "nfl"}],
+            "live_refresh_seconds": 0,
+        },
+    )
+
+    first = await source.fetch()
+    second = await source.fetch()
+
+    assert first.changes == ()
+    assert [(change.key, change.kind) for change in second.changes] == [("401", "score")]
+    assert second.changes[0].line == "NFL: DAL 7 @ PHI 3 (Q2)"
@@ -0,0 +1,66 @@
+import asyncio
+import threading
+
+import respx
+from httpx import Response
+
+from termdash.config import ExecutorConfig
+from termdash.executor import ParseExecutor
+from termdash.net.pool import HttpPool, parse_json
+
+
+def _thread_name(_content):
+    return threading.current_thread().name
+
+
+async def test_thread_executor_runs_off_loop_and_records_timing():
+    executor = ParseExecutor(ExecutorConfig(kind="thread", workers=1))
+    try:
+        name = await executor.run(_thread_name, b"")
+    finally:
+        executor.shutdown()
+
+    assert name.startswith("termdash-parse")
+    stats = executor.stats["_thread_name"]
+    assert stats.count == 1
+    assert stats.total_seconds >= 0
+
+
+async def test_process_executor_parses_json():
+    executor = ParseExecutor(ExecutorConfig(kind="process", workers=1))
+    try:
+        assert await executor.run(parse_json, b'{"a": 1}') == {"a": 1}
+    finally:
+        executor.shutdown()
+
+
+async def test_pending_tasks_are_bounded():
+    executor = ParseExecutor(ExecutorConfig(kind="inline", max_pending=1))
+    order = []
+
+    async def hold():
+        async with executor._pending:
+            order.append("held")
+            await asyncio.sleep(0.02)
+
+    holder = asyncio.create_task(hold())
+    await asyncio.sleep(0)
+    await executor.run(order.append, "parsed")
+    await holder
+
+    assert order == ["held", "parsed"]
+    assert executor.stats["list.append"].queued_seconds > 0
+
+
+@respx.mock
+async def test_pool_parses_through_executor():
+    respx.get("https://example.com/data").mock(return_value=Response(200, json={"ok": True}))
+    executor = ParseExecutor(ExecutorConfig(kind="thread", workers=1))
+
+    try:
+        async with HttpPool(executor=executor) as pool:
+            assert await pool.get_json("https://example.com/data") == {"ok": True}
+    finally:
+        executor.shutdown()
+
+    assert executor.stats["parse_json"].count == 1
@@ -0,0 +1,32 @@
+import pickle
+
+from termdash.sources.feed_item import FeedItem, fingerprint
+
+
+def test_feed_item_precomputes_filter_fields():
+    item = FeedItem(" Senate Vote ", "https://WWW.Example.com/a", "Example News")
+    other = FeedItem("Other", "https://www.example.com/b", "".join(["Example ", "News"]))
+
+    assert item.title_key == "senate vote"
+    assert item.source_key == "example news"
+    assert item.domain == "www.example.com"
+    assert item.source is other.source
+    assert item.domain is other.domain
+
+
+def test_feed_item_round_trips_through_dict_and_pickle():
+    item = FeedItem("Title", "https://a.example.com/1", "A News", "Sat, 17 Oct 2026")
+
+    restored = pickle.loads(pickle.dumps(item))
+
+    assert restored == item
+    assert restored.fingerprint == item.fingerprint
+    assert FeedItem.from_dict(item.to_dict()) == item
+
+
+def test_fingerprint_tracks_content_and_order():
+    a, b = FeedItem("A"), FeedItem("B")
+
+    assert fingerprint([a, b]) == fingerprint([FeedItem("A"), FeedItem("B")])
+    assert fingerprint([a, b]) != fingerprint([b, a])
+    assert fingerprint([a]) != fingerprint([FeedItem("A", source="Changed")])
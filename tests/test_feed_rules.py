@@ -0,0 +1,41 @@
+from termdash.sources.feed_item import FeedItem
+from termdash.sources.feed_rules import FeedRules
+
+
+def test_feed_rules_are_built_once_per_option_values():
+    options = {"block_sources": ["MSNBC"], "prefer_sources": "Fox News"}
+
+    rules = FeedRules.from_options(options)
+
+    assert rules is FeedRules.from_options(dict(options))
+    assert rules.block_sources == ("msnbc",)
+    assert rules is not FeedRules.from_options({**options, "block_sources": ["CNN"]})
+
+
+def test_feed_rules_match_substrings_of_source_and_domain():
+    rules = FeedRules(
+        include_keywords=("senate", "court"),
+        exclude_keywords=("opinion",),
+        block_sources=("msnbc", "aljazeera.com"),
+    )
+
+    def item(title: str, source: str, link: str = "") -> FeedItem:
+        return FeedItem(title, link=link, source=source)
+
+    assert rules.accepts(item("Senate vote", "Reuters", "https://www.reuters.com/a"))
+    assert not rules.accepts(item("Weather", "Reuters"))
+    assert not rules.accepts(item("Opinion: the Court", "Reuters"))
+    assert not rules.accepts(item("Senate vote", "MSNBC Live"))
+    assert not rules.accepts(item("Senate vote", "AJ", "https://www.aljazeera.com/x"))
+    only = FeedRules(only_sources=("reuters",))
+    assert only.accepts(item("Anything", "", "https://www.reuters.com/a"))
+    assert not only.accepts(item("Anything", "CNN", "https://www.cnn.com/a"))
+
+
+def test_prefer_rank_returns_first_matching_preference():
+    rules = FeedRules(prefer_sources=("fox news", "reuters", "apnews"))
+
+    assert rules.prefer_rank(FeedItem("t", "https://apnews.com/x", "Reuters")) == 1
+    assert rules.prefer_rank(FeedItem("t", "https://reuters.com", "Fox News")) == 0
+    assert rules.prefer_rank(FeedItem("t", "https://apnews.com/x", "AP")) == 2
+    assert rules.prefer_rank(FeedItem("t", "https://cnn.com", "CNN")) == 4
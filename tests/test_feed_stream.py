@@ -0,0 +1,73 @@
+import gc
+import weakref
+
+import pytest
+
+from termdash.sources.feed_stream import FeedStreamError, iter_feed_items
+from termdash.sources.rss_ticker import FeedParser, FeedRules
+
+RSS = b"""<?xml version="1.0"?>
+<rss version="2.0"><channel><title>Feed</title>
+<item><title>First &amp; best</title><link>https://a.example.com/1</link>
+<pubDate>Sat, 17 Oct 2026 12:00:00 GMT</pubDate><source url="https://a.example.com">A News</source></item>
+<item><title>Blocked</title><link>https://b.example.com/2</link><source>MSNBC</source></item>
+<item><title>Third</title><link>https://c.example.com/3</link></item>
+</channel></rss>"""
+
+ATOM = b"""<feed xmlns="http://www.w3.org/2005/Atom"><title>Feed</title>
+<entry><title>Atom entry</title><link rel="alternate" href="https://x.example.com/e"/>
+<updated>2026-10-17T12:00:00Z</updated><source><title>X Daily</title></source></entry>
+</feed>"""
+
+
+def test_iter_feed_items_reads_rss_and_atom():
+    rss = list(iter_feed_items(RSS))
+    atom = list(iter_feed_items(ATOM))
+
+    assert rss[0] == {
+        "title": "First & best",
+        "link": "https://a.example.com/1",
+        "source": "A News",
+        "published": "Sat, 17 Oct 2026 12:00:00 GMT",
+    }
+    assert [item["title"] for item in rss] == ["First & best", "Blocked", "Third"]
+    assert atom[0]["link"] == "https://x.example.com/e"
+    assert atom[0]["source"] == "X Daily"
+
+
+def test_stream_parser_stops_after_enough_accepted_items():
+    parser = FeedParser(rules=FeedRules(block_sources=("msnbc",)), limit=1)
+
+    assert [item.title for item in parser(RSS)] == ["First & best"]
+
+
+def test_malformed_feed_falls_back_to_feedparser():
+    broken = RSS.replace(b"First &amp; best", b"First &nbsp; best")
+    with pytest.raises(FeedStreamError):
+        list(iter_feed_items(broken))
+
+    items = FeedParser()(broken)
+
+    assert items[0].title.startswith("First")
+    assert items[0].source == "A News"
+
+
+def test_handled_items_are_released(monkeypatch):
+    from termdash.sources import feed_stream
+
+    extracted = []
+    extract = feed_stream._extract
+
+    def recording(element):
+        extracted.append(weakref.ref(element))
+        return extract(element)
+
+    monkeypatch.setattr(feed_stream, "_extract", recording)
+    items = "".join(f"<item><title>Item {n}</title></item>" for n in range(200))
+    stream = iter_feed_items(f"<rss><channel>{items}</channel></rss>".encode())
+    for _ in range(100):
+        next(stream)
+    gc.collect()
+
+    # Only the item just yielded may still be referenced by the generator.
+    assert sum(ref() is not None for ref in extracted) <= 1
@@ -0,0 +1,53 @@
+import asyncio
+import io
+import json
+
+from termdash.config import CacheConfig, DashboardConfig, SchedulerConfig
+from termdash.headless import HeadlessWriter
+from termdash.sources.base import DataPoint, DataSource
+
+
+class CountingSource(DataSource):
+    def __init__(self, name: str, values: list[str]) -> None:
+        super().__init__(name, 0, {})
+        self.values = values
+
+    async def fetch(self) -> DataPoint:
+        value = self.values.pop(0) if len(self.values) > 1 else self.values[0]
+        return DataPoint(title=self.name, value=value)
+
+    def poll_interval(self) -> float:
+        return 0.01
+
+
+async def test_headless_writes_one_json_line_per_change():
+    config = DashboardConfig(
+        cache=CacheConfig(enabled=False),
+        scheduler=SchedulerConfig(startup_spread_seconds=0, jitter=0),
+    )
+    output = io.StringIO()
+    writer = HeadlessWriter(config, [CountingSource("A", ["one", "one", "two"])], output)
+
+    task = asyncio.create_task(writer.run())
+    for _ in range(200):
+        if output.getvalue().count("\n") >= 2:
+            break
+        await asyncio.sleep(0.01)
+    await asyncio.sleep(0.05)
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+
+    records = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert [(record["source"], record["value"]) for record in records] == [
+        ("A", "one"),
+        ("A", "two"),
+    ]
+
+
+def test_headless_skips_placeholders_and_unchanged_points():
+    writer = HeadlessWriter(DashboardConfig(), [DataSource("A", 60, {})], io.StringIO())
+
+    assert writer._pending(writer.store.snapshot()) == []
+    writer.store.publish("A", DataPoint(title="A", value="x"))
+    assert len(writer._pending(writer.store.snapshot())) == 1
+    assert writer._pending(writer.store.snapshot()) == []
@@ -0,0 +1,49 @@
+from termdash.config import CacheConfig, DashboardConfig
+from termdash.engine import PollingEngine
+from termdash.metrics import Histogram, Metrics
+from termdash.sources.base import DataPoint, DataSource
+
+
+class FailingSource(DataSource):
+    async def fetch(self) -> DataPoint:
+        raise RuntimeError("boom")
+
+
+def test_histogram_quantiles_use_bucket_bounds():
+    histogram = Histogram((0.1, 1.0))
+    for value in (0.05, 0.05, 0.5, 5.0):
+        histogram.observe(value)
+
+    assert histogram.quantile(0.5) == 0.1
+    assert histogram.quantile(0.75) == 1.0
+    assert histogram.quantile(1.0) == float("inf")
+    assert list(histogram.cumulative()) == [("0.1", 2), ("1.0", 3), ("+Inf", 4)]
+
+
+async def test_poll_records_fetch_latency_and_errors():
+    metrics = Metrics()
+    source = FailingSource("Broken", 60, {})
+    engine = PollingEngine(DashboardConfig(cache=CacheConfig(enabled=False)), [source], metrics)
+
+    await engine._poll_once(source, None)
+
+    assert metrics.fetch_seconds["Broken"].count == 1
+    assert metrics.fetch_errors == {"Broken": 1}
+
+
+def test_textfile_is_prometheus_exposition_format(tmp_path):
+    metrics = Metrics()
+    metrics.record_fetch('a "quoted" tile', 0.2)
+    metrics.record_response("example.com", 2048)
+    metrics.record_frame(0.004)
+    path = tmp_path / "termdash.prom"
+
+    metrics.write_textfile(path)
+    text = path.read_text(encoding="utf-8")
+
+    assert "# TYPE termdash_fetch_seconds histogram" in text
+    assert 'termdash_fetch_seconds_bucket{source="a \\"quoted\\" tile",le="0.25"} 1' in text
+    assert 'termdash_fetch_seconds_count{source="a \\"quoted\\" tile"} 1' in text
+    assert 'termdash_http_response_bytes_total{host="example.com"} 2048' in text
+    assert "termdash_frame_seconds_count 1" in text
+    assert list(tmp_path.iterdir()) == [path]
@@ -0,0 +1,40 @@
+from termdash.sources.feed_item import FeedItem
+from termdash.sources.near_dup import NearDuplicateIndex
+from termdash.sources.rss_ticker import _filter_items
+
+
+def _item(title: str, source: str = "") -> FeedItem:
+    return FeedItem(f"{title} - {source}" if source else title, source=source)
+
+
+def test_rewrites_of_one_story_share_a_cluster():
+    index = NearDuplicateIndex(threshold=0.6)
+
+    first = index.cluster(_item("Senate passes budget bill after late night vote", "Reuters"))
+    rewrite = index.cluster(_item("Senate passes budget bill in late night vote", "Fox News"))
+    other = index.cluster(_item("Storm knocks out power across county schools", "CNN"))
+
+    assert first == rewrite
+    assert other != first
+
+
+def test_index_memory_is_bounded():
+    index = NearDuplicateIndex(max_entries=3)
+    for word in ("alpha", "bravo", "charlie", "delta", "echo"):
+        index.cluster(_item(f"{word} mayor announces transit plan {word}"))
+
+    assert len(index) == 3
+    assert sum(len(bucket) for bucket in index._buckets.values()) == 3 * index.bands
+
+
+def test_filter_items_keeps_first_headline_per_story():
+    items = [
+        _item("Governor signs school funding plan into law", "AP"),
+        _item("Council debates new bridge contract", "The Hill"),
+        _item("Governor signs school funding plan into law today", "CNN"),
+    ]
+
+    filtered = _filter_items(items, {}, NearDuplicateIndex())
+
+    assert [item.source for item in filtered] == ["AP", "The Hill"]
+    assert _filter_items(items, {}) == items
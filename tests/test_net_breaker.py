@@ -0,0 +1,68 @@
+import pytest
+import respx
+from httpx import Response
+
+from termdash.config import DashboardConfig, HttpConfig
+from termdash.dashboard import Dashboard
+from termdash.net.breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitOpenError
+from termdash.net.pool import HttpPool
+from termdash.sources.f1_ergast import F1ErgastSource
+
+ERGAST = "http://ergast.com/api/f1/current/next.json"
+
+
+def test_breaker_opens_probes_and_closes():
+    breaker = CircuitBreaker("example.com", failure_threshold=2, base_delay=10, jitter=0)
+
+    breaker.record_failure(now=0)
+    assert breaker.state == CLOSED
+    breaker.record_failure(now=0)
+    assert breaker.state == OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request(now=5)
+
+    breaker.before_request(now=10)
+    assert breaker.state == HALF_OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request(now=10)
+
+    breaker.record_failure(now=10)
+    assert breaker.state == OPEN
+    assert breaker.retry_at == 30
+
+    breaker.before_request(now=30)
+    breaker.record_success()
+    assert breaker.state == CLOSED
+    assert breaker.failures == 0
+
+
+@respx.mock
+async def test_pool_fails_fast_while_circuit_open():
+    route = respx.get(ERGAST).mock(return_value=Response(503))
+
+    async with HttpPool(HttpConfig(breaker_failures=2, coalesce_ttl=-1)) as pool:
+        for _ in range(2):
+            with pytest.raises(Exception):
+                await pool.get_json(ERGAST)
+        with pytest.raises(CircuitOpenError):
+            await pool.get_json(ERGAST)
+
+    assert route.call_count == 2
+
+
+@respx.mock
+async def test_poll_once_reports_breaker_state_in_detail():
+    respx.get(ERGAST).mock(return_value=Response(429, headers={"Retry-After": "120"}))
+    source = F1ErgastSource("F1 Status", 30, {})
+    dashboard = Dashboard(DashboardConfig(), [source])
+
+    async with HttpPool(HttpConfig(breaker_failures=1, coalesce_ttl=-1)) as pool:
+        await source.start(pool)
+        await dashboard.engine._poll_once(source, pool)
+        delay = await dashboard.engine._poll_once(source, pool)
+
+    data = dashboard.store.get("F1 Status")
+    assert data.status == "error"
+    assert "circuit open" in data.value
+    assert "ergast.com: circuit open, retry in" in data.detail
+    assert delay >= 100
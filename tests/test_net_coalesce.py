@@ -0,0 +1,79 @@
+import asyncio
+
+import pytest
+import respx
+from httpx import Response
+
+from termdash.net.coalesce import RequestCoalescer
+from termdash.net.pool import HttpPool
+from termdash.sources.espn_scores import EspnScoresSource, EspnSummarySource
+from termdash.sources.rss_ticker import RssTickerSource
+
+SCOREBOARD = "https://site.web.api.espn.com/apis/v2/sports/football/nfl/scoreboard"
+LEAGUES = [{"label": "NFL", "sport": "football", "league": "nfl"}]
+
+
+async def test_concurrent_callers_share_one_call():
+    calls = 0
+
+    async def factory():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return calls
+
+    coalescer = RequestCoalescer(ttl=0)
+    results = await asyncio.gather(*(coalescer.run("key", factory) for _ in range(5)))
+
+    assert results == [1] * 5
+    assert calls == 1
+    assert coalescer.stats.joined == 4
+    assert await coalescer.run("key", factory) == 2
+
+
+async def test_failures_are_shared_but_not_cached():
+    async def factory():
+        raise RuntimeError("boom")
+
+    coalescer = RequestCoalescer(ttl=60)
+    with pytest.raises(RuntimeError):
+        await coalescer.run("key", factory)
+    with pytest.raises(RuntimeError):
+        await coalescer.run("key", factory)
+    assert coalescer.stats.cache_hits == 0
+
+
+@respx.mock
+async def test_scores_and_summary_share_scoreboard_request():
+    route = respx.get(SCOREBOARD).mock(return_value=Response(200, json={"events": []}))
+
+    async with HttpPool() as pool:
+        scores = EspnScoresSource("Scores", 60, {"leagues": LEAGUES})
+        summary = EspnSummarySource("Summary", 120, {"leagues": LEAGUES})
+        await scores.start(pool)
+        await summary.start(pool)
+        await asyncio.gather(scores.fetch(), summary.fetch())
+        await summary.fetch()
+
+    assert route.call_count == 1
+
+
+@respx.mock
+async def test_tickers_with_different_options_share_feed_request():
+    items = "".join(f"<item><title>Item {n}</title></item>" for n in range(50))
+    route = respx.get("https://example.com/feed").mock(
+        return_value=Response(200, text=f'<rss version="2.0"><channel>{items}</channel></rss>')
+    )
+
+    async with HttpPool() as pool:
+        wide = RssTickerSource("Wide", 10, {"url": "https://example.com/feed", "max_items": 40})
+        narrow = RssTickerSource(
+            "Narrow", 10, {"url": "https://example.com/feed", "max_items": 30, "lines": 2}
+        )
+        await wide.start(pool)
+        await narrow.start(pool)
+        first, second = await asyncio.gather(wide.fetch(), narrow.fetch())
+
+    assert route.call_count == 1
+    assert first.value == "Item 0"
+    assert second.value == "Item 0\nItem 1"
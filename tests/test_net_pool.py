@@ -0,0 +1,67 @@
+import asyncio
+import logging
+
+import httpx
+import respx
+from httpx import Response
+
+from termdash.config import HttpConfig
+from termdash.net.pool import HostLimitedTransport, HttpPool
+from termdash.sources.open_meteo import OpenMeteoSource
+
+
+@respx.mock
+async def test_sources_share_started_pool():
+    respx.get("https://api.open-meteo.com/v1/forecast").mock(
+        return_value=Response(200, json={"current_weather": {"temperature": 10}})
+    )
+
+    async with HttpPool() as pool:
+        source = OpenMeteoSource("Weather", 300, {"latitude": 1, "longitude": 2})
+        await source.start(pool)
+        client = pool.client
+        await source.fetch()
+        await source.fetch()
+        assert pool.client is client
+        await source.stop()
+
+    assert source.pool is None
+    assert source.endpoints() == ["https://api.open-meteo.com/v1/forecast"]
+
+
+async def test_host_limited_transport_caps_in_flight():
+    active = 0
+    peak = 0
+
+    async def handler(request):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return Response(200, text="ok")
+
+    transport = HostLimitedTransport(httpx.MockTransport(handler), max_per_host=2)
+    async with httpx.AsyncClient(transport=transport) as client:
+        await asyncio.gather(*(client.get("https://example.com/") for _ in range(6)))
+
+    assert peak == 2
+
+
+@respx.mock
+async def test_warm_ignores_unreachable_hosts(caplog):
+    caplog.set_level(logging.DEBUG, logger="termdash.net.pool")
+    route = respx.head("https://example.com/").mock(return_value=Response(200))
+    respx.head("https://down.example.com/").mock(side_effect=httpx.ConnectError("down"))
+
+    async with HttpPool(HttpConfig(http2=True)) as pool:
+        await pool.warm(
+            [
+                "https://example.com/feed?a=1",
+                "https://example.com/other",
+                "https://down.example.com/rss",
+            ]
+        )
+
+    assert route.call_count == 1
+    assert "https://down.example.com" in caplog.text
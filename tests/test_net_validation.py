@@ -0,0 +1,70 @@
+import respx
+from httpx import Response
+
+from termdash.config import HttpConfig
+from termdash.net.pool import HttpPool
+from termdash.sources.rss import RssSource
+
+FEED = """
+<rss version="2.0">
+  <channel>
+    <item><title>Cached Item</title></item>
+  </channel>
+</rss>
+"""
+
+
+@respx.mock
+async def test_not_modified_reuses_parsed_feed():
+    route = respx.get("https://example.com/feed").mock(
+        side_effect=[
+            Response(200, text=FEED, headers={"ETag": '"v1"'}),
+            Response(304),
+        ]
+    )
+    parsed = []
+
+    def parse(content):
+        parsed.append(content)
+        return content.decode()
+
+    async with HttpPool(HttpConfig(coalesce_ttl=0)) as pool:
+        first = await pool.get_parsed("https://example.com/feed", parse)
+        second = await pool.get_parsed("https://example.com/feed", parse)
+        stats = pool.validation.stats
+
+    assert first == second
+    assert len(parsed) == 1
+    assert route.calls[1].request.headers["If-None-Match"] == '"v1"'
+    assert (stats.hits, stats.misses, stats.parses_saved) == (1, 1, 1)
+    assert stats.bytes_saved == len(FEED.encode())
+
+
+@respx.mock
+async def test_source_revalidates_with_last_modified():
+    stamp = "Wed, 21 Oct 2026 07:28:00 GMT"
+    route = respx.get("https://example.com/feed").mock(
+        side_effect=[
+            Response(200, text=FEED, headers={"Last-Modified": stamp}),
+            Response(304),
+        ]
+    )
+
+    async with HttpPool(HttpConfig(coalesce_ttl=0)) as pool:
+        source = RssSource("News", 300, {"url": "https://example.com/feed"})
+        await source.start(pool)
+        first = await source.fetch()
+        second = await source.fetch()
+
+    assert first.value == second.value == "Cached Item"
+    assert route.calls[1].request.headers["If-Modified-Since"] == stamp
+
+
+@respx.mock
+async def test_responses_without_validators_are_not_cached():
+    respx.get("https://example.com/feed").mock(return_value=Response(200, text=FEED))
+
+    async with HttpPool() as pool:
+        await pool.get_parsed("https://example.com/feed", bytes.decode)
+        assert len(pool.validation) == 0
+        assert pool.validation.stats.misses == 1
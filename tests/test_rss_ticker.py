@@ -1,3 +1,5 @@
+import asyncio
+
 import respx
 from httpx import Response
 
@@ -49,3 +51,161 @@ async def test_rss_ticker_filters_and_lines():
     data = await source.fetch()
 
     assert data.value == "Keep This (Fox News)\nKeep This (Fox News)"
+
+
+@respx.mock
+async def test_rss_ticker_rotates_without_refetching_feed(monkeypatch):
+    route = respx.get("https://example.com/feed").mock(
+        return_value=Response(200, text=_feed("A", "B", "C"))
+    )
+    clock = [1000.0]
+    monkeypatch.setattr("termdash.sources.rss_ticker.time.monotonic", lambda: clock[0])
+
+    source = RssTickerSource(
+        "Ticker", 10, {"url": "https://example.com/feed", "feed_refresh_seconds": 300}
+    )
+    values = [(await source.fetch()).value for _ in range(3)]
+    assert values == ["A", "B", "C"]
+    assert route.call_count == 1
+
+    clock[0] += 300
+    await source.fetch()
+    assert route.call_count == 2
+
+
+@respx.mock
+async def test_rss_ticker_new_only_hides_headlines_seen_before(tmp_path, monkeypatch):
+    respx.get("https://example.com/feed").mock(
+        side_effect=[
+            Response(200, text=_feed("Old", "Fresh")),
+            Response(200, text=_feed("Old", "Fresh", "Newer")),
+        ]
+    )
+    clock = [50_000.0]
+    monkeypatch.setattr("termdash.sources.rss_ticker.time.time", lambda: clock[0])
+    source = RssTickerSource(
+        "Ticker",
+        10,
+        {
+            "url": "https://example.com/feed",
+            "seen": "new_only",
+            "seen_db": str(tmp_path / "seen.sqlite3"),
+            "seen_new_seconds": 600,
+            "feed_refresh_seconds": 0,
+            "lines": 3,
+        },
+    )
+    source._seen_store().record(["old"], now=clock[0] - 3600)
+
+    first = await source.fetch()
+    clock[0] += 300
+    second = await source.fetch()
+
+    assert first.value.splitlines()[:1] == ["Fresh"]
+    assert "Old" not in first.value
+    assert set(second.value.splitlines()) == {"Fresh", "Newer"}
+
+
+@respx.mock
+async def test_rss_ticker_new_only_reaches_past_max_items(tmp_path, monkeypatch):
+    titles = [f"Item {n}" for n in range(10)]
+    respx.get("https://example.com/feed").mock(return_value=Response(200, text=_feed(*titles)))
+    clock = [50_000.0]
+    monkeypatch.setattr("termdash.sources.rss_ticker.time.time", lambda: clock[0])
+    source = RssTickerSource(
+        "Ticker",
+        10,
+        {
+            "url": "https://example.com/feed",
+            "seen": "new_only",
+            "seen_db": str(tmp_path / "seen.sqlite3"),
+            "seen_new_seconds": 600,
+            "max_items": 3,
+            "lines": 3,
+        },
+    )
+    source._seen_store().record(["item 0", "item 1", "item 2"], now=clock[0] - 3600)
+
+    data = await source.fetch()
+
+    assert data.status == "ok"
+    assert data.value.splitlines() == ["Item 3", "Item 4", "Item 5"]
+
+
+def _feed(*titles):
+    items = "".join(f"<item><title>{title}</title></item>" for title in titles)
+    return f'<rss version="2.0"><channel>{items}</channel></rss>'
+
+
+@respx.mock
+async def test_rss_ticker_tolerates_failing_feed():
+    respx.get("https://a.example.com/feed").mock(return_value=Response(200, text=_feed("A1")))
+    failing = respx.get("https://b.example.com/feed").mock(
+        side_effect=[Response(200, text=_feed("B1")), Response(500)]
+    )
+
+    source = RssTickerSource(
+        "Ticker",
+        10,
+        {
+            "urls": ["https://a.example.com/feed", "https://b.example.com/feed"],
+            "lines": 2,
+            "feed_refresh_seconds": 0,
+        },
+    )
+    first = await source.fetch()
+    second = await source.fetch()
+
+    assert failing.call_count == 2
+    assert first.status == "ok"
+    assert second.status == "warn"
+    assert set(second.value.splitlines()) == {"A1", "B1"}
+    assert "b.example.com" in second.detail
+    assert "showing last good" in second.detail
+
+
+@respx.mock
+async def test_rss_ticker_fetches_feeds_concurrently_with_deadline():
+    async def slow(request):
+        await asyncio.sleep(1)
+        return Response(200, text=_feed("Slow"))
+
+    respx.get("https://slow.example.com/feed").mock(side_effect=slow)
+    respx.get("https://fast.example.com/feed").mock(return_value=Response(200, text=_feed("Fast")))
+
+    source = RssTickerSource(
+        "Ticker",
+        10,
+        {
+            "urls": ["https://slow.example.com/feed", "https://fast.example.com/feed"],
+            "feed_timeout": 0.05,
+        },
+    )
+    data = await source.fetch()
+
+    assert data.value == "Fast"
+    assert "slow.example.com: timed out" in data.detail
+
+
+@respx.mock
+async def test_rss_ticker_keeps_restored_items_while_feeds_are_down(monkeypatch):
+    route = respx.get("https://example.com/feed").mock(return_value=Response(503))
+    clock = [1000.0]
+    monkeypatch.setattr("termdash.sources.rss_ticker.time.monotonic", lambda: clock[0])
+    source = RssTickerSource(
+        "Ticker", 10, {"url": "https://example.com/feed", "feed_refresh_seconds": 300}
+    )
+    source.restore_state({"items": [{"title": "A"}, {"title": "B"}], "index": 0})
+
+    first = await source.fetch()
+    second = await source.fetch()
+
+    assert (first.status, first.value, second.value) == ("warn", "A", "B")
+    assert "feeds unavailable" in first.detail
+    assert route.call_count == 1
+
+    clock[0] += 30
+    await source.fetch()
+    clock[0] += 30
+    await source.fetch()
+    assert route.call_count == 2
@@ -0,0 +1,100 @@
+import asyncio
+
+from termdash.config import SchedulerConfig
+from termdash.scheduler import Scheduler
+
+
+async def _run_for(scheduler, poll, seconds):
+    task = asyncio.create_task(scheduler.run(poll))
+    await asyncio.sleep(seconds)
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+
+
+async def test_scheduler_runs_keys_at_their_own_cadence():
+    runs = {"fast": 0, "slow": 0}
+
+    async def poll(key):
+        runs[key] += 1
+        return 0.02 if key == "fast" else 10
+
+    scheduler = Scheduler(SchedulerConfig(startup_spread_seconds=0, jitter=0))
+    scheduler.add("fast")
+    scheduler.add("slow")
+    await _run_for(scheduler, poll, 0.15)
+
+    assert runs["slow"] == 1
+    assert runs["fast"] >= 4
+
+
+async def test_scheduler_enforces_global_and_per_host_limits():
+    active = {"all": 0, "espn": 0}
+    peak = {"all": 0, "espn": 0}
+
+    async def poll(key):
+        hosts = ["all", "espn"] if key.startswith("espn") else ["all"]
+        for name in hosts:
+            active[name] += 1
+            peak[name] = max(peak[name], active[name])
+        await asyncio.sleep(0.02)
+        for name in hosts:
+            active[name] -= 1
+        return 60
+
+    scheduler = Scheduler(
+        SchedulerConfig(max_in_flight=3, max_per_host=1, startup_spread_seconds=0)
+    )
+    for i in range(4):
+        scheduler.add(f"espn-{i}", ["site.web.api.espn.com"])
+        scheduler.add(f"rss-{i}", [f"feed{i}.example.com"])
+    await _run_for(scheduler, poll, 0.2)
+
+    assert peak["all"] == 3
+    assert peak["espn"] == 1
+
+
+async def test_schedule_replaces_previous_due_time():
+    runs = []
+
+    async def poll(key):
+        runs.append(key)
+        return 60
+
+    scheduler = Scheduler(SchedulerConfig(startup_spread_seconds=0))
+    scheduler.add("a", delay=60)
+    scheduler.schedule("a", 0)
+    await _run_for(scheduler, poll, 0.05)
+
+    assert runs == ["a"]
+
+
+async def test_add_all_staggers_first_runs():
+    started = []
+    loop = asyncio.get_running_loop()
+
+    async def poll(key):
+        started.append(loop.time())
+        return 60
+
+    scheduler = Scheduler(SchedulerConfig(startup_spread_seconds=0.1))
+    scheduler.add_all([(f"s{i}", [], 60) for i in range(5)])
+    await _run_for(scheduler, poll, 0.2)
+
+    assert len(started) == 5
+    assert max(started) - min(started) >= 0.05
+
+
+async def test_failing_poll_is_retried_at_its_interval():
+    runs = []
+
+    async def poll(key):
+        runs.append(key)
+        if len(runs) == 1:
+            raise RuntimeError("plugin bug")
+        return 60
+
+    scheduler = Scheduler(SchedulerConfig(startup_spread_seconds=0, jitter=0))
+    scheduler.add("flaky", interval=0.02)
+    await _run_for(scheduler, poll, 0.1)
+
+    assert runs == ["flaky", "flaky"]
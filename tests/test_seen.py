@@ -0,0 +1,20 @@
+from termdash.seen import SeenStore
+
+
+def test_seen_store_keeps_first_seen_time(tmp_path):
+    store = SeenStore(tmp_path / "seen.sqlite3")
+
+    store.record(["a", "b"], now=100.0)
+    store.record(["b", "c"], now=200.0)
+
+    assert store.lookup(["a", "b", "c", "d"]) == {"a": 100.0, "b": 100.0, "c": 200.0}
+
+
+def test_seen_store_evicts_rows_past_ttl(tmp_path):
+    store = SeenStore(tmp_path / "seen.sqlite3", ttl_seconds=1000)
+
+    store.record(["old"], now=10_000.0)
+    store.record(["fresh"], now=20_000.0)
+
+    assert len(store) == 1
+    assert list(store.lookup(["old", "fresh"])) == ["fresh"]
@@ -0,0 +1,77 @@
+import os
+
+from termdash.config import DashboardConfig
+from termdash.dashboard import Dashboard
+from termdash.snapshot import Snapshot, SnapshotCache, should_persist
+from termdash.sources.base import DataPoint
+from termdash.sources.rss_ticker import RssTickerSource
+
+
+def _ticker():
+    return RssTickerSource("Ticker", 10, {"url": "https://example.com/feed"})
+
+
+def test_snapshot_round_trip_marks_stale(tmp_path):
+    cache = SnapshotCache(tmp_path)
+    source = _ticker()
+    source.restore_state({"items": [{"title": "A"}, {"title": "B"}], "index": 1})
+    data = DataPoint(title="Ticker", value="B")
+
+    cache.save(source, Snapshot(data=data, state=source.export_state()))
+    loaded = cache.load(_ticker())
+
+    assert loaded.data.value == "B"
+    assert loaded.data.stale
+    assert not should_persist(loaded.data)
+    assert loaded.state["index"] == 1
+    assert [item["title"] for item in loaded.state["items"]] == ["A", "B"]
+
+
+def test_corrupt_snapshot_is_ignored(tmp_path):
+    cache = SnapshotCache(tmp_path)
+    source = _ticker()
+    cache.path_for(source).write_text("{not json", encoding="utf-8")
+
+    assert cache.load(source) is None
+
+
+def test_dashboard_paints_restored_snapshot(tmp_path):
+    cache = SnapshotCache(tmp_path)
+    cache.save(_ticker(), Snapshot(data=DataPoint(title="Ticker", value="Cached headline")))
+    source = _ticker()
+    dashboard = Dashboard(DashboardConfig(), [source])
+
+    dashboard.engine._restore_snapshots(cache)
+    data = dashboard.store.get("Ticker")
+
+    assert data.value == "Cached headline"
+    assert data.stale
+    assert "(cached" in dashboard._render_tile(data, 40).title
+
+
+def test_save_uses_a_per_process_temp_file(tmp_path, monkeypatch):
+    cache = SnapshotCache(tmp_path)
+    source = _ticker()
+    replaced = []
+    monkeypatch.setattr("termdash.snapshot.os.replace", lambda src, dst: replaced.append(src.name))
+
+    cache.save(source, Snapshot(data=DataPoint(title="Ticker", value="A")))
+
+    assert replaced == [f".{cache.path_for(source).name}.{os.getpid()}.tmp"]
+
+
+def test_malformed_snapshots_are_skipped(tmp_path, caplog):
+    cache = SnapshotCache(tmp_path)
+    broken = _ticker()
+    cache.path_for(broken).write_text('{"data": "x"}', encoding="utf-8")
+    assert cache.load(broken) is None
+
+    state = {"items": [{"title": "A"}], "index": "first"}
+    cache.save(broken, Snapshot(data=DataPoint(title="Ticker", value="A"), state=state))
+    dashboard = Dashboard(DashboardConfig(), [broken])
+
+    dashboard.engine._restore_snapshots(cache)
+
+    assert dashboard.store.get("Ticker").status == "loading"
+    assert broken.export_state() is None
+    assert "ignoring cached snapshot for Ticker" in caplog.text
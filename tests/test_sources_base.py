@@ -1,4 +1,4 @@
-﻿from termdash.sources.base import DataPoint
+﻿from termdash.sources.base import DataPoint, Row
 
 
 def test_data_point_defaults():
@@ -6,3 +6,11 @@ def test_data_point_defaults():
     assert point.status == "ok"
     assert point.detail == ""
     assert point.updated_at is not None
+
+
+def test_data_point_rows_round_trip_and_join_into_value():
+    point = DataPoint.from_rows("Test", [Row("a", key="1", style="bold"), Row("b")])
+
+    assert point.value == "a\nb"
+    assert DataPoint.from_dict(point.to_dict()).rows == point.rows
+    assert DataPoint(title="Test", value="x\ny").lines() == (Row("x"), Row("y"))
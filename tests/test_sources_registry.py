@@ -0,0 +1,59 @@
+import subprocess
+import sys
+
+import pytest
+
+from termdash import sources
+from termdash.config import SourceConfig
+from termdash.sources.base import DataPoint, DataSource
+
+
+class PluginSource(DataSource):
+    async def fetch(self) -> DataPoint:
+        return DataPoint(title=self.name, value="plugin")
+
+
+class FakeEntryPoint:
+    name = "plugin"
+
+    def __init__(self):
+        self.loaded = 0
+
+    def load(self):
+        self.loaded += 1
+        return PluginSource
+
+
+def test_mcp_only_startup_skips_http_stack():
+    code = (
+        "import sys\n"
+        "from termdash.config import SourceConfig\n"
+        "from termdash.main import Dashboard, create_source\n"
+        "create_source(SourceConfig(name='m', type='mcp'))\n"
+        "print(sorted(m for m in ('httpx', 'feedparser') if m in sys.modules))\n"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True
+    ).stdout
+
+    assert output.strip() == "[]"
+
+
+def test_entry_point_sources_load_on_first_use(monkeypatch):
+    entry_point = FakeEntryPoint()
+    monkeypatch.setattr(sources, "plugin_entry_points", lambda: {"plugin": entry_point})
+    monkeypatch.setattr(sources, "SOURCE_REGISTRY", dict(sources.SOURCE_REGISTRY))
+
+    assert "plugin" in sources.available_source_types()
+    assert entry_point.loaded == 0
+
+    source = sources.create_source(SourceConfig(name="P", type="plugin"))
+    sources.create_source(SourceConfig(name="P2", type="plugin"))
+
+    assert isinstance(source, PluginSource)
+    assert entry_point.loaded == 1
+
+
+def test_unknown_source_type_raises():
+    with pytest.raises(ValueError):
+        sources.create_source(SourceConfig(name="X", type="nope"))
@@ -0,0 +1,35 @@
+import asyncio
+
+from termdash.sources.base import DataPoint
+from termdash.state import StateStore
+
+
+def test_publish_is_copy_on_write():
+    store = StateStore([("a", DataPoint(title="A", value="1"))])
+    before = store.snapshot()
+
+    assert store.publish("a", DataPoint(title="A", value="2"))
+
+    assert before["a"].value == "1"
+    assert store.snapshot()["a"].value == "2"
+    assert store.version == 1
+
+
+def test_unchanged_content_does_not_bump_version():
+    store = StateStore([("a", DataPoint(title="A", value="1"))])
+
+    assert not store.publish("a", DataPoint(title="A", value="1"))
+    assert store.version == 0
+
+
+async def test_wait_wakes_on_publish():
+    store = StateStore()
+
+    async def publish_later():
+        await asyncio.sleep(0.01)
+        store.publish("a", DataPoint(title="A", value="1"))
+
+    task = asyncio.create_task(publish_later())
+    assert await store.wait(0, timeout=1)
+    await task
+    assert not await store.wait(store.version, timeout=0.01)
@@ -0,0 +1,23 @@
+from termdash.metrics import Metrics
+from termdash.sources.stats import StatsSource
+
+
+async def test_stats_tile_lists_sources_frames_and_hosts():
+    metrics = Metrics()
+    metrics.record_fetch("Weather", 0.2)
+    metrics.record_fetch("Weather", 0.7, error=True)
+    metrics.record_lateness("Weather", 0.02)
+    metrics.record_frame(0.004)
+    metrics.record_response("api.open-meteo.com", 3072)
+    metrics.record_parse("api.open-meteo.com", 0.0008)
+    source = StatsSource("Stats", 10, {})
+    source.metrics = metrics
+
+    data = await source.fetch()
+
+    assert data.value.splitlines() == [
+        "Weather: p50 250ms p95 1s late 50ms err 1/2",
+        "frame: p50 5ms p95 5ms (1 frames)",
+        "api.open-meteo.com: 3.0KiB in 1 responses, parse p95 1ms",
+    ]
+    assert data.rows[0].style == "yellow"